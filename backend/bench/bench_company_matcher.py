@@ -0,0 +1,98 @@
+"""
+기업명 매칭 마이크로 벤치마크: 기존 선형 탐색 vs 섹터별 매칭기
+
+    python -m backend.bench.bench_company_matcher [--names 3000,30000] [--articles 2000]
+
+섹터당 기본 사전(10개 내외)과, 합성 종목명을 섞어 늘린 사전(--names 개씩 추가)에서
+기사 1건당 매칭 비용을 비교한다. 매칭기는 기본 설정(섹터 패턴 수에 따라 부분 문자열 검사/오토마톤 자동 선택)과
+모든 섹터를 오토마톤으로 강제한 경우를 함께 측정 → company_matcher 의 기준값 조정용. 외부 API 호출 없음.
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from backend.services.aho_corasick import native_available
+from backend.services.company_matcher import CompanyMatcher
+from backend.services.news_collector import COMPANY_DICT, US_COMPANY_DICT
+
+_SYLLABLES = "가나다라마바사아자차카타파하강남동서북산전화성진한국대신미래에셋"
+
+
+def _linear_extract(text: str, companies: List[str], max_count: int = 5) -> List[str]:
+    """기존 _extract_companies 구현 (섹터 사전 순회 + 부분 문자열 검사)"""
+    matched = []
+    for company in companies:
+        if company in text:
+            matched.append(company)
+    return matched[:max_count]
+
+
+def _synthetic_dict(base: Dict[str, List[str]], total_names: int, rng: random.Random) -> Dict[str, List[str]]:
+    sectors = list(base)
+    grown = {sid: list(names) for sid, names in base.items()}
+    for i in range(total_names):
+        name = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 5))) + str(i % 97)
+        grown[sectors[i % len(sectors)]].append(name)
+    return grown
+
+
+def _articles(sector_dict: Dict[str, List[str]], count: int, rng: random.Random) -> List[tuple]:
+    sectors = list(sector_dict)
+    filler = "시장 전망 실적 발표 투자자 관심 주가 상승 하락 거래량 외국인 기관 매수"
+    articles = []
+    for _ in range(count):
+        sid = rng.choice(sectors)
+        names = rng.sample(sector_dict[sid], k=min(2, len(sector_dict[sid])))
+        title = f"{names[0]} {filler[:20]}"
+        desc = f"{filler} {names[-1]} {filler} " * 3
+        articles.append((sid, title, desc))
+    return articles
+
+
+def _per_article_us(fn, articles: List[tuple]) -> float:
+    started = time.perf_counter()
+    for sid, title, desc in articles:
+        fn(sid, title, desc)
+    return (time.perf_counter() - started) / len(articles) * 1e6
+
+
+def _bench(label: str, sector_dict: Dict[str, List[str]], articles: List[tuple]) -> None:
+    names = sum(len(v) for v in sector_dict.values())
+    per_sector = names / len(sector_dict)
+    print(f"[{label}] names={names} (섹터당 {per_sector:.0f}), articles={len(articles)}")
+
+    linear_us = _per_article_us(
+        lambda sid, title, desc: _linear_extract(title + " " + desc, sector_dict[sid]), articles
+    )
+    print(f"  {'linear scan':<32} {linear_us:8.1f} us/article")
+
+    backends = [True, False] if native_available() else [False]
+    for use_native in backends:
+        for mode, automaton_min in (("auto", None), ("automaton", 0)):
+            started = time.perf_counter()
+            matcher = CompanyMatcher(sector_dict, use_native=use_native, automaton_min=automaton_min)
+            build_ms = (time.perf_counter() - started) * 1000
+            us = _per_article_us(lambda sid, title, desc: matcher.match(title, desc, sid), articles)
+            impl = "pyahocorasick" if use_native else "python"
+            print(f"  {f'matcher/{impl}/{mode}':<32} {us:8.1f} us/article  "
+                  f"(x{linear_us / us:.1f}, build {build_ms:.1f} ms, {matcher.backend})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--names", default="3000,30000", help="추가할 합성 기업명 수 (쉼표로 여러 값)")
+    parser.add_argument("--articles", type=int, default=2000, help="기사 수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    base = {**COMPANY_DICT, **US_COMPANY_DICT}
+    _bench("current", base, _articles(base, args.articles, rng))
+    for count in (int(n) for n in args.names.split(",") if n):
+        grown = _synthetic_dict(base, count, rng)
+        _bench(f"grown +{count}", grown, _articles(grown, args.articles, rng))
+
+
+if __name__ == "__main__":
+    main()
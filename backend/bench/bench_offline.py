@@ -0,0 +1,201 @@
+"""
+오프라인 엔드투엔드 벤치마크: 로컬 스텁(bench/stubs.py)을 업스트림으로 두고 라우트/수집 함수 측정
+
+    python -m backend.bench.bench_offline [--requests 200] [--concurrency 20] [--cold-burst 1] [--no-llm]
+                                          [--naver-latency-ms 80] [--rss-latency-ms 150] [--llm-latency-ms 600]
+                                          [--error-rate 0.0] [--only heatmap]
+
+시나리오마다 캐시(파일/L1/스냅샷/윈도우/분석 캐시)를 비운 임시 CACHE_DIR 에서 시작해
+- cold: 빈 캐시에 --cold-burst 개 요청을 동시에 보낸 지연과 업스트림 호출 수
+- warm: 이어서 --requests 개 요청을 동시성 --concurrency 로 보낸 p50/p95/p99, 처리량, 업스트림 호출 수
+를 출력한다. 라우트는 httpx ASGITransport 로 앱을 직접 호출하므로 서버를 띄울 필요가 없다.
+실제 네이버/OpenAI 자격 증명이나 네트워크가 필요 없다.
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from backend.bench.stubs import StubServer, add_stub_arguments, config_from_args
+
+# (이름, 종류, 대상) — route: GET 경로, sync: 이벤트 루프 밖에서 호출하는 수집 함수 이름
+SCENARIOS = [
+    ("heatmap KR",            "route", "/news/heatmap?market=KR"),
+    ("heatmap US",            "route", "/news/heatmap?market=US"),
+    ("sector IT_1",           "route", "/news/sector/IT_1"),
+    ("sector IT_1 p2",        "route", "/news/sector/IT_1?page=2"),
+    ("sector US_IT_1",        "route", "/news/sector/US_IT_1"),
+    ("build_heatmap_response", "sync", "build_heatmap_response"),
+    ("fetch_sector_news",     "sync", "fetch_sector_news"),
+]
+
+
+def _configure_env(stubs: StubServer, use_llm: bool) -> None:
+    """백엔드 모듈 import 전에 호출 (업스트림 주소/키는 import 시점에 읽힘)"""
+    os.environ.update(stubs.env())
+    os.environ["NAVER_CLIENT_ID"] = "bench"
+    os.environ["NAVER_CLIENT_SECRET"] = "bench"
+    os.environ["REFRESH_SCHEDULER_ENABLED"] = "0"
+    os.environ["CACHE_GC_ENABLED"] = "0"
+    os.environ["NO_PROXY"] = ",".join(filter(None, [os.environ.get("NO_PROXY"), "127.0.0.1", "localhost"]))
+    if use_llm:
+        os.environ["OPENAI_API_KEY"] = "bench"
+    else:
+        os.environ.pop("OPENAI_API_KEY", None)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _upstream_delta(before: Dict[str, dict], after: Dict[str, dict]) -> str:
+    parts = []
+    for name, counts in after.items():
+        calls = counts["calls"] - before[name]["calls"]
+        errors = counts["errors"] - before[name]["errors"]
+        parts.append(f"{name}={calls}" + (f"(err {errors})" if errors else ""))
+    return " ".join(parts)
+
+
+class _Runner:
+    def __init__(self, stubs: StubServer, args: argparse.Namespace) -> None:
+        # 환경변수 설정 이후에 import 해야 스텁 주소가 반영된다
+        import httpx
+        from backend import main as app_module
+        from backend.services import analysis_cache, cache_manager, heatmap_service, news_collector
+        from backend.services.heatmap_snapshot import clear_snapshots
+        from backend.services.sector_window import clear_windows
+
+        self.httpx = httpx
+        self.app = app_module.app
+        self.cache_manager = cache_manager
+        self.analysis_cache = analysis_cache
+        self.clear_snapshots = clear_snapshots
+        self.clear_windows = clear_windows
+        self.sync_targets: Dict[str, Callable[[], object]] = {
+            "build_heatmap_response": lambda: heatmap_service.build_heatmap_response("KR"),
+            "fetch_sector_news": lambda: news_collector.fetch_sector_news("IT_1", 10),
+        }
+        self.stubs = stubs
+        self.args = args
+        self._cache_dirs: List[str] = []
+
+    def reset_state(self) -> None:
+        """빈 캐시에서 시작하도록 임시 CACHE_DIR 로 교체하고 메모리 캐시 비우기"""
+        cache_dir = tempfile.mkdtemp(prefix="news_moa_bench_")
+        self._cache_dirs.append(cache_dir)
+        self.cache_manager.CACHE_DIR = cache_dir
+        self.cache_manager._l1.clear()
+        self.clear_snapshots()
+        self.clear_windows()
+        with self.analysis_cache._lock:
+            self.analysis_cache._entries.clear()
+            self.analysis_cache._loaded = False
+
+    def cleanup(self) -> None:
+        for cache_dir in self._cache_dirs:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    async def _route_batch(self, client, path: str, count: int, concurrency: int) -> tuple:
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies: List[float] = []
+        failures = 0
+
+        async def one() -> None:
+            nonlocal failures
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(path, headers={"Accept-Encoding": "gzip"})
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    failures += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(count)))
+        return latencies, failures, time.perf_counter() - started
+
+    def _sync_batch(self, fn: Callable[[], object], count: int, concurrency: int) -> tuple:
+        def one() -> tuple:
+            started = time.perf_counter()
+            try:
+                ok = fn() is not None
+            except Exception:
+                ok = False
+            return time.perf_counter() - started, ok
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = list(executor.map(lambda _: one(), range(count)))
+        elapsed = time.perf_counter() - started
+        return [lat for lat, _ in outcomes], sum(1 for _, ok in outcomes if not ok), elapsed
+
+    async def run(self, label: str, kind: str, target: str) -> None:
+        self.reset_state()
+        transport = self.httpx.ASGITransport(app=self.app)
+        async with self.httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for phase, count, concurrency in (
+                ("cold", self.args.cold_burst, self.args.cold_burst),
+                ("warm", self.args.requests, self.args.concurrency),
+            ):
+                before = self.stubs.counts()
+                if kind == "route":
+                    latencies, failures, elapsed = await self._route_batch(client, target, count, concurrency)
+                else:
+                    latencies, failures, elapsed = await asyncio.to_thread(
+                        self._sync_batch, self.sync_targets[target], count, concurrency
+                    )
+                upstream = _upstream_delta(before, self.stubs.counts())
+                print(
+                    f"  {label:<24} {phase:<4} {count:5d} "
+                    f"{_percentile(latencies, 50) * 1000:9.1f} {_percentile(latencies, 95) * 1000:9.1f} "
+                    f"{_percentile(latencies, 99) * 1000:9.1f} {count / elapsed:9.1f} {failures:5d}  {upstream}"
+                )
+
+
+async def _run_all(runner: _Runner, scenarios: list) -> None:
+    print(f"  {'scenario':<24} {'phase':<4} {'reqs':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'req/s':>9} {'fail':>5}  upstream calls")
+    for label, kind, target in scenarios:
+        await runner.run(label, kind, target)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="warm 단계 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="warm 단계 동시 요청 수")
+    parser.add_argument("--cold-burst", type=int, default=1, help="빈 캐시에 동시에 보낼 요청 수 (중복 호출 합치기 확인용)")
+    parser.add_argument("--no-llm", action="store_true", help="OPENAI_API_KEY 없이 실행 (AI 분석 생략 경로)")
+    parser.add_argument("--only", default=None, help="이 문자열을 포함하는 시나리오만 실행")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    scenarios = [s for s in SCENARIOS if not args.only or args.only in s[0]]
+    stubs = StubServer(config_from_args(args)).start()
+    _configure_env(stubs, use_llm=not args.no_llm)
+    runner: Optional[_Runner] = None
+    try:
+        runner = _Runner(stubs, args)
+        print(
+            f"stubs={stubs.base_url} llm={'off' if args.no_llm else 'stub'} "
+            f"latency(ms) naver={args.naver_latency_ms:g} rss={args.rss_latency_ms:g} llm={args.llm_latency_ms:g} "
+            f"error_rate={args.error_rate:g}"
+        )
+        asyncio.run(_run_all(runner, scenarios))
+        print(f"  total upstream calls: {stubs.counts()}")
+    finally:
+        if runner is not None:
+            runner.cleanup()
+        stubs.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+캐시/응답 직렬화 벤치마크: 기존 json.dump(indent=2) + FastAPI 응답 직렬화 vs serializer
+
+    python -m backend.bench.bench_serializer [--rounds 500]
+
+합성 섹터 결과(기사 10건)를 기준으로 캐시 파일 쓰기/읽기 비용, 파일 크기,
+응답 본문 생성 비용(캐시된 객체 재사용 포함)과 gzip 압축률을 비교한다. 외부 API 호출 없음.
+"""
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+
+from backend.models.news_schema import NewsItem, SectorNewsResult
+from backend.services import serializer
+
+_RESULT = SectorNewsResult(
+    sector_id="IT_1",
+    sector_name="반도체",
+    category_id="IT",
+    category_name="IT·전자",
+    articles=[
+        NewsItem(
+            title=f"반도체 업황 \"바닥 통과\"… 삼성전자·SK하이닉스 {i}% 상승",
+            link=f"https://n.news.naver.com/article/{i}",
+            description="HBM 수요 증가로 반도체 주가가 이틀째 강세다. 외국인 & 기관 동반 순매수가 이어지며 ...",
+            pubDate="Mon, 01 Jan 2024 10:00:00 +0900",
+            source="naver",
+            original_link=f"https://example.com/news/{i}",
+            related_companies=["삼성전자", "SK하이닉스"],
+            ai_classification_reason="메모리 반도체 업황 기사",
+            summary="HBM 수요 증가로 메모리 업체 주가가 상승했다.",
+        )
+        for i in range(10)
+    ],
+    news_volume=1234.0,
+    change_rate=2.5,
+    cached_at="2024-01-01 10:00:00",
+    sector_briefing="HBM 수요가 메모리 업황 회복을 이끄는 중",
+    rising_keywords=["HBM", "삼성전자"],
+)
+
+
+def _per_op_us(fn: Callable[[], object], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=500, help="항목별 반복 횟수")
+    args = parser.parse_args()
+
+    legacy_file = json.dumps(
+        {"saved_at": 1.0, "data": _RESULT.model_dump()}, ensure_ascii=False, indent=2
+    ).encode("utf-8")
+    compact_file = b'{"saved_at":1.0,"data":' + serializer.dumps(_RESULT) + b"}"
+    assert json.loads(legacy_file) == serializer.loads(compact_file)
+    body = serializer.encoded_body(_RESULT)
+    gz, _ = body.negotiate("gzip")
+    print(f"backend={serializer.BACKEND}, rounds={args.rounds}")
+    print(f"  cache file  legacy {len(legacy_file):6d} B  compact {len(compact_file):6d} B "
+          f"({len(compact_file) / len(legacy_file):.0%})  response gzip {len(gz):6d} B")
+
+    rows = [
+        ("cache write (legacy)", lambda: json.dumps(
+            {"saved_at": 1.0, "data": _RESULT.model_dump()}, ensure_ascii=False, indent=2
+        ).encode("utf-8")),
+        ("cache write (serializer)", lambda: b'{"saved_at":1.0,"data":' + serializer.dumps(_RESULT) + b"}"),
+        ("cache read (legacy)", lambda: SectorNewsResult(**json.loads(legacy_file)["data"])),
+        ("cache read (serializer)", lambda: SectorNewsResult.model_validate(serializer.loads(compact_file)["data"])),
+        ("response (jsonable_encoder)", lambda: json.dumps(
+            jsonable_encoder(SectorNewsResult.model_validate(_RESULT.model_dump())), ensure_ascii=False
+        ).encode("utf-8")),
+        ("response (encoded, cached)", lambda: serializer.encoded_body(_RESULT).negotiate("gzip")),
+    ]
+    for label, fn in rows:
+        print(f"  {label:<30} {_per_op_us(fn, args.rounds):9.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
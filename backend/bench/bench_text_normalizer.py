@@ -0,0 +1,94 @@
+"""
+텍스트 정규화 벤치마크: 기존 _strip_html / _filter_fake_companies vs text_normalizer
+
+    python -m backend.bench.bench_text_normalizer [--pages 2000]
+
+네이버 검색 결과 형태(<b> 강조 + HTML 엔티티)의 합성 기사 한 페이지(10건)를 기준으로
+기사 1건당 비용을 비교한다. 외부 API 호출 없음.
+"""
+
+import argparse
+import re
+import time
+from typing import Callable, List
+
+from backend.services.text_normalizer import filter_fake_companies, normalize_items, strip_html
+
+_PAGE = [
+    {
+        "title": f"<b>반도체</b> 업황 &quot;바닥 통과&quot;… 삼성전자·SK하이닉스 {i}% 상승",
+        "description": (
+            f"HBM 수요 증가로 <b>반도체 주가</b>가 이틀째 강세다. 외국인 &amp; 기관 동반 순매수가 "
+            f"이어지며 코스피 전기전자 업종 지수는 {i}.3% 올랐다. &lt;시장 전망&gt; 증권가에서는 ..."
+        ),
+    }
+    for i in range(10)
+]
+_COMPANIES = ["삼성전자", "A기업", "SK하이닉스", "OO전자", "모 기업", "Company A", "LG에너지솔루션", "B사"]
+
+
+def _legacy_strip_html(text: str) -> str:
+    """기존 구현: 호출마다 import + 정규식 컴파일"""
+    import html
+    clean = re.compile('<.*?>')
+    text = re.sub(clean, '', text)
+    return html.unescape(text)
+
+
+def _legacy_filter_fake_companies(companies: List[str]) -> List[str]:
+    """기존 구현: 호출마다 패턴 목록 생성 + 패턴별 re.match"""
+    fake_patterns = [
+        r'^[A-Za-zㄱ-ㅎ가-힣]기업$', r'^[A-Za-zㄱ-ㅎ가-힣]사$', r'^[A-Za-zㄱ-ㅎ가-힣]그룹$',
+        r'^[A-Za-zㄱ-ㅎ가-힣]회사$', r'^[A-Za-zㄱ-ㅎ가-힣]업체$', r'^[A-Za-zㄱ-ㅎ가-힣]은행$',
+        r'^[A-Za-zㄱ-ㅎ가-힣]증권$', r'^[OoXx○●]{2}.+$', r'^○○.+$',
+        r'^(모|해당|특정|일부|모\s)\s?(기업|회사|업체|그룹|증권|은행)$', r'^某.+$',
+        r'^[A-Za-zㄱ-ㅎ가-힣]$', r'^(Company|Firm|Corp)\s+[A-Z]$',
+    ]
+    filtered = []
+    for company in companies:
+        name = company.strip()
+        if not name:
+            continue
+        if not any(re.match(p, name) for p in fake_patterns):
+            filtered.append(name)
+    return filtered
+
+
+def _per_article_us(fn: Callable[[], object], pages: int, per_page: int) -> float:
+    started = time.perf_counter()
+    for _ in range(pages):
+        fn()
+    return (time.perf_counter() - started) / (pages * per_page) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=2000, help="반복할 페이지 수 (페이지당 기사 10건)")
+    args = parser.parse_args()
+    n = len(_PAGE)
+
+    # 결과 동일성 확인
+    assert [
+        {"title": _legacy_strip_html(i["title"]), "description": _legacy_strip_html(i["description"])}
+        for i in _PAGE
+    ] == normalize_items(_PAGE)
+    assert _legacy_filter_fake_companies(_COMPANIES) == filter_fake_companies(_COMPANIES)
+    print(f"결과 동일 확인 완료, pages={args.pages}, articles/page={n}")
+
+    rows = [
+        ("strip_html (legacy)", lambda: [
+            (_legacy_strip_html(i["title"]), _legacy_strip_html(i["description"])) for i in _PAGE
+        ]),
+        ("strip_html (precompiled)", lambda: [
+            (strip_html(i["title"]), strip_html(i["description"])) for i in _PAGE
+        ]),
+        ("normalize_items (batch)", lambda: normalize_items(_PAGE)),
+        ("fake filter (legacy)", lambda: [_legacy_filter_fake_companies(_COMPANIES) for _ in _PAGE]),
+        ("fake filter (alternation)", lambda: [filter_fake_companies(_COMPANIES) for _ in _PAGE]),
+    ]
+    for label, fn in rows:
+        print(f"  {label:<28} {_per_article_us(fn, args.pages, n):8.2f} us/article")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+벤치마크용 로컬 업스트림 스텁: 네이버 검색 API / Google News RSS / OpenAI chat completions
+
+    python -m backend.bench.stubs [--port 8901] [--naver-latency-ms 80] [--error-rate 0.05]
+
+- 응답은 bench/fixtures 의 기록된 응답 템플릿으로 만들고 {keyword}, {n}, {pubDate} 만 채운다
+- 업스트림별 지연(기본값 + 지터)과 오류율(지정한 HTTP 상태 코드로 응답)을 설정할 수 있음
+- 경로별 호출 수를 집계 (GET /__stats 또는 StubServer.counts())
+- 서버 주소를 환경변수로 넘기면 백엔드가 실제 API 대신 스텁을 호출한다
+    NAVER_NEWS_URL=http://127.0.0.1:8901/v1/search/news.json
+    GOOGLE_NEWS_RSS_URL=http://127.0.0.1:8901/rss/search
+    OPENAI_BASE_URL=http://127.0.0.1:8901/v1  (OPENAI_API_KEY 는 아무 값)
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+NAVER_PATH = "/v1/search/news.json"
+RSS_PATH   = "/rss/search"
+LLM_PATH   = "/v1/chat/completions"
+UPSTREAMS  = {NAVER_PATH: "naver", RSS_PATH: "rss", LLM_PATH: "llm"}
+
+# 모든 기사 시각의 기준. 고정 값이라 실행마다 같은 커서/정렬 결과가 나온다.
+BASE_TIME          = datetime(2024, 1, 1, 10, 0, tzinfo=timezone(timedelta(hours=9)))
+ARTICLE_INTERVAL   = timedelta(minutes=3)   # 검색 결과 n 번째 기사는 BASE_TIME - n*간격
+NAVER_TOTAL        = 1000
+RSS_ITEMS          = 100
+
+_COUNT_PATTERNS = (re.compile(r"정확히\s*(\d+)\s*개"), re.compile(r"exactly\s+(\d+)"))
+
+
+@dataclass
+class UpstreamProfile:
+    """업스트림 하나의 지연/오류 설정"""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+
+    def delay(self, rng: random.Random) -> float:
+        jitter = rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def fails(self, rng: random.Random) -> bool:
+        return self.error_rate > 0 and rng.random() < self.error_rate
+
+
+@dataclass
+class StubConfig:
+    naver: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(80, 20))
+    rss: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(150, 40))
+    llm: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(600, 150))
+    seed: int = 0
+
+
+def _load_fixtures() -> tuple:
+    """(네이버 응답 템플릿, RSS 머리말, RSS <item> 템플릿 목록, RSS 꼬리말)"""
+    naver = json.loads((FIXTURE_DIR / "naver_news.json").read_text(encoding="utf-8"))
+    rss = (FIXTURE_DIR / "google_news_rss.xml").read_text(encoding="utf-8")
+    items = re.findall(r"<item>.*?</item>", rss, flags=re.S)
+    head = rss[:rss.index("<item>")]
+    tail = rss[rss.rindex("</item>") + len("</item>"):]
+    return naver, head, items, tail
+
+
+def _pub_time(n: int) -> datetime:
+    return BASE_TIME - ARTICLE_INTERVAL * n
+
+
+def _fill(template: str, **values) -> str:
+    # 템플릿의 다른 중괄호(JSON 예시 등)는 건드리지 않도록 지정한 자리표시자만 치환
+    def replace(match: re.Match) -> str:
+        name, spec = match.group(1), match.group(2) or ""
+        return format(values[name], spec) if name in values else match.group(0)
+    return re.sub(r"\{(\w+)(?::([^}]*))?\}", replace, template)
+
+
+class _Fixtures:
+    def __init__(self) -> None:
+        self.naver, self.rss_head, self.rss_items, self.rss_tail = _load_fixtures()
+
+    def naver_body(self, keyword: str, display: int, start: int) -> bytes:
+        templates = self.naver["items"]
+        items = []
+        for n in range(start, min(start + display, NAVER_TOTAL + 1)):
+            template = templates[(n - 1) % len(templates)]
+            pub_date = format_datetime(_pub_time(n))
+            items.append({
+                key: _fill(value, keyword=keyword, n=n, pubDate=pub_date)
+                for key, value in template.items()
+            })
+        body = {
+            "lastBuildDate": format_datetime(BASE_TIME),
+            "total": NAVER_TOTAL,
+            "start": start,
+            "display": len(items),
+            "items": items,
+        }
+        return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    def rss_body(self, keyword: str) -> bytes:
+        safe_keyword = escape(keyword)
+        parts = [_fill(self.rss_head, keyword=safe_keyword)]
+        for n in range(1, RSS_ITEMS + 1):
+            template = self.rss_items[(n - 1) % len(self.rss_items)]
+            pub_date = format_datetime(_pub_time(n).astimezone(timezone.utc), usegmt=True)
+            parts.append(_fill(template, keyword=safe_keyword, n=n, pubDate=pub_date))
+        parts.append(self.rss_tail)
+        return "\n".join(parts).encode("utf-8")
+
+
+def _chat_completion_body(request: dict) -> bytes:
+    """요청 프롬프트 형태에 맞춘 가짜 응답 (JSON 분석 요청이면 기사 수만큼 results 생성)"""
+    messages = request.get("messages") or []
+    prompt = str(messages[-1].get("content", "")) if messages else ""
+    wants_json = (request.get("response_format") or {}).get("type") == "json_object"
+
+    if wants_json:
+        count = 0
+        for pattern in _COUNT_PATTERNS:
+            match = pattern.search(prompt)
+            if match:
+                count = int(match.group(1))
+                break
+        results = [
+            {
+                "is_relevant": i % 5 != 4,
+                "companies": [],
+                "reason": "벤치마크 스텁 분류",
+                "summary": f"벤치마크용 요약 문장 {i + 1}번입니다.",
+            }
+            for i in range(count)
+        ]
+        content = json.dumps({"results": results}, ensure_ascii=False)
+    else:
+        content = "벤치마크 스텁 브리핑: 섹터 전반에 혼조세가 이어졌다."
+
+    body = {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.get("model", "gpt-4o-mini"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                  "total_tokens": (len(prompt) + len(content)) // 4},
+    }
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "StubServer"
+    protocol_version = "HTTP/1.1"   # keep-alive (백엔드 커넥션 풀 동작을 실제와 맞춤)
+
+    def log_message(self, format: str, *args) -> None:   # 요청마다 stderr 출력 방지
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _upstream(self, path: str) -> Optional[str]:
+        name = UPSTREAMS.get(path)
+        if name is None:
+            self._send(404, b'{"error":"not found"}', "application/json")
+            return None
+        profile = self.server.profile(name)
+        time.sleep(profile.delay(self.server.rng))
+        failed = profile.fails(self.server.rng)
+        self.server.count(name, failed)
+        if failed:
+            self._send(profile.error_status, b'{"error":"injected"}', "application/json")
+            return None
+        return name
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == "/__stats":
+            self._send(200, json.dumps(self.server.counts()).encode(), "application/json")
+            return
+        if self._upstream(url.path) is None:
+            return
+        query = parse_qs(url.query)
+        keyword = (query.get("query") or query.get("q") or [""])[0]
+        if url.path == NAVER_PATH:
+            display = int((query.get("display") or ["10"])[0])
+            start = int((query.get("start") or ["1"])[0])
+            body = self.server.fixtures.naver_body(keyword, display, start)
+            self._send(200, body, "application/json; charset=utf-8")
+        else:
+            self._send(200, self.server.fixtures.rss_body(keyword), "application/rss+xml; charset=utf-8")
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if url.path != LLM_PATH:
+            self._send(404, b'{"error":"not found"}', "application/json")
+            return
+        if self._upstream(url.path) is None:
+            return
+        try:
+            request = json.loads(raw or b"{}")
+        except ValueError:
+            self._send(400, b'{"error":"invalid json"}', "application/json")
+            return
+        self._send(200, _chat_completion_body(request), "application/json")
+
+
+class StubServer(ThreadingHTTPServer):
+    """세 업스트림을 한 포트에서 흉내 내는 HTTP 서버 (port=0 이면 빈 포트 자동 선택)"""
+
+    daemon_threads = True
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), _Handler)
+        self.config = config or StubConfig()
+        self.fixtures = _Fixtures()
+        self.rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> Dict[str, str]:
+        """백엔드가 스텁을 바라보게 하는 환경변수"""
+        return {
+            "NAVER_NEWS_URL": self.base_url + NAVER_PATH,
+            "GOOGLE_NEWS_RSS_URL": self.base_url + RSS_PATH,
+            "OPENAI_BASE_URL": self.base_url + "/v1",
+        }
+
+    def profile(self, name: str) -> UpstreamProfile:
+        return getattr(self.config, name)
+
+    def count(self, name: str, failed: bool) -> None:
+        with self._lock:
+            entry = self._counts.setdefault(name, {"calls": 0, "errors": 0})
+            entry["calls"] += 1
+            entry["errors"] += int(failed)
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                name: dict(self._counts.get(name, {"calls": 0, "errors": 0}))
+                for name in UPSTREAMS.values()
+            }
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="bench-stubs", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser) -> None:
+    """스텁 지연/오류 옵션 (bench_offline 과 공용)"""
+    defaults = StubConfig()
+    for name in ("naver", "rss", "llm"):
+        profile = getattr(defaults, name)
+        parser.add_argument(f"--{name}-latency-ms", type=float, default=profile.latency_ms)
+    parser.add_argument("--jitter", type=float, default=0.25, help="지연 대비 지터 비율 (0.25 = ±25%%)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="모든 업스트림의 오류 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def config_from_args(args: argparse.Namespace) -> StubConfig:
+    def profile(latency_ms: float) -> UpstreamProfile:
+        return UpstreamProfile(latency_ms, latency_ms * args.jitter, args.error_rate, args.error_status)
+    return StubConfig(
+        naver=profile(args.naver_latency_ms),
+        rss=profile(args.rss_latency_ms),
+        llm=profile(args.llm_latency_ms),
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8901)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    server = StubServer(config_from_args(args), args.host, args.port)
+    print(f"[Stubs] {server.base_url} 에서 대기 중 (Ctrl+C 로 종료)")
+    for name, value in server.env().items():
+        print(f"  {name}={value}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"[Stubs] 호출 수: {server.counts()}")
+
+
+if __name__ == "__main__":
+    main()
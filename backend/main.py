@@ -3,10 +3,11 @@ News Moa FastAPI 백엔드
 네이버 뉴스 API 기반 섹터별 히트맵 데이터 제공
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
-from typing import List
+from typing import List, Optional
 from pathlib import Path
 import os
 import requests
@@ -21,28 +22,78 @@ from backend.models.news_schema import (
     HeatmapResponse,
 )
 from backend.services.news_collector import (
-    fetch_sector_news,
-    fetch_all_sectors,
     fetch_naver_news,
+    NAVER_NEWS_URL,
     SECTOR_META,
-    fetch_us_sector_news,
-    fetch_all_us_sectors,
+    fetch_sector_news_async,
+    fetch_us_sector_news_async,
+    fetch_sector_news_by_cursor_async,
+    invalidate_sector_cache,
+    refresh_sectors,
+    rewarm_sector_keys,
     US_SECTOR_META,
+    sector_flight_stats,
 )
 from backend.services.cache_manager import (
     clear_cache,
     cache_stats,
     get_ttl,
-    is_market_hours,
+    tier_stats,
 )
-from backend.services.heatmap_service import build_heatmap_response
+from backend.services.heatmap_service import (
+    get_heatmap_snapshot_async,
+    is_snapshot_stale,
+    refresh_heatmap_snapshot,
+)
+from backend.services.file_lock import key_lock_stats
+from backend.services.cache_gc import gc_stats, start_gc, stop_gc, sweep
+from backend.services.serializer import EncodedBody, encoded_body, serializer_stats
+from backend.services.http_client import close_http_clients
+from backend.services import cache_index, metrics, tracing
+from backend.services.llm_client import close_llm_clients, llm_stats
+from backend.services.analysis_cache import analysis_cache_stats
+from backend.services.sector_window import window_stats
+from backend.services.naver_quota import (
+    NAVER_DAILY_LIMIT,
+    calls_today,
+    naver_quota_stats,
+    projected_calls,
+    record_call,
+    ttl_multiplier,
+)
+from backend.services.article_store import article_store_stats, query_company_articles
+from backend.services.sector_velocity import velocity_stats
+from backend.services.refresh_scheduler import (
+    start_scheduler,
+    stop_scheduler,
+    scheduler_state,
+    estimated_daily_naver_calls,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 섹터 캐시 사전 갱신 스케줄러 (REFRESH_SCHEDULER_ENABLED=0 이면 비활성)
+    start_scheduler()
+    # 캐시 디렉터리 주기 정리 (CACHE_GC_ENABLED=0 이면 비활성)
+    start_gc()
+    yield
+    await stop_gc()
+    await stop_scheduler()
+    await close_http_clients()
+    await close_llm_clients()
+
 
 app = FastAPI(
     title="News Moa API",
     description="네이버 뉴스 기반 주식 섹터 히트맵 서비스",
     version="2.0.0",
+    lifespan=lifespan,
 )
 
+# 요청 추적 (X-Trace: 1 헤더 또는 TRACE_SAMPLE_RATE 표본만, 결과는 /debug/traces)
+app.add_middleware(tracing.TraceMiddleware)
+
 # Flutter 앱 연결용 CORS 허용
 app.add_middleware(
     CORSMiddleware,
@@ -50,9 +101,33 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[tracing.TRACE_ID_HEADER],
 )
 
 
+def _encoded_response(
+    request: Request,
+    encoded: EncodedBody,
+    etag: Optional[str] = None,
+    headers: Optional[dict] = None,
+) -> Response:
+    """
+    미리 직렬화된 본문으로 응답 (FastAPI 의 response_model 재검증·재직렬화 생략).
+    Accept-Encoding 에 따라 미리 압축해 둔 gzip/br 본문을 반환하고, ETag 는 인코딩별로 구분한다.
+    """
+    body, encoding = encoded.negotiate(request.headers.get("accept-encoding"))
+    headers = dict(headers or {})
+    headers["Vary"] = "Accept-Encoding"
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    if etag:
+        etag = f'{etag[:-1]}-{encoding}"' if encoding else etag
+        headers["ETag"] = etag
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # ─────────────────────────────────────────────
 # 기본 엔드포인트
 # ─────────────────────────────────────────────
@@ -71,45 +146,74 @@ def root():
 # ─────────────────────────────────────────────
 
 @app.get("/news/heatmap", response_model=HeatmapResponse)
-def get_heatmap(market: str = "KR"):
+async def get_heatmap(request: Request, background_tasks: BackgroundTasks, market: str = "KR"):
     """
     전체 섹터 히트맵 데이터 반환.
     - market=KR: 네이버 뉴스 API (캐시 + 병렬 호출)
     - market=US: Google News RSS (무료, 호출 제한 없음)
+    미리 직렬화된 스냅샷을 그대로 반환하고, TTL이 지난 스냅샷은 백그라운드에서 재구성.
     """
     try:
-        return build_heatmap_response(market)
+        snapshot = await get_heatmap_snapshot_async(market)
     except ValueError as e:
         raise HTTPException(status_code=503, detail=str(e))
 
+    if is_snapshot_stale(snapshot):
+        background_tasks.add_task(refresh_heatmap_snapshot, snapshot.market)
+
+    return _encoded_response(
+        request,
+        snapshot.encoded,
+        etag=snapshot.etag,
+        headers={"X-Heatmap-Version": str(snapshot.version)},
+    )
+
 
 # ─────────────────────────────────────────────
 # 섹터별 뉴스
 # ─────────────────────────────────────────────
 
 @app.get("/news/sector/{sector_id}", response_model=SectorNewsResult)
-def get_sector_news(sector_id: str, page: int = 1):
+async def get_sector_news(request: Request, sector_id: str, page: int = 1, cursor: Optional[str] = None):
     """
     특정 섹터의 뉴스 목록 반환 (캐시 우선).
     KR 섹터 (IT_1 등) 또는 US 섹터 (US_IT_1 등) 자동 인식.
     page: 페이지 번호 (1부터 시작, 기본값 1)
+    cursor: 이전 응답의 next_cursor. 주면 page 대신 저장된 기사 목록에서 다음 페이지를 반환
+            (새 기사가 들어와도 페이지가 밀리지 않고, 저장된 범위 안에서는 업스트림 호출 없음)
     """
     # US_ 접두사로 자동 인식
     if sector_id.startswith("US_"):
         if sector_id not in US_SECTOR_META:
             raise HTTPException(status_code=404, detail=f"알 수 없는 US 섹터: {sector_id}")
-        result = fetch_us_sector_news(sector_id, display=10, page=page)
+    elif sector_id not in SECTOR_META:
+        raise HTTPException(status_code=404, detail=f"알 수 없는 KR 섹터: {sector_id}")
+
+    if cursor:
+        try:
+            result = await fetch_sector_news_by_cursor_async(sector_id, cursor, display=10)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    elif sector_id.startswith("US_"):
+        result = await fetch_us_sector_news_async(sector_id, display=10, page=page)
     else:
-        if sector_id not in SECTOR_META:
-            raise HTTPException(status_code=404, detail=f"알 수 없는 KR 섹터: {sector_id}")
-        result = fetch_sector_news(sector_id, display=10, page=page)
+        result = await fetch_sector_news_async(sector_id, display=10, page=page)
 
     if not result:
         raise HTTPException(status_code=503, detail="뉴스를 가져오는 데 실패했습니다.")
 
-    return result
+    # 캐시에서 같은 결과 객체가 반환되면 직렬화·압축 결과도 재사용
+    return _encoded_response(request, encoded_body(result))
 
 
+@app.get("/news/company/{company}")
+def get_company_news(company: str, limit: int = 20):
+    """
+    기업명으로 저장된 기사 조회 (업스트림 호출 없음, 기사 저장소의 기업 인덱스 사용).
+    반환: [{"sector_id", "article"}] 최신순
+    """
+    return query_company_articles(company, limit=min(max(limit, 1), 100))
+
 
 @app.get("/news/sectors")
 def list_sectors(market: str = "KR"):
@@ -119,6 +223,15 @@ def list_sectors(market: str = "KR"):
     return list(SECTOR_META.keys())
 
 
+@app.get("/llm/stats")
+def get_llm_stats():
+    """OpenAI 호출 통계 (용도별 대기 시간 vs 호출 시간, 동시성/속도 제한, 기사 분석 캐시)"""
+    return {
+        **llm_stats(),
+        "analysis_cache": analysis_cache_stats(),
+    }
+
+
 @app.get("/debug/naver-test")
 def debug_naver_test(query: str = "반도체 주가"):
     """디버깅: 네이버 API raw 호출 결과 확인"""
@@ -136,13 +249,14 @@ def debug_naver_test(query: str = "반도체 주가"):
         debug_info["error"] = "환경변수 누락"
         return debug_info
 
-    url = "https://openapi.naver.com/v1/search/news.json"
+    url = NAVER_NEWS_URL
     headers = {
         "X-Naver-Client-Id":     client_id,
         "X-Naver-Client-Secret": client_secret,
     }
     params = {"query": query, "display": 3, "sort": "date"}
 
+    record_call(query, "debug")
     try:
         response = requests.get(url, headers=headers, params=params, timeout=10)
         debug_info["status_code"] = response.status_code
@@ -153,60 +267,218 @@ def debug_naver_test(query: str = "반도체 주가"):
     return debug_info
 
 
+@app.get("/debug/traces")
+def list_traces(limit: int = 20):
+    """최근 추적 요약 (요청별 전체 시간, 오류 span, 가장 느린 섹터)"""
+    return {
+        **tracing.tracing_stats(),
+        "traces": tracing.recent_traces(limit),
+    }
+
+
+@app.get("/debug/traces/{trace_id}")
+def get_trace(trace_id: str, format: str = "zipkin"):
+    """
+    추적 하나 조회.
+    format=zipkin: Zipkin v2 JSON span 목록 (Zipkin/Jaeger UI 에 그대로 업로드 가능)
+    format=tree: 부모-자식 중첩 구조 + 요약
+    """
+    trace = tracing.get_trace(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"추적 없음 (만료되었거나 잘못된 ID): {trace_id}")
+    if format == "tree":
+        return {**tracing.summarize(trace), "tree": tracing.to_tree(trace)}
+    if format != "zipkin":
+        raise HTTPException(status_code=400, detail="format 은 zipkin 또는 tree")
+    return tracing.to_zipkin(trace)
+
+
 # ─────────────────────────────────────────────
 # 캐시 관리
 # ─────────────────────────────────────────────
 
+def _validate_sector(sector_id: str) -> None:
+    if sector_id not in SECTOR_META and sector_id not in US_SECTOR_META:
+        raise HTTPException(status_code=404, detail=f"알 수 없는 섹터: {sector_id}")
+
+
+def _validate_market(market: Optional[str]) -> Optional[str]:
+    if market is None:
+        return None
+    if market.upper() not in ("KR", "US"):
+        raise HTTPException(status_code=400, detail=f"알 수 없는 market: {market} (KR 또는 US)")
+    return market.upper()
+
+
 @app.post("/cache/refresh")
-def refresh_all_cache(background_tasks: BackgroundTasks):
+def refresh_all_cache(
+    background_tasks: BackgroundTasks,
+    market: Optional[str] = None,
+    sector_id: Optional[str] = None,
+):
     """
-    전체 캐시 강제 갱신 (백그라운드 실행).
-    관리자용 - 앱 시작 시 또는 수동 트리거 시 사용.
+    캐시 강제 갱신 (백그라운드 실행, 캐시를 지우지 않음).
+    기존 값은 새 결과로 교체될 때까지 계속 제공되므로 갱신 중 요청이 업스트림으로 몰리지 않는다.
+    market: KR / US (기본: 둘 다), sector_id: 특정 섹터만
     """
-    def _refresh():
-        clear_cache()
-        fetch_all_sectors(display=10)
-        print("[Cache] 전체 캐시 갱신 완료")
-
-    background_tasks.add_task(_refresh)
-    return {"message": "백그라운드에서 전체 캐시 갱신 중..."}
+    market = _validate_market(market)
+    if sector_id:
+        _validate_sector(sector_id)
+    background_tasks.add_task(refresh_sectors, market=market, sector_id=sector_id)
+    target = sector_id or market or "KR+US"
+    return {"message": f"백그라운드에서 {target} 캐시 갱신 중..."}
 
 
 @app.delete("/cache/{sector_id}")
-def clear_sector_cache(sector_id: str):
-    """특정 섹터 캐시 삭제"""
-    if sector_id not in SECTOR_META:
-        raise HTTPException(status_code=404, detail=f"알 수 없는 섹터: {sector_id}")
-    clear_cache(f"sector_{sector_id}")
-    return {"message": f"{sector_id} 캐시 삭제 완료"}
+def clear_sector_cache(
+    sector_id: str,
+    background_tasks: BackgroundTasks,
+    page: Optional[int] = None,
+    rewarm: bool = False,
+):
+    """
+    특정 섹터(KR/US) 캐시 삭제. page 를 주면 해당 페이지만, 없으면 모든 페이지.
+    rewarm=true 면 삭제한 키만 백그라운드에서 다시 조회해 채운다.
+    """
+    _validate_sector(sector_id)
+    keys = invalidate_sector_cache(sector_id=sector_id, page=page)
+    if rewarm and keys:
+        background_tasks.add_task(rewarm_sector_keys, keys)
+    return {
+        "message": f"{sector_id} 캐시 {len(keys)}개 삭제 완료",
+        "invalidated": keys,
+        "rewarm": rewarm and bool(keys),
+    }
 
 
 @app.delete("/cache")
-def clear_all_cache():
-    """전체 캐시 삭제"""
-    clear_cache()
-    return {"message": "전체 캐시 삭제 완료"}
+def clear_all_cache(
+    background_tasks: BackgroundTasks,
+    market: Optional[str] = None,
+    prefix: Optional[str] = None,
+    page: Optional[int] = None,
+    rewarm: bool = False,
+):
+    """
+    캐시 삭제. 조건이 없으면 전체 삭제.
+    market: KR / US 시장 전체, prefix: 캐시 키 접두사 (예: sector_IT_), page: 해당 페이지만
+    rewarm=true 면 삭제한 섹터 키만 백그라운드에서 다시 조회해 채운다.
+    """
+    market = _validate_market(market)
+    if market is None and prefix is None and page is None:
+        clear_cache()
+        return {"message": "전체 캐시 삭제 완료"}
+
+    keys = invalidate_sector_cache(market=market, page=page, prefix=prefix)
+    if rewarm and keys:
+        background_tasks.add_task(rewarm_sector_keys, keys)
+    return {
+        "message": f"캐시 {len(keys)}개 삭제 완료",
+        "invalidated": keys,
+        "rewarm": rewarm and bool(keys),
+    }
+
+
+@app.post("/cache/gc")
+def run_cache_gc():
+    """캐시 정리 즉시 실행 (나이/개수/용량 제한에 따라 삭제하고 보고서 반환)"""
+    return sweep()
 
 
 @app.get("/cache/stats")
 def get_cache_stats():
-    """캐시 현황 및 API 호출 전략 정보 반환"""
+    """
+    캐시 현황 및 API 호출 전략 정보 반환.
+    estimated_*: TTL 기준 이론상 호출 수 / naver_quota: 원장에 기록된 실제 호출 수와 오늘 예상치, 압박 단계
+    """
     stats = cache_stats()
     ttl = get_ttl()
     sector_count = len(SECTOR_META)
-    calls_per_refresh = sector_count  # 캐시 미스 시 섹터당 1회
+    # 캐시 미스 시 섹터 키워드 수만큼 호출 (보조 키워드는 키워드별 예산 안에서만)
+    calls_per_refresh = sum(len(m["keywords"]) for m in SECTOR_META.values())
     refreshes_per_day = (24 * 60) // (ttl // 60)
     estimated_daily_calls = calls_per_refresh * refreshes_per_day
 
     return {
         **stats,
         "sector_count": sector_count,
+        "keyword_count": calls_per_refresh,
         "estimated_daily_api_calls": estimated_daily_calls,
-        "naver_daily_limit": 2500,
-        "usage_ratio": f"{(estimated_daily_calls / 2500) * 100:.1f}%",
+        "scheduler_estimated_daily_api_calls": estimated_daily_naver_calls(),
+        "naver_daily_limit": NAVER_DAILY_LIMIT,
+        "usage_ratio": f"{(estimated_daily_calls / NAVER_DAILY_LIMIT) * 100:.1f}%",
+        "naver_quota": naver_quota_stats(),
+        "sector_ttl": velocity_stats(ttl),
+        "single_flight": sector_flight_stats(),
+        "incremental": window_stats(),
+        "article_store": article_store_stats(),
+        "serializer": serializer_stats(),
+        "key_locks": key_lock_stats(),
+        "gc": gc_stats(),
     }
 
 
+# 출력 시점에 읽는 게이지 (기존 통계 함수 재사용)
+metrics.register_gauge(
+    "news_naver_calls_today", "오늘(KST) 네이버 검색 API 호출 수",
+    lambda: {(): calls_today()},
+)
+metrics.register_gauge(
+    "news_naver_daily_limit", "네이버 검색 API 일일 한도",
+    lambda: {(): NAVER_DAILY_LIMIT},
+)
+metrics.register_gauge(
+    "news_naver_projected_calls", "지금까지의 호출 속도로 본 오늘(KST) 네이버 호출 예상치",
+    lambda: {(): projected_calls()},
+)
+metrics.register_gauge(
+    "news_kr_ttl_multiplier", "네이버 호출량 압박에 따른 KR 캐시 TTL 배수 (1 = 평소)",
+    lambda: {(): ttl_multiplier()},
+)
+metrics.register_gauge(
+    "news_sector_velocity", "섹터별 기사 유입 속도 EWMA (건/시간)",
+    lambda: {
+        (("market", "US" if s.startswith("US_") else "KR"), ("sector", s)): v["articles_per_hour"]
+        for s, v in velocity_stats(get_ttl())["sectors"].items()
+    },
+)
+metrics.register_gauge(
+    "news_sector_ttl_seconds", "섹터별 현재 캐시 TTL (유입 속도 반영, 호출량 압박 배수 제외)",
+    lambda: {
+        (("market", "US" if s.startswith("US_") else "KR"), ("sector", s)): v["ttl_minutes"] * 60
+        for s, v in velocity_stats(get_ttl())["sectors"].items()
+    },
+)
+metrics.register_gauge(
+    "news_cache_entries", "캐시 파일 항목 수 (색인 기준, 워커 공통)",
+    lambda: {(("market", m),): entries for m, (entries, _) in cache_index.market_totals().items()},
+)
+metrics.register_gauge(
+    "news_cache_bytes", "캐시 파일 크기 합계 (색인 기준, 워커 공통)",
+    lambda: {(("market", m),): size for m, (_, size) in cache_index.market_totals().items()},
+)
+metrics.register_gauge(
+    "news_cache_l1_entries", "이 워커의 메모리(L1) 캐시 항목 수",
+    lambda: {(): tier_stats()["l1"]["entries"]},
+)
+metrics.register_gauge(
+    "news_llm_active_calls", "진행 중인 OpenAI 호출 수",
+    lambda: {(): llm_stats()["active"]},
+)
+
+
+@app.get("/metrics")
+def get_metrics():
+    """Prometheus 텍스트 형식 지표 (단계별 소요 시간, 캐시 적중/미스, 업스트림 오류 등)"""
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/cache/schedule")
+def get_cache_schedule():
+    """백그라운드 사전 갱신 스케줄러 상태 (섹터별 다음/마지막 실행 시각)"""
+    return scheduler_state()
+
+
 # ─────────────────────────────────────────────
 # 레거시 엔드포인트 (하위 호환)
 # ─────────────────────────────────────────────
@@ -42,6 +42,7 @@ class SectorNewsResult(BaseModel):
     cached_at: Optional[str] = None   # 캐시 저장 시각
     sector_briefing: Optional[str] = None   # AI 생성 섹터 한 줄 브리핑
     rising_keywords: List[str] = []   # 섹터 내 급상승 키워드 (관련 기업/키워드 빈도 기반)
+    next_cursor: Optional[str] = None   # 다음 페이지 커서 (없으면 마지막 페이지)
 
 
 # 전체 히트맵 응답 모델
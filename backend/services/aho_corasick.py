@@ -0,0 +1,115 @@
+"""
+Aho–Corasick 다중 패턴 문자열 매칭
+- 패턴 수와 무관하게 텍스트를 한 번만 훑어 모든 패턴의 출현 위치를 찾음
+- 기업명 사전(수천 개 종목명/별칭) 매칭, 감성 사전 매칭 등에서 공용으로 사용
+- pyahocorasick(C 확장)이 설치되어 있으면 사용, 없으면 순수 파이썬 구현으로 동작
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import ahocorasick as _pyahocorasick
+except ImportError:   # 선택 의존성
+    _pyahocorasick = None
+
+
+def native_available() -> bool:
+    return _pyahocorasick is not None
+
+
+class AhoCorasick:
+    """
+    add() 로 패턴을 등록하고 build() 로 실패 링크를 만든 뒤 iter_matches() 로 검색.
+    build() 전에 검색하면 자동으로 build 한다. 같은 패턴을 다시 add 하면 값만 교체된다.
+    """
+
+    def __init__(self, use_native: bool = True) -> None:
+        self._native = _pyahocorasick is not None and use_native
+        self._values: Dict[str, Any] = {}
+        self._automaton: Optional[Any] = None
+        # 순수 파이썬 구현용 트라이
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]   # 노드별 (패턴 길이, 값)
+        self._built = True
+
+    @property
+    def backend(self) -> str:
+        return "pyahocorasick" if self._native else "python"
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, pattern: str, value: Any = None) -> None:
+        """패턴 등록. value 를 주면 매칭 시 패턴 대신 value 를 돌려준다."""
+        if not pattern:
+            raise ValueError("빈 패턴은 등록할 수 없습니다")
+        self._values[pattern] = pattern if value is None else value
+        self._built = False
+
+    def build(self) -> None:
+        if self._native:
+            automaton = _pyahocorasick.Automaton()
+            for pattern, value in self._values.items():
+                automaton.add_word(pattern, (len(pattern), value))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._build_python()
+        self._built = True
+
+    def _build_python(self) -> None:
+        """트라이 구성 후 BFS 로 실패 링크 계산 + 실패 링크 쪽 출력 병합"""
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[Tuple[int, Any]]] = [[]]
+        for pattern, value in self._values.items():
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    out.append([])
+                    goto[node][ch] = nxt
+                node = nxt
+            out[node].append((len(pattern), value))
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0) if node else 0
+                if out[fail[child]]:
+                    out[child] = out[child] + out[fail[child]]
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """(시작, 끝, 값) 을 끝 위치 순서로 반환 (겹치는 매칭 포함)"""
+        if not self._built:
+            self.build()
+        if self._native:
+            if not self._values:
+                return
+            for last, (length, value) in self._automaton.iter(text):
+                yield last + 1 - length, last + 1, value
+            return
+
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        end = 0
+        for ch in text:
+            end += 1
+            nxt = goto[node].get(ch)
+            while nxt is None and node:
+                node = fail[node]
+                nxt = goto[node].get(ch)
+            node = nxt or 0
+            if out[node]:
+                for length, value in out[node]:
+                    yield end - length, end, value
@@ -0,0 +1,156 @@
+"""
+기사 단위 AI 분석 결과 캐시 (content-addressed)
+- 키: (링크, 제목, 설명, 섹터, 프롬프트 버전 ...) 의 SHA-256 해시
+- 같은 기사가 다른 페이지/갱신/겹치는 섹터 키워드로 다시 들어와도 GPT 재호출 없이 결과 재사용
+- 메모리 LRU + 추가 전용(JSONL) 파일로 재시작 후에도 유지
+- 파일은 요청 경로에서 다시 쓰지 않고, 캐시 GC 의 prune_analyses() 가 워커들이 추가한 줄을 모두 다시 읽어 정리
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List
+
+from . import cache_manager
+
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "20000"))
+ANALYSIS_CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL", str(7 * 24 * 3600)))   # 초
+
+_lock = threading.Lock()
+_entries: "OrderedDict[str, dict]" = OrderedDict()
+_loaded = False
+_counters = {"hits": 0, "misses": 0}
+
+
+def _log_path() -> str:
+    return os.path.join(cache_manager.cache_subdir("analysis"), "articles.jsonl")
+
+
+def analysis_key(parts: List[str]) -> str:
+    """분석 결과를 결정하는 입력값들로 content-addressed 키 생성"""
+    raw = "\x1f".join(p or "" for p in parts)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _load() -> None:
+    """JSONL 로그를 읽어 메모리에 적재 (_lock 보유 상태, 최초 1회)"""
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+    path = _log_path()
+    if not os.path.exists(path):
+        return
+    cutoff = time.time() - ANALYSIS_CACHE_TTL
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue   # 기록 도중 잘린 줄
+                if record.get("t", 0) < cutoff:
+                    continue
+                _entries[record["k"]] = record
+                _entries.move_to_end(record["k"])
+        while len(_entries) > ANALYSIS_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+    except Exception as e:
+        print(f"[AnalysisCache] 로드 오류: {e}")
+
+
+def prune_analyses() -> int:
+    """
+    만료된 분석 결과를 메모리와 로그 파일에서 삭제 (캐시 GC 가 주기 호출).
+    로그 파일은 다른 워커가 추가한 줄까지 포함해 키별 마지막 기록만 다시 씀. 반환: 파일에서 버린 줄 수
+    """
+    cutoff = time.time() - ANALYSIS_CACHE_TTL
+    with _lock:
+        _load()
+        for key in [k for k, record in _entries.items() if record["t"] < cutoff]:
+            del _entries[key]
+        path = _log_path()
+        if not os.path.exists(path):
+            return 0
+        latest: "OrderedDict[str, str]" = OrderedDict()
+        lines = 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get("t", 0) < cutoff:
+                        continue
+                    latest[record["k"]] = line if line.endswith("\n") else line + "\n"
+                    latest.move_to_end(record["k"])
+            while len(latest) > ANALYSIS_CACHE_MAX_ENTRIES:
+                latest.popitem(last=False)
+            if len(latest) == lines:
+                return 0
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(latest.values())
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[AnalysisCache] 정리 오류: {e}")
+            return 0
+    return lines - len(latest)
+
+
+def get_analyses(keys: List[str]) -> Dict[str, dict]:
+    """캐시된 분석 결과 조회 → {key: {"is_relevant", "companies", "reason", "summary"}}"""
+    found: Dict[str, dict] = {}
+    cutoff = time.time() - ANALYSIS_CACHE_TTL
+    with _lock:
+        _load()
+        for key in keys:
+            record = _entries.get(key)
+            if record is None or record["t"] < cutoff:
+                _counters["misses"] += 1
+                continue
+            _entries.move_to_end(key)
+            _counters["hits"] += 1
+            found[key] = record["r"]
+    return found
+
+
+def put_analyses(results: Dict[str, dict]) -> None:
+    """새 분석 결과 저장 (메모리 + JSONL 추가)"""
+    if not results:
+        return
+    now = time.time()
+    with _lock:
+        _load()
+        lines = []
+        for key, result in results.items():
+            record = {"k": key, "t": now, "r": result}
+            _entries[key] = record
+            _entries.move_to_end(key)
+            lines.append(json.dumps(record, ensure_ascii=False))
+        while len(_entries) > ANALYSIS_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+        try:
+            with open(_log_path(), "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except Exception as e:
+            print(f"[AnalysisCache] 저장 오류: {e}")
+
+
+def analysis_cache_stats() -> dict:
+    with _lock:
+        hits, misses = _counters["hits"], _counters["misses"]
+        total = hits + misses
+        return {
+            "entries": len(_entries),
+            "max_entries": ANALYSIS_CACHE_MAX_ENTRIES,
+            "ttl_hours": ANALYSIS_CACHE_TTL // 3600,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 3) if total else None,
+        }
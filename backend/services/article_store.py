@@ -0,0 +1,430 @@
+"""
+로컬 기사 저장소 (SQLite, WAL 모드)
+- 기사 본문은 링크 기준으로 1건만 저장, 섹터 소속/AI 분석 결과는 섹터별로 저장
+- 인덱스: 섹터+발행시각, 발행시각, 기업명 → 페이지 조회/히트맵 재구성/기업별 기사 조회를 쿼리로 처리
+- 섹터 기사 페이지는 (발행시각, 링크) 기준 커서로 조회 → 새 기사가 들어와도 뒤 페이지가 밀리지 않음
+- 섹터별 기사 유입 속도(sector_velocity) 관측값도 함께 보관 → 재시작/워커 간 공유
+- 오래 업스트림에서 다시 보이지 않은 섹터 기사는 캐시 GC 가 prune_articles() 로 정리
+- 파일: CACHE_DIR/articles.db
+"""
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from . import cache_manager
+from .sector_window import article_link, parse_pub_date
+from ..models.news_schema import NewsItem
+
+_TABLES = """
+CREATE TABLE IF NOT EXISTS articles (
+    id            INTEGER PRIMARY KEY,
+    link_key      TEXT NOT NULL UNIQUE,      -- 원본 링크(없으면 링크)
+    title         TEXT NOT NULL,
+    link          TEXT NOT NULL,
+    description   TEXT NOT NULL,
+    pub_date      TEXT NOT NULL,
+    pub_ts        REAL,                      -- pubDate 를 epoch 초로 변환 (정렬/범위 조회용)
+    source        TEXT NOT NULL,
+    original_link TEXT,
+    first_seen    REAL NOT NULL,
+    last_fetched  REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sector_articles (
+    sector_id         TEXT NOT NULL,
+    article_id        INTEGER NOT NULL REFERENCES articles (id),
+    pub_ts            REAL NOT NULL,         -- 발행시각 (알 수 없으면 0, 커서 정렬 키)
+    sort_key          TEXT NOT NULL,         -- 발행시각이 같을 때의 정렬 키 (= link_key)
+    related_companies TEXT NOT NULL,         -- JSON 배열
+    ai_reason         TEXT,
+    summary           TEXT,
+    fetched_at        REAL NOT NULL,
+    PRIMARY KEY (sector_id, article_id)
+);
+
+CREATE TABLE IF NOT EXISTS article_companies (
+    company    TEXT NOT NULL,
+    sector_id  TEXT NOT NULL,
+    article_id INTEGER NOT NULL,
+    PRIMARY KEY (company, sector_id, article_id)
+);
+
+CREATE TABLE IF NOT EXISTS sector_state (
+    sector_id  TEXT PRIMARY KEY,
+    market     TEXT NOT NULL,
+    total      INTEGER NOT NULL,             -- 업스트림 전체 검색 결과 수 (news_volume)
+    briefing   TEXT,
+    fetched_at REAL NOT NULL,
+    backfill_start INTEGER NOT NULL DEFAULT 0 -- 커서 백필이 다음에 요청할 업스트림 시작 위치 (0: 2페이지부터)
+);
+
+CREATE TABLE IF NOT EXISTS sector_velocity (
+    sector_id   TEXT PRIMARY KEY,
+    velocity    REAL NOT NULL,               -- 기사 유입 속도 EWMA (건/시간)
+    samples     INTEGER NOT NULL,            -- 누적 관측 횟수
+    observed_at REAL NOT NULL,               -- 마지막 관측 시각
+    links       TEXT NOT NULL,               -- 마지막 관측 때 받은 원본 링크 (JSON 배열)
+    keywords    TEXT NOT NULL DEFAULT '[]'   -- 마지막 관측 때 기사를 돌려준 키워드 (JSON 배열)
+);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_articles_pub_ts ON articles (pub_ts);
+CREATE INDEX IF NOT EXISTS idx_sector_articles_pos ON sector_articles (sector_id, pub_ts DESC, sort_key DESC);
+CREATE INDEX IF NOT EXISTS idx_sector_articles_fetched ON sector_articles (fetched_at);
+"""
+
+_local = threading.local()
+
+
+def _db_path() -> str:
+    cache_manager._ensure_cache_dir()
+    return os.path.join(cache_manager.CACHE_DIR, "articles.db")
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """이전 스키마(정렬 키 없음, pub_ts NULL 허용, 백필 위치 없음)로 만든 파일 보정"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(sector_articles)")}
+    if "sort_key" not in columns:
+        with conn:
+            conn.execute("DROP INDEX IF EXISTS idx_sector_articles_pub")
+            conn.execute("ALTER TABLE sector_articles ADD COLUMN sort_key TEXT NOT NULL DEFAULT ''")
+            conn.execute(
+                "UPDATE sector_articles SET pub_ts = COALESCE(pub_ts, 0), "
+                "sort_key = (SELECT link_key FROM articles WHERE id = article_id)"
+            )
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(sector_state)")}
+    if "backfill_start" not in columns:
+        with conn:
+            conn.execute("ALTER TABLE sector_state ADD COLUMN backfill_start INTEGER NOT NULL DEFAULT 0")
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(sector_velocity)")}
+    if "keywords" not in columns:
+        with conn:
+            conn.execute("ALTER TABLE sector_velocity ADD COLUMN keywords TEXT NOT NULL DEFAULT '[]'")
+
+
+def _conn() -> sqlite3.Connection:
+    """스레드별 연결 (WAL: 읽기는 쓰기와 동시에 진행)"""
+    path = _db_path()
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != path:
+        conn = sqlite3.connect(path, timeout=5.0)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_TABLES)
+        _migrate(conn)
+        conn.executescript(_INDEXES)
+        _local.conn, _local.path = conn, path
+    return conn
+
+
+def _to_item(row: sqlite3.Row) -> NewsItem:
+    return NewsItem(
+        title=row["title"],
+        link=row["link"],
+        description=row["description"],
+        pubDate=row["pub_date"],
+        source=row["source"],
+        original_link=row["original_link"],
+        related_companies=json.loads(row["related_companies"]),
+        ai_classification_reason=row["ai_reason"],
+        summary=row["summary"],
+    )
+
+
+def upsert_sector_articles(sector_id: str, articles: List[NewsItem]) -> None:
+    """섹터에 적합 판정된 기사 저장 (이미 있는 기사는 분석 결과/조회 시각만 갱신)"""
+    if not articles:
+        return
+    now = time.time()
+    try:
+        conn = _conn()
+        with conn:
+            for a in articles:
+                link_key = article_link({"original_link": a.original_link, "link": a.link})
+                pub_ts = parse_pub_date(a.pubDate)
+                conn.execute(
+                    """
+                    INSERT INTO articles (link_key, title, link, description, pub_date, pub_ts,
+                                          source, original_link, first_seen, last_fetched)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (link_key) DO UPDATE SET last_fetched = excluded.last_fetched
+                    """,
+                    (link_key, a.title, a.link, a.description, a.pubDate, pub_ts,
+                     a.source, a.original_link, now, now),
+                )
+                article_id = conn.execute(
+                    "SELECT id FROM articles WHERE link_key = ?", (link_key,)
+                ).fetchone()[0]
+                conn.execute(
+                    """
+                    INSERT INTO sector_articles (sector_id, article_id, pub_ts, sort_key,
+                                                 related_companies, ai_reason, summary, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (sector_id, article_id) DO UPDATE SET
+                        related_companies = excluded.related_companies,
+                        ai_reason = excluded.ai_reason,
+                        summary = excluded.summary,
+                        fetched_at = excluded.fetched_at
+                    """,
+                    (sector_id, article_id, pub_ts or 0.0, link_key, json.dumps(a.related_companies, ensure_ascii=False),
+                     a.ai_classification_reason, a.summary, now),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO article_companies (company, sector_id, article_id) VALUES (?, ?, ?)",
+                    [(c, sector_id, article_id) for c in a.related_companies],
+                )
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 저장 오류 ({sector_id}): {e}")
+
+
+def save_sector_state(sector_id: str, market: str, total: int, briefing: Optional[str]) -> None:
+    """섹터 1페이지 갱신 결과의 섹터 단위 정보 (전체 건수, 브리핑)"""
+    try:
+        conn = _conn()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO sector_state (sector_id, market, total, briefing, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (sector_id) DO UPDATE SET
+                    market = excluded.market, total = excluded.total,
+                    briefing = excluded.briefing, fetched_at = excluded.fetched_at
+                """,
+                (sector_id, market, total, briefing, time.time()),
+            )
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 섹터 상태 저장 오류 ({sector_id}): {e}")
+
+
+def get_sector_state(sector_id: str) -> Optional[dict]:
+    try:
+        row = _conn().execute(
+            "SELECT market, total, briefing, fetched_at, backfill_start FROM sector_state WHERE sector_id = ?",
+            (sector_id,),
+        ).fetchone()
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 조회 오류 ({sector_id}): {e}")
+        return None
+    return dict(row) if row else None
+
+
+def advance_backfill(sector_id: str, next_start: int) -> None:
+    """커서 백필 진행 위치 기록 (동시 백필이 있어도 뒤로 가지 않음)"""
+    try:
+        conn = _conn()
+        with conn:
+            conn.execute(
+                "UPDATE sector_state SET backfill_start = MAX(backfill_start, ?) WHERE sector_id = ?",
+                (next_start, sector_id),
+            )
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 백필 위치 저장 오류 ({sector_id}): {e}")
+
+
+def delete_sector(sector_id: str) -> None:
+    """섹터의 저장 기사/기업 색인/섹터 상태 삭제 (유입 속도 관측은 유지)"""
+    try:
+        conn = _conn()
+        with conn:
+            conn.execute("DELETE FROM article_companies WHERE sector_id = ?", (sector_id,))
+            conn.execute("DELETE FROM sector_articles WHERE sector_id = ?", (sector_id,))
+            conn.execute("DELETE FROM sector_state WHERE sector_id = ?", (sector_id,))
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 섹터 삭제 오류 ({sector_id}): {e}")
+
+
+def get_sector_velocity(sector_id: str) -> Optional[dict]:
+    """마지막 유입 속도 관측 (velocity, samples, observed_at, links, keywords)"""
+    try:
+        row = _conn().execute(
+            "SELECT velocity, samples, observed_at, links, keywords FROM sector_velocity WHERE sector_id = ?",
+            (sector_id,),
+        ).fetchone()
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 조회 오류 ({sector_id}): {e}")
+        return None
+    if row is None:
+        return None
+    return {**dict(row), "links": json.loads(row["links"]), "keywords": json.loads(row["keywords"])}
+
+
+def save_sector_velocity(
+    sector_id: str,
+    velocity: float,
+    samples: int,
+    observed_at: float,
+    links: List[str],
+    keywords: List[str],
+) -> None:
+    try:
+        conn = _conn()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO sector_velocity (sector_id, velocity, samples, observed_at, links, keywords)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (sector_id) DO UPDATE SET
+                    velocity = excluded.velocity, samples = excluded.samples,
+                    observed_at = excluded.observed_at, links = excluded.links, keywords = excluded.keywords
+                """,
+                (
+                    sector_id, velocity, samples, observed_at,
+                    json.dumps(links, ensure_ascii=False), json.dumps(sorted(keywords), ensure_ascii=False),
+                ),
+            )
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 유입 속도 저장 오류 ({sector_id}): {e}")
+
+
+def load_sector_velocities() -> dict:
+    """전체 섹터 {sector_id: (velocity, samples)}"""
+    try:
+        rows = _conn().execute("SELECT sector_id, velocity, samples FROM sector_velocity").fetchall()
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 조회 오류 (sector_velocity): {e}")
+        return {}
+    return {r["sector_id"]: (r["velocity"], r["samples"]) for r in rows}
+
+
+def query_sector_articles(sector_id: str, limit: int, offset: int = 0) -> List[NewsItem]:
+    """섹터 기사 최신순 조회 (sector_id + pub_ts 인덱스)"""
+    try:
+        rows = _conn().execute(
+            """
+            SELECT a.title, a.link, a.description, a.pub_date, a.source, a.original_link,
+                   s.related_companies, s.ai_reason, s.summary
+            FROM sector_articles s JOIN articles a ON a.id = s.article_id
+            WHERE s.sector_id = ?
+            ORDER BY s.pub_ts DESC, s.sort_key DESC
+            LIMIT ? OFFSET ?
+            """,
+            (sector_id, limit, offset),
+        ).fetchall()
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 조회 오류 ({sector_id}): {e}")
+        return []
+    return [_to_item(r) for r in rows]
+
+
+def encode_cursor(sector_id: str, position: Tuple[float, str]) -> str:
+    """섹터 내 위치 (발행시각, 정렬 키) → 불투명 커서 문자열"""
+    raw = json.dumps({"s": sector_id, "t": position[0], "k": position[1]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sector_id: str) -> Tuple[float, str]:
+    """커서 → (발행시각, 정렬 키). 형식이 틀리거나 다른 섹터의 커서면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        position = (float(data["t"]), str(data["k"]))
+        owner = data["s"]
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+    if owner != sector_id:
+        raise ValueError("다른 섹터의 커서입니다.")
+    return position
+
+
+def sector_position(article: NewsItem) -> Tuple[float, str]:
+    """기사의 섹터 내 정렬 위치 (다음 페이지 커서 생성용, 저장소 조회 없이 계산)"""
+    link_key = article_link({"original_link": article.original_link, "link": article.link})
+    return parse_pub_date(article.pubDate) or 0.0, link_key
+
+
+def query_sector_page(
+    sector_id: str,
+    limit: int,
+    after: Optional[Tuple[float, str]] = None,
+) -> List[Tuple[NewsItem, Tuple[float, str]]]:
+    """after 위치 다음부터 최신순으로 limit 건 (keyset 조회, 인덱스만 사용) → [(기사, 위치)]"""
+    keyset = "AND (s.pub_ts, s.sort_key) < (?, ?)" if after is not None else ""
+    params = (sector_id, *after, limit) if after is not None else (sector_id, limit)
+    try:
+        rows = _conn().execute(
+            f"""
+            SELECT a.title, a.link, a.description, a.pub_date, a.source, a.original_link,
+                   s.related_companies, s.ai_reason, s.summary, s.pub_ts, s.sort_key
+            FROM sector_articles s JOIN articles a ON a.id = s.article_id
+            WHERE s.sector_id = ? {keyset}
+            ORDER BY s.pub_ts DESC, s.sort_key DESC
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 조회 오류 ({sector_id}): {e}")
+        return []
+    return [(_to_item(r), (r["pub_ts"], r["sort_key"])) for r in rows]
+
+
+def query_company_articles(company: str, limit: int = 20, since_ts: Optional[float] = None) -> List[dict]:
+    """기업명으로 전체 섹터 기사 조회 (기업 인덱스) → [{"sector_id", "article"}]"""
+    try:
+        rows = _conn().execute(
+            """
+            SELECT c.sector_id, a.title, a.link, a.description, a.pub_date, a.source, a.original_link,
+                   s.related_companies, s.ai_reason, s.summary
+            FROM article_companies c
+            JOIN sector_articles s ON s.sector_id = c.sector_id AND s.article_id = c.article_id
+            JOIN articles a ON a.id = c.article_id
+            WHERE c.company = ? AND (? IS NULL OR a.pub_ts >= ?)
+            ORDER BY a.pub_ts DESC
+            LIMIT ?
+            """,
+            (company, since_ts, since_ts, limit),
+        ).fetchall()
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 조회 오류 ({company}): {e}")
+        return []
+    return [{"sector_id": r["sector_id"], "article": _to_item(r)} for r in rows]
+
+
+def prune_articles(before: float) -> int:
+    """
+    before 이후로 한 번도 다시 받지 않은 섹터 기사 삭제 (기업 색인 포함, 어느 섹터에도 남지 않은 기사 본문도 삭제).
+    반환: 삭제한 섹터 기사 수. 지운 페이지는 SQLite 가 재사용하므로 파일은 더 커지지 않는다.
+    """
+    try:
+        conn = _conn()
+        with conn:
+            conn.execute(
+                """
+                DELETE FROM article_companies WHERE (sector_id, article_id) IN (
+                    SELECT sector_id, article_id FROM sector_articles WHERE fetched_at < ?
+                )
+                """,
+                (before,),
+            )
+            pruned = conn.execute("DELETE FROM sector_articles WHERE fetched_at < ?", (before,)).rowcount
+            if pruned:
+                conn.execute("DELETE FROM articles WHERE id NOT IN (SELECT article_id FROM sector_articles)")
+    except sqlite3.Error as e:
+        print(f"[ArticleStore] 정리 오류: {e}")
+        return 0
+    return pruned
+
+
+def article_store_stats() -> dict:
+    try:
+        conn = _conn()
+        articles = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        memberships = conn.execute("SELECT COUNT(*) FROM sector_articles").fetchone()[0]
+        sectors = conn.execute("SELECT COUNT(*) FROM sector_state").fetchone()[0]
+    except sqlite3.Error as e:
+        return {"error": str(e)}
+    path = _db_path()
+    db_bytes = sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p))
+    return {
+        "articles": articles,
+        "sector_memberships": memberships,
+        "sectors": sectors,
+        "db_bytes": db_bytes,
+    }
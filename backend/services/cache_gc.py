@@ -0,0 +1,212 @@
+"""
+캐시 디렉터리 정리 (eviction / GC)
+- 페이지 번호마다 sector_*_{page}.json 이 생기고 만료 파일은 지워지지 않으므로 주기적으로 정리
+- 1) 나이 제한: 저장된 지 CACHE_GC_MAX_AGE 가 지난 항목 삭제
+  2) 개수/용량 제한: CACHE_GC_MAX_ENTRIES / CACHE_GC_MAX_BYTES 를 넘으면
+     만료된 항목부터, 그다음 정책(lru: 오래 안 쓴 순, lfu: 적게 쓴 순)으로 삭제
+  3) 색인 ↔ 파일 대조: 파일 없는 색인 행 삭제, 색인에 없는 파일 등록, 중단된 저장의 임시 파일 삭제
+  4) 하위 폴더/기사 저장소 보관 기간: 기사 저장소에서 CACHE_GC_ARTICLE_RETENTION 동안 다시 받지 않은 섹터 기사,
+     CACHE_GC_WINDOW_MAX_AGE 동안 갱신되지 않은 섹터 윈도우, 만료된 기사 분석 결과(ANALYSIS_CACHE_TTL) 삭제
+- 후보 선정은 캐시 색인(cache_index) 쿼리로 하고, 삭제는 clear_cache(key) 로 L1/파일/색인을 함께 정리
+- FastAPI lifespan 에서 시작하는 asyncio 태스크로 주기 실행, 여러 워커 중 한 곳만 실행 (키 잠금)
+  잠금을 지원하지 않는 플랫폼(fcntl 없음)에서는 워커마다 실행 (삭제는 이미 지워진 키를 건너뜀)
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from . import cache_index, cache_manager
+from .analysis_cache import prune_analyses
+from .article_store import prune_articles
+from .file_lock import LOCKING_SUPPORTED, KeyLock
+from .sector_window import prune_windows
+
+GC_ENABLED         = os.getenv("CACHE_GC_ENABLED", "1") == "1"
+GC_INTERVAL        = int(os.getenv("CACHE_GC_INTERVAL", str(10 * 60)))          # 초
+GC_MAX_AGE         = int(os.getenv("CACHE_GC_MAX_AGE", str(24 * 3600)))         # 초 (hard TTL 보다 길게)
+GC_MAX_ENTRIES     = int(os.getenv("CACHE_GC_MAX_ENTRIES", "2000"))
+GC_MAX_BYTES       = int(os.getenv("CACHE_GC_MAX_BYTES", str(200 * 1024 * 1024)))
+GC_POLICY          = os.getenv("CACHE_GC_POLICY", "lru").lower()                # lru | lfu
+GC_ARTICLE_RETENTION = int(os.getenv("CACHE_GC_ARTICLE_RETENTION", str(30 * 24 * 3600)))   # 초
+GC_WINDOW_MAX_AGE    = int(os.getenv("CACHE_GC_WINDOW_MAX_AGE", str(7 * 24 * 3600)))      # 초
+if GC_POLICY not in ("lru", "lfu"):
+    print(f"[CacheGC] 알 수 없는 정책: {GC_POLICY} → lru 사용")
+    GC_POLICY = "lru"
+TMP_FILE_MAX_AGE   = 10 * 60    # 이보다 오래된 *.tmp 는 중단된 저장의 잔여물로 보고 삭제
+REPORT_KEY_LIMIT   = 20         # 보고서에 남길 삭제 키 수
+
+_GC_LOCK_KEY = "__cache_gc__"
+
+_task: Optional[asyncio.Task] = None
+_last_report: Optional[dict] = None
+_totals = {"sweeps": 0, "skipped": 0, "evicted": 0, "evicted_bytes": 0}
+
+
+def _hard_ttl() -> int:
+    # 섹터 유입 속도/호출량 압박으로 늘어난 TTL 로 쓰는 항목을 만료로 보지 않도록 가장 긴 TTL 기준
+    return cache_manager.max_ttl() + cache_manager.STALE_GRACE
+
+
+def _evict(keys: List[Tuple[str, int]], reason: str, report: dict) -> None:
+    for key, size in keys:
+        try:
+            cache_manager.clear_cache(key)
+        except OSError as e:   # 다른 워커가 먼저 지운 경우 등
+            print(f"[CacheGC] 삭제 오류 ({key}): {e}")
+            continue
+        report["evicted"][reason] += 1
+        report["evicted_bytes"] += size
+        if len(report["evicted_keys"]) < REPORT_KEY_LIMIT:
+            report["evicted_keys"].append(key)
+
+
+def _reconcile(report: dict, now: float) -> None:
+    """색인과 실제 파일 목록 대조 + 오래된 임시 파일 삭제"""
+    files = {}
+    with os.scandir(cache_manager.CACHE_DIR) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(".json"):
+                files[entry.name[:-len(".json")]] = entry
+            elif entry.name.endswith(".tmp") and now - entry.stat().st_mtime > TMP_FILE_MAX_AGE:
+                try:
+                    os.remove(entry.path)
+                    report["tmp_removed"] += 1
+                except OSError:
+                    pass
+
+    indexed = set(cache_index.indexed_keys())
+    for key in indexed - files.keys():
+        cache_index.remove(key)
+        report["index_orphans"] += 1
+    for key in files.keys() - indexed:
+        st = files[key].stat()
+        ttl = cache_manager.get_ttl(st.st_mtime, market=cache_index.market_of(key), key=key)
+        cache_index.record(key, st.st_mtime, st.st_size, ttl)
+        report["unindexed_files"] += 1
+
+
+def _prune_retained(report: dict, now: float) -> None:
+    """cache_index 밖에 쌓이는 데이터(기사 저장소, 윈도우/분석 하위 폴더) 보관 기간 정리"""
+    report["pruned"] = {
+        "articles": prune_articles(now - GC_ARTICLE_RETENTION),
+        "windows": prune_windows(now - GC_WINDOW_MAX_AGE),
+        "analyses": prune_analyses(),
+    }
+
+
+def sweep(now: Optional[float] = None) -> dict:
+    """
+    정리 1회 실행 후 보고서 반환.
+    다른 워커가 정리 중이면 건너뛰고 {"skipped": True} 반환.
+    """
+    global _last_report
+    lock = KeyLock(_GC_LOCK_KEY)
+    if not lock.acquire(timeout=0) and LOCKING_SUPPORTED:
+        _totals["skipped"] += 1
+        return {"skipped": True, "reason": "다른 워커에서 정리 중"}
+
+    started = time.perf_counter()
+    now = time.time() if now is None else now
+    report = {
+        "ran_at": datetime.fromtimestamp(now, cache_manager.KST).strftime("%Y-%m-%d %H:%M:%S"),
+        "policy": GC_POLICY,
+        "evicted": {"age": 0, "entries": 0, "bytes": 0},
+        "evicted_bytes": 0,
+        "evicted_keys": [],
+        "tmp_removed": 0,
+        "index_orphans": 0,
+        "unindexed_files": 0,
+        "pruned": {},
+    }
+    try:
+        _reconcile(report, now)
+        _prune_retained(report, now)
+
+        # 1) 나이 제한 (hard TTL 보다 짧게 설정돼도 유예 구간 항목은 남김)
+        max_age = max(GC_MAX_AGE, _hard_ttl())
+        _evict(cache_index.keys_saved_before(now - max_age), "age", report)
+
+        # 2) 개수 제한
+        expired_before = now - _hard_ttl()
+        entries, size = cache_index.totals()
+        if entries > GC_MAX_ENTRIES:
+            _evict(cache_index.eviction_order(GC_POLICY, expired_before, entries - GC_MAX_ENTRIES), "entries", report)
+
+        # 3) 용량 제한: 정책 순서로 한도 아래가 될 때까지
+        entries, size = cache_index.totals()
+        if size > GC_MAX_BYTES:
+            victims, excess = [], size - GC_MAX_BYTES
+            for key, key_bytes in cache_index.eviction_order(GC_POLICY, expired_before, entries):
+                if excess <= 0:
+                    break
+                victims.append((key, key_bytes))
+                excess -= key_bytes
+            _evict(victims, "bytes", report)
+
+        entries, size = cache_index.totals()
+        report["remaining"] = {"entries": entries, "bytes": size}
+    finally:
+        lock.release()
+
+    report["duration_ms"] = int((time.perf_counter() - started) * 1000)
+    evicted = sum(report["evicted"].values())
+    _totals["sweeps"] += 1
+    _totals["evicted"] += evicted
+    _totals["evicted_bytes"] += report["evicted_bytes"]
+    _last_report = report
+    if evicted or report["tmp_removed"] or report["index_orphans"] or any(report["pruned"].values()):
+        print(
+            f"[CacheGC] {evicted}개 삭제 ({report['evicted_bytes']:,} B, {report['evicted']}), "
+            f"임시 파일 {report['tmp_removed']}개, 보관 기간 정리 {report['pruned']}, "
+            f"남은 항목 {entries}개 / {size:,} B"
+        )
+    return report
+
+
+async def _loop() -> None:
+    while True:
+        await asyncio.sleep(GC_INTERVAL)
+        try:
+            await asyncio.to_thread(sweep)
+        except Exception as e:
+            print(f"[CacheGC] 정리 실패: {e}")
+
+
+def start_gc() -> None:
+    """주기 정리 시작 (실행 중인 이벤트 루프 필요)"""
+    global _task
+    if not GC_ENABLED or _task is not None:
+        return
+    _task = asyncio.get_running_loop().create_task(_loop())
+
+
+async def stop_gc() -> None:
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
+
+
+def gc_stats() -> dict:
+    return {
+        "enabled": GC_ENABLED,
+        "interval_seconds": GC_INTERVAL,
+        "policy": GC_POLICY,
+        "max_age_seconds": GC_MAX_AGE,
+        "max_entries": GC_MAX_ENTRIES,
+        "max_bytes": GC_MAX_BYTES,
+        "article_retention_seconds": GC_ARTICLE_RETENTION,
+        "window_max_age_seconds": GC_WINDOW_MAX_AGE,
+        **_totals,
+        "last_report": _last_report,
+    }
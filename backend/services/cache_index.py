@@ -0,0 +1,380 @@
+"""
+L2 캐시 파일 색인 (SQLite, 프로세스 간 공유)
+- 키별 저장 시각/만료 시각/파일 크기/적중 횟수/마지막 접근 시각을 save_cache/clear_cache/조회 때 함께 기록
+- 시장별 항목 수·바이트·적중 합계는 트리거로 cache_totals 에 증분 유지 → 통계는 행 1개씩 읽기
+- 만료 시각 = 저장 시각 + 저장 당시 그 키의 TTL (섹터 유입 속도, 호출량 압박 반영)
+  → 유효/유예/만료 개수는 (market, expires_at) 인덱스 범위 COUNT, 가장 오래된 항목은 (market, saved_at) 인덱스
+- 다른 워커가 저장한 시각도 바로 보이므로 get_saved_at() 의 기준으로 사용
+- 명시적 삭제(무효화/전체 삭제)는 cache_invalidations 에 순번과 함께 남겨 다른 워커가 L1 에서도 버리게 함
+- 적중 기록은 요청 경로에서 SQLite 를 쓰지 않도록 메모리에 모았다가 백그라운드 스레드가 주기적으로 일괄 반영
+  (적중 수가 필요한 조회는 직전에 반영)
+- 색인이 없거나 비어 있으면 최초 1회 파일 목록(stat: mtime/size)으로 재구성
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from . import cache_manager
+
+SCHEMA_VERSION = 3
+HIT_FLUSH_INTERVAL = 10.0   # 적중 기록 일괄 반영 주기 (초)
+INVALIDATION_RETENTION = 24 * 3600   # 삭제 기록 보관 기간 (초)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key         TEXT PRIMARY KEY,
+    market      TEXT NOT NULL,              -- KR / US / other (키에서 결정)
+    saved_at    REAL NOT NULL,
+    expires_at  REAL NOT NULL,              -- saved_at + 저장 당시 TTL (soft, 유예 전)
+    bytes       INTEGER NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0,
+    last_access REAL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_market_saved ON cache_entries (market, saved_at);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_market_expires ON cache_entries (market, expires_at);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_hits ON cache_entries (hits);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_saved_at ON cache_entries (saved_at);
+
+CREATE TABLE IF NOT EXISTS cache_invalidations (
+    seq        INTEGER PRIMARY KEY AUTOINCREMENT,
+    key        TEXT,                        -- NULL: 전체 삭제
+    created_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS cache_totals (
+    market  TEXT PRIMARY KEY,
+    entries INTEGER NOT NULL,
+    bytes   INTEGER NOT NULL,
+    hits    INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS cache_entries_ai AFTER INSERT ON cache_entries BEGIN
+    INSERT INTO cache_totals (market, entries, bytes, hits) VALUES (new.market, 1, new.bytes, new.hits)
+    ON CONFLICT (market) DO UPDATE SET
+        entries = entries + 1, bytes = bytes + new.bytes, hits = hits + new.hits;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_entries_ad AFTER DELETE ON cache_entries BEGIN
+    UPDATE cache_totals SET
+        entries = entries - 1, bytes = bytes - old.bytes, hits = hits - old.hits
+    WHERE market = old.market;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_entries_au AFTER UPDATE ON cache_entries BEGIN
+    UPDATE cache_totals SET
+        bytes = bytes - old.bytes + new.bytes, hits = hits - old.hits + new.hits
+    WHERE market = new.market;
+END;
+"""
+
+_local = threading.local()
+
+# 이 프로세스에서 아직 색인에 반영하지 않은 적중 {key: (횟수, 마지막 접근 시각)}
+_pending_hits: Dict[str, Tuple[int, float]] = {}
+_pending_lock = threading.Lock()
+_flusher_pid: Optional[int] = None
+
+
+def market_of(key: str) -> str:
+    """캐시 키 → 시장 (us_sector_US_IT_1_1 → US, sector_IT_1_1 → KR)"""
+    if key.startswith("us_sector_"):
+        return "US"
+    if key.startswith("sector_"):
+        return "KR"
+    return "other"
+
+
+def _db_path() -> str:
+    cache_manager._ensure_cache_dir()
+    return os.path.join(cache_manager.CACHE_DIR, "cache_index.db")
+
+
+def _conn() -> sqlite3.Connection:
+    """스레드별 연결 (WAL: 여러 프로세스가 동시에 읽고 한 번에 하나씩 씀)"""
+    path = _db_path()
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != path:
+        conn = sqlite3.connect(path, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            # 색인은 파일에서 다시 만들 수 있으므로 이전 형식은 버리고 재구성
+            conn.executescript(
+                "DROP TABLE IF EXISTS cache_entries; DROP TABLE IF EXISTS cache_totals;"
+            )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        _local.conn, _local.path = conn, path
+        if conn.execute("SELECT 1 FROM cache_entries LIMIT 1").fetchone() is None:
+            _rebuild(conn)
+    return conn
+
+
+def _rebuild(conn: sqlite3.Connection) -> int:
+    """캐시 폴더의 *.json 파일 목록으로 색인 재구성 (파일 내용은 읽지 않고 mtime 을 저장 시각으로 사용)"""
+    rows = []
+    with os.scandir(cache_manager.CACHE_DIR) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(".json"):
+                st = entry.stat()
+                key = entry.name[:-len(".json")]
+                ttl = cache_manager.get_ttl(st.st_mtime, market=market_of(key), key=key)
+                rows.append((key, market_of(key), st.st_mtime, st.st_mtime + ttl, st.st_size))
+    with conn:
+        conn.execute("DELETE FROM cache_entries")
+        conn.execute("DELETE FROM cache_totals")
+        conn.executemany(
+            "INSERT INTO cache_entries (key, market, saved_at, expires_at, bytes) VALUES (?, ?, ?, ?, ?)", rows
+        )
+    if rows:
+        print(f"[CacheIndex] 캐시 파일 {len(rows)}개로 색인 재구성")
+    return len(rows)
+
+
+def rebuild_index() -> int:
+    """색인을 파일 목록 기준으로 다시 만듦 (외부에서 파일을 직접 지운 경우 등)"""
+    try:
+        return _rebuild(_conn())
+    except (sqlite3.Error, OSError) as e:
+        print(f"[CacheIndex] 재구성 오류: {e}")
+        return 0
+
+
+def record(key: str, saved_at: float, size: int, ttl: int) -> None:
+    """저장 기록 (ttl: 저장 당시 이 키의 TTL, 적중 횟수는 키가 다시 저장되어도 누적)"""
+    try:
+        conn = _conn()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO cache_entries (key, market, saved_at, expires_at, bytes) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    saved_at = excluded.saved_at, expires_at = excluded.expires_at, bytes = excluded.bytes
+                """,
+                (key, market_of(key), saved_at, saved_at + ttl, size),
+            )
+    except sqlite3.Error as e:
+        print(f"[CacheIndex] 기록 오류 ({key}): {e}")
+
+
+def remove(key: Optional[str] = None) -> None:
+    """키 하나 또는 (key=None) 전체 색인 삭제"""
+    with _pending_lock:
+        if key:
+            _pending_hits.pop(key, None)
+        else:
+            _pending_hits.clear()
+    try:
+        conn = _conn()
+        with conn:
+            if key:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            else:
+                conn.execute("DELETE FROM cache_entries")
+                conn.execute("DELETE FROM cache_totals")
+    except sqlite3.Error as e:
+        print(f"[CacheIndex] 삭제 오류 ({key or '전체'}): {e}")
+
+
+def _ensure_flusher() -> None:
+    """일괄 반영 스레드 시작 (프로세스마다 1개, fork 된 워커에서는 새로 시작) (_pending_lock 보유 상태)"""
+    global _flusher_pid
+    if _flusher_pid == os.getpid():
+        return
+    if _flusher_pid is None:
+        atexit.register(flush_hits)
+    _flusher_pid = os.getpid()
+    threading.Thread(target=_flush_loop, name="cache-hit-flush", daemon=True).start()
+
+
+def _flush_loop() -> None:
+    while True:
+        time.sleep(HIT_FLUSH_INTERVAL)
+        flush_hits()
+
+
+def note_hit(key: str) -> None:
+    """캐시 적중 기록 (메모리에만 기록, 백그라운드 스레드가 HIT_FLUSH_INTERVAL 마다 일괄 반영)"""
+    now = time.time()
+    with _pending_lock:
+        _ensure_flusher()
+        count, _ = _pending_hits.get(key, (0, now))
+        _pending_hits[key] = (count + 1, now)
+
+
+def flush_hits() -> None:
+    """모아 둔 적중 기록을 색인에 반영 (색인에 없는 키는 무시)"""
+    with _pending_lock:
+        pending = list(_pending_hits.items())
+        _pending_hits.clear()
+    if not pending:
+        return
+    try:
+        conn = _conn()
+        with conn:
+            conn.executemany(
+                """
+                UPDATE cache_entries SET hits = hits + ?, last_access = MAX(COALESCE(last_access, 0), ?)
+                WHERE key = ?
+                """,
+                [(count, last, key) for key, (count, last) in pending],
+            )
+    except sqlite3.Error as e:
+        print(f"[CacheIndex] 적중 기록 오류: {e}")
+
+
+def log_invalidation(keys: Optional[List[str]]) -> None:
+    """명시적 삭제 기록 (keys=None 이면 전체). 오래된 기록은 함께 정리"""
+    now = time.time()
+    try:
+        conn = _conn()
+        with conn:
+            conn.executemany(
+                "INSERT INTO cache_invalidations (key, created_at) VALUES (?, ?)",
+                [(key, now) for key in (keys if keys is not None else [None])],
+            )
+            conn.execute(
+                "DELETE FROM cache_invalidations WHERE created_at < ?", (now - INVALIDATION_RETENTION,)
+            )
+    except sqlite3.Error as e:
+        print(f"[CacheIndex] 삭제 기록 오류: {e}")
+
+
+def invalidations_since(seq: Optional[int]) -> Tuple[int, List[Optional[str]]]:
+    """
+    seq 이후의 삭제 기록 → (마지막 순번, 삭제된 키 목록 — None 은 전체 삭제).
+    seq=None 이면 현재 순번만 반환 (처음 동기화할 때).
+    """
+    conn = _conn()
+    if seq is None:
+        return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM cache_invalidations").fetchone()[0], []
+    rows = conn.execute(
+        "SELECT seq, key FROM cache_invalidations WHERE seq > ? ORDER BY seq", (seq,)
+    ).fetchall()
+    return (rows[-1][0] if rows else seq), [key for _, key in rows]
+
+
+def saved_at(key: str) -> Optional[float]:
+    """색인에 기록된 저장 시각 (없으면 None, 색인 오류 시 예외)"""
+    row = _conn().execute("SELECT saved_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def hits_for(keys: List[str]) -> Dict[str, int]:
+    """키별 누적 적중 횟수 (색인에 없는 키는 0)"""
+    flush_hits()
+    placeholders = ",".join("?" * len(keys))
+    rows = _conn().execute(
+        f"SELECT key, hits FROM cache_entries WHERE key IN ({placeholders})", keys
+    ).fetchall() if keys else []
+    found = dict(rows)
+    return {key: found.get(key, 0) for key in keys}
+
+
+def totals() -> Tuple[int, int]:
+    """(전체 항목 수, 전체 바이트) — cache_totals 합계"""
+    row = _conn().execute("SELECT COALESCE(SUM(entries), 0), COALESCE(SUM(bytes), 0) FROM cache_totals").fetchone()
+    return row[0], row[1]
+
+
+def market_totals() -> Dict[str, Tuple[int, int]]:
+    """시장별 (항목 수, 바이트) — cache_totals 행 그대로"""
+    rows = _conn().execute("SELECT market, entries, bytes FROM cache_totals").fetchall()
+    return {market: (entries, size) for market, entries, size in rows}
+
+
+def keys_saved_before(before: float) -> List[Tuple[str, int]]:
+    """저장 시각이 before 이전인 (키, 바이트) 목록 (오래된 순)"""
+    return _conn().execute(
+        "SELECT key, bytes FROM cache_entries WHERE saved_at < ? ORDER BY saved_at", (before,)
+    ).fetchall()
+
+
+def eviction_order(policy: str, expired_before: float, limit: int) -> List[Tuple[str, int]]:
+    """
+    용량 초과 시 삭제 순서 (키, 바이트). 만료된 항목을 먼저, 그다음 정책 순서.
+    lru: 마지막 접근(없으면 저장 시각)이 오래된 순 / lfu: 적중 횟수가 적은 순 (동률이면 lru)
+    """
+    flush_hits()
+    recency = "COALESCE(last_access, saved_at)"
+    order = f"hits, {recency}" if policy == "lfu" else recency
+    return _conn().execute(
+        f"""
+        SELECT key, bytes FROM cache_entries
+        ORDER BY (saved_at < ?) DESC, {order}
+        LIMIT ?
+        """,
+        (expired_before, limit),
+    ).fetchall()
+
+
+def indexed_keys() -> List[str]:
+    return [row[0] for row in _conn().execute("SELECT key FROM cache_entries")]
+
+
+def keys_with_prefix(prefix: str) -> List[str]:
+    """prefix 로 시작하는 키 (기본 키 범위 조회, LIKE 와이드카드 '_' 문제 없음)"""
+    if not prefix:
+        return indexed_keys()
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return [
+        row[0] for row in _conn().execute(
+            "SELECT key FROM cache_entries WHERE key >= ? AND key < ? ORDER BY key", (prefix, upper)
+        )
+    ]
+
+
+def summarize(now: float, grace: int, top: int = 5) -> dict:
+    """
+    시장별 항목 수/바이트/적중 합계 (cache_totals, 증분 유지) +
+    유효/유예(stale)/만료 개수와 가장 오래된 항목 나이 ((market, expires_at)/(market, saved_at) 인덱스 범위 조회)
+    """
+    flush_hits()
+    conn = _conn()
+    markets: Dict[str, dict] = {}
+    for market, entries, size, hits in conn.execute(
+        "SELECT market, entries, bytes, hits FROM cache_totals WHERE entries > 0 ORDER BY market"
+    ):
+        valid = conn.execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE market = ? AND expires_at >= ?", (market, now)
+        ).fetchone()[0]
+        not_expired = conn.execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE market = ? AND expires_at >= ?", (market, now - grace)
+        ).fetchone()[0]
+        oldest = conn.execute(
+            "SELECT MIN(saved_at) FROM cache_entries WHERE market = ?", (market,)
+        ).fetchone()[0]
+        markets[market] = {
+            "entries": entries,
+            "valid": valid,
+            "stale": not_expired - valid,
+            "expired": entries - not_expired,
+            "bytes": size,
+            "hits": hits,
+            "oldest_entry_age_seconds": round(now - oldest) if oldest is not None else None,
+        }
+
+    top_keys: List[dict] = [
+        {"key": key, "hits": hits, "last_access": last_access}
+        for key, hits, last_access in conn.execute(
+            "SELECT key, hits, last_access FROM cache_entries WHERE hits > 0 ORDER BY hits DESC LIMIT ?",
+            (top,),
+        )
+    ]
+
+    ages = [m["oldest_entry_age_seconds"] for m in markets.values() if m["oldest_entry_age_seconds"] is not None]
+    total = sum(m["entries"] for m in markets.values())
+    valid = sum(m["valid"] for m in markets.values())
+    stale = sum(m["stale"] for m in markets.values())
+    return {
+        "total_files": total,
+        "valid": valid,
+        "stale": stale,
+        "expired": total - valid - stale,
+        "total_bytes": sum(m["bytes"] for m in markets.values()),
+        "oldest_entry_age_seconds": max(ages) if ages else None,
+        "markets": markets,
+        "top_keys": top_keys,
+    }
@@ -1,15 +1,28 @@
 """
 캐시 관리자 - 네이버 API 일일 2,500회 제한 대응
-전략: 파일 기반 TTL 캐시
+전략: 2단계 TTL 캐시
+- L1: 프로세스 메모리 LRU (검증된 SectorNewsResult 객체를 그대로 보관)
+- L2: 키별 JSON 파일 (재시작 후 복구 + 워커 간 공유, serializer 로 compact 직렬화)
+  임시 파일에 쓴 뒤 rename 으로 교체 → 다른 워커/스레드가 쓰다 만 파일을 읽지 않음
+  저장 시각/크기/적중 횟수는 SQLite 색인(cache_index)에 함께 기록 → 통계·저장 시각 조회에 파일을 열지 않음
 - 장중 (09:00~15:30 KST): TTL 30분
 - 장외 시간: TTL 60분
+- TTL(soft) 이 지나도 유예 시간(hard TTL) 안이면 기존 값을 즉시 반환하고
+  백그라운드에서 재검증 (stale-while-revalidate)
+- 섹터 키는 섹터별 기사 유입 속도에 맞춘 TTL 사용 (sector_velocity, 시장 기본 TTL 의 일정 배수 안)
+- 네이버 일일 호출량이 한도에 가까워지면 KR 키의 TTL 을 naver_quota.ttl_multiplier() 배로 늘림
 """
 
 import os
-import json
 import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Any
+from typing import Optional, Any, Callable, List, Tuple
+
+from . import cache_index, metrics, naver_quota, sector_velocity, serializer, tracing
 
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "cache")
 
@@ -20,14 +33,37 @@ KST = timezone(timedelta(hours=9))
 MARKET_HOURS_TTL = 30 * 60    # 장중: 30분
 OFF_HOURS_TTL    = 60 * 60    # 장외: 60분
 
+# stale-while-revalidate 유예 시간: soft TTL(get_ttl) 이후 이 시간까지는 기존 값 제공
+STALE_GRACE = int(os.getenv("CACHE_STALE_GRACE", str(30 * 60)))   # 초
+REVALIDATE_WORKERS = int(os.getenv("CACHE_REVALIDATE_WORKERS", "2"))
+
+# L1 (메모리) 캐시 한도
+L1_MAX_ENTRIES = int(os.getenv("CACHE_L1_MAX_ENTRIES", "512"))
+L1_MAX_AGE     = int(os.getenv("CACHE_L1_MAX_AGE", str(OFF_HOURS_TTL + STALE_GRACE)))   # 초
+# 다른 워커의 무효화를 L1 에 반영하는 주기 (초, 색인의 삭제 기록 조회 1회)
+L1_SYNC_SECONDS = float(os.getenv("CACHE_L1_SYNC_SECONDS", "1"))
+
 
 def _ensure_cache_dir():
     os.makedirs(CACHE_DIR, exist_ok=True)
 
 
-def is_market_hours() -> bool:
-    """한국 주식 시장 운영 시간 (평일 09:00 ~ 15:30 KST) 여부 반환"""
-    now = datetime.now(KST)
+def cache_subdir(name: str) -> str:
+    """
+    캐시 항목이 아닌 부가 데이터(잠금 파일, 섹터 윈도우, 분석 결과 로그)를 둘 CACHE_DIR 하위 폴더 (없으면 생성).
+    clear_cache() 는 CACHE_DIR 바로 아래의 *.json 만 지우므로 하위 폴더 파일은 캐시 비우기에 지워지지 않음.
+    """
+    directory = os.path.join(CACHE_DIR, name)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def is_market_hours(ts: Optional[float] = None) -> bool:
+    """
+    한국 주식 시장 운영 시간 (평일 09:00 ~ 15:30 KST) 여부 반환.
+    ts: 판정할 시각 (epoch 초, 기본값 현재)
+    """
+    now = datetime.now(KST) if ts is None else datetime.fromtimestamp(ts, KST)
     if now.weekday() >= 5:   # 토(5), 일(6)
         return False
     market_open  = now.replace(hour=9,  minute=0,  second=0, microsecond=0)
@@ -35,9 +71,133 @@ def is_market_hours() -> bool:
     return market_open <= now <= market_close
 
 
-def get_ttl() -> int:
-    """현재 시장 상황에 따른 TTL 반환 (초)"""
-    return MARKET_HOURS_TTL if is_market_hours() else OFF_HOURS_TTL
+def _ttl_scale(market: Optional[str]) -> float:
+    """네이버 호출량 압박 시 KR TTL 배수 (US 는 호출 제한이 없어 항상 1)"""
+    return naver_quota.ttl_multiplier() if market == "KR" else 1.0
+
+
+def get_ttl(ts: Optional[float] = None, market: Optional[str] = None, key: Optional[str] = None) -> int:
+    """
+    현재(또는 ts 시점) 시장 상황에 따른 TTL 반환 (초).
+    key 가 섹터 캐시 키면 그 섹터의 기사 유입 속도에 맞춘 TTL,
+    market="KR" 이면 여기에 네이버 호출량 압박 배수까지 적용.
+    """
+    ttl = MARKET_HOURS_TTL if is_market_hours(ts) else OFF_HOURS_TTL
+    if key is not None:
+        ttl = sector_velocity.sector_ttl(sector_velocity.sector_of_key(key), ttl)
+    return int(ttl * _ttl_scale(market))
+
+
+def max_ttl() -> int:
+    """지금 어떤 키에 적용될 수 있는 가장 긴 TTL (정리 작업이 아직 쓰이는 항목을 만료로 보지 않도록)"""
+    return int(get_ttl(market="KR") * max(sector_velocity.SECTOR_TTL_MAX_FACTOR, 1.0))
+
+
+def _next_market_open(ts: float) -> float:
+    """ts 이후 가장 가까운 장 시작 시각 (평일 09:00 KST)"""
+    now = datetime.fromtimestamp(ts, KST)
+    opening = now.replace(hour=9, minute=0, second=0, microsecond=0)
+    if opening <= now:
+        opening += timedelta(days=1)
+    while opening.weekday() >= 5:
+        opening += timedelta(days=1)
+    return opening.timestamp()
+
+
+def expires_at(saved_at: float, market: Optional[str] = None, key: Optional[str] = None) -> float:
+    """
+    saved_at 에 저장된 캐시가 실제로 만료되는 시각 (epoch 초).
+    장외 TTL 도중 09:00 이 되면 장중 TTL 이 적용되어 개장 시각에 바로 만료된다.
+    market / key 는 get_ttl 과 같은 의미 (섹터 유입 속도, 네이버 호출량 압박 반영).
+    """
+    scale = _ttl_scale(market)
+    sector_id = sector_velocity.sector_of_key(key) if key is not None else None
+    market_ttl = sector_velocity.sector_ttl(sector_id, MARKET_HOURS_TTL)
+    off_ttl = sector_velocity.sector_ttl(sector_id, OFF_HOURS_TTL)
+    market_expiry = saved_at + market_ttl * scale
+    if is_market_hours(market_expiry):
+        return market_expiry
+    return min(_next_market_open(market_expiry), saved_at + off_ttl * scale)
+
+
+class _MemoryCache:
+    """크기/나이 제한이 있는 LRU (L1). 값과 함께 원본 saved_at 을 보관해 TTL 판정을 L2 와 맞춘다."""
+
+    def __init__(self, max_entries: int, max_age: int) -> None:
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] > self.max_age:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, saved_at: float, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (saved_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def keys(self, prefix: str = "") -> list:
+        with self._lock:
+            return [k for k in self._entries if k.startswith(prefix)]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_l1 = _MemoryCache(L1_MAX_ENTRIES, L1_MAX_AGE)
+
+# 마지막으로 L1 에 반영한 삭제 기록 위치 (CACHE_DIR 별)
+_l1_sync_lock = threading.Lock()
+_l1_sync = {"dir": None, "seq": None, "at": 0.0}
+
+# 계층별 적중/미스 카운터
+_tier_counters = {
+    "l1_hits": 0,
+    "l1_misses": 0,
+    "l2_hits": 0,
+    "l2_misses": 0,
+    "stale_hits": 0,
+    "revalidations": 0,
+}
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    saved_at: float
+    is_stale: bool    # soft TTL 경과 (유예 구간) → 재검증 필요
+
+
+def _count(name: str, key: str) -> None:
+    _tier_counters[name] += 1
+    metrics.record_cache_event(cache_index.market_of(key), name)
+    tracing.annotate(name)
+
+
+def _to_plain(value: Any) -> Any:
+    """Pydantic 모델이면 dict 로 변환 (L2 저장 / model 미지정 호출용)"""
+    return value.model_dump() if hasattr(value, "model_dump") else value
 
 
 def _cache_path(key: str) -> str:
@@ -47,86 +207,326 @@ def _cache_path(key: str) -> str:
     return os.path.join(CACHE_DIR, f"{safe_key}.json")
 
 
-def load_cache(key: str) -> Optional[Any]:
-    """
-    캐시에서 데이터 로드.
-    만료된 경우 None 반환.
-    """
+def _read_file(key: str) -> Optional[dict]:
+    """L2 파일 원본 payload ({"saved_at", "data"}) 읽기"""
     path = _cache_path(key)
     if not os.path.exists(path):
         return None
+    with open(path, "rb") as f:
+        return serializer.loads(f.read())
+
+
+def load_cache_entry(key: str, model: Optional[type] = None) -> Optional[CacheEntry]:
+    """
+    캐시 항목 로드 (L1 → L2 순서).
+    soft TTL 이내면 is_stale=False, 유예 구간이면 is_stale=True, hard TTL 경과 시 None.
+    model: 지정 시 해당 Pydantic 모델 객체로 반환하고, 검증된 객체를 L1 에 보관
+           (다음 적중부터는 파일 읽기·JSON 파싱·재검증 없이 반환)
+    """
+    entry = _load_entry(key, model)
+    if entry is not None:
+        cache_index.note_hit(key)   # 키별 적중 횟수/마지막 접근 (색인에 주기적으로 반영)
+    return entry
+
+
+def _sync_l1() -> None:
+    """다른 워커가 무효화/전체 삭제한 키를 L1 에서 버림 (L1_SYNC_SECONDS 마다 한 번)"""
+    if _l1_sync["dir"] == CACHE_DIR and time.monotonic() - _l1_sync["at"] < L1_SYNC_SECONDS:
+        return
+    with _l1_sync_lock:
+        if _l1_sync["dir"] == CACHE_DIR and time.monotonic() - _l1_sync["at"] < L1_SYNC_SECONDS:
+            return
+        seq = _l1_sync["seq"] if _l1_sync["dir"] == CACHE_DIR else None
+        try:
+            seq, keys = cache_index.invalidations_since(seq)
+        except Exception as e:
+            print(f"[CacheManager] 삭제 기록 조회 오류: {e}")
+            keys = []
+        if None in keys:
+            _l1.clear()
+        else:
+            for key in keys:
+                _l1.pop(key)
+        _l1_sync.update(dir=CACHE_DIR, seq=seq, at=time.monotonic())
+
+
+def _load_entry(key: str, model: Optional[type]) -> Optional[CacheEntry]:
+    _sync_l1()
+    now = time.time()
+    ttl = get_ttl(market=cache_index.market_of(key), key=key)
+    hard_ttl = ttl + STALE_GRACE
+
+    stale_entry: Optional[CacheEntry] = None
+    entry = _l1.get(key)
+    if entry is not None:
+        saved_at, value = entry
+        age = now - saved_at
+        if age <= hard_ttl:
+            if model is None:
+                value = _to_plain(value)
+            elif not isinstance(value, model):
+                with metrics.stage("validate"):
+                    value = model(**value)
+                _l1.put(key, saved_at, value)
+            if age <= ttl:
+                _count("l1_hits", key)
+                return CacheEntry(value, saved_at, is_stale=False)
+            # 유예 구간: 다른 워커가 이미 갱신해 둔 L2 가 있으면 그쪽을 사용
+            stale_entry = CacheEntry(value, saved_at, is_stale=True)
+        else:
+            _l1.pop(key)
+    _count("l1_misses", key)
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            cached = json.load(f)
+        with metrics.stage("cache_read"):
+            cached = _read_file(key)
+        if cached is None:
+            _count("l2_misses", key)
+            return stale_entry
 
         saved_at = cached.get("saved_at", 0)
-        ttl = get_ttl()
-        if time.time() - saved_at > ttl:
-            return None   # 캐시 만료
+        age = now - saved_at
+        if age > hard_ttl or (stale_entry is not None and saved_at <= stale_entry.saved_at):
+            _count("l2_misses", key)
+            return stale_entry   # 캐시 만료 (유예 시간 포함) 또는 L1 과 같은 값
 
-        return cached.get("data")
+        _count("l2_hits", key)
+        data = cached.get("data")
+        if model is not None and data is not None:
+            with metrics.stage("validate"):
+                value = model.model_validate(data)
+        else:
+            value = data
+        _l1.put(key, saved_at, value)
+        return CacheEntry(value, saved_at, is_stale=age > ttl)
 
     except Exception as e:
+        _count("l2_misses", key)
         print(f"[CacheManager] 캐시 읽기 오류 ({key}): {e}")
+        return stale_entry
+
+
+def load_cache(key: str, model: Optional[type] = None) -> Optional[Any]:
+    """
+    캐시에서 데이터 로드.
+    만료된 경우 None 반환 (유예 구간의 stale 값도 None).
+    """
+    entry = load_cache_entry(key, model)
+    if entry is None or entry.is_stale:
+        return None
+    return entry.value
+
+
+def load_cache_since(key: str, since: float, model: Optional[type] = None) -> Optional[Any]:
+    """
+    since 이후에 (어느 워커에서든) 저장된 캐시만 반환.
+    키 잠금을 기다리는 동안 다른 워커가 갱신을 끝냈는지 확인하는 용도 (강제 갱신 중복 방지).
+    """
+    saved_at = get_saved_at(key)
+    if saved_at is None or saved_at < since:
+        return None
+    entry = _l1.get(key)
+    if entry is not None and entry[0] < saved_at:
+        _l1.pop(key)   # 다른 워커가 저장한 L2 가 더 최신
+    return load_cache(key, model)
+
+
+def load_cache_swr(key: str, model: Optional[type], revalidate: Callable[[], Any]) -> Optional[Any]:
+    """
+    stale-while-revalidate 로드.
+    - soft TTL 이내: 값 반환
+    - 유예 구간: stale 값을 즉시 반환하고 revalidate 를 백그라운드에 예약
+    - hard TTL 경과: None (호출자가 동기 조회)
+    """
+    entry = load_cache_entry(key, model)
+    if entry is None:
         return None
+    if entry.is_stale:
+        _count("stale_hits", key)
+        schedule_revalidation(key, revalidate)
+    return entry.value
+
+
+_revalidate_executor = ThreadPoolExecutor(
+    max_workers=REVALIDATE_WORKERS, thread_name_prefix="cache-revalidate"
+)
+_revalidating: set = set()
+_revalidating_lock = threading.Lock()
+
+
+def schedule_revalidation(key: str, fn: Callable[[], Any]) -> bool:
+    """
+    stale 항목 백그라운드 재검증 예약.
+    같은 키가 이미 대기/실행 중이면 무시하고 False 반환.
+    워커 수(CACHE_REVALIDATE_WORKERS)로 동시 업스트림 호출을 제한한다.
+    """
+    with _revalidating_lock:
+        if key in _revalidating:
+            return False
+        _revalidating.add(key)
+    _count("revalidations", key)
+
+    def _run():
+        try:
+            fn()
+        except Exception as e:
+            print(f"[CacheManager] 재검증 실패 ({key}): {e}")
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(key)
+
+    _revalidate_executor.submit(_run)
+    return True
 
 
 def save_cache(key: str, data: Any) -> None:
-    """데이터를 캐시에 저장"""
+    """
+    데이터를 캐시에 저장 (L1 + L2).
+    Pydantic 모델을 넘기면 L1 에는 객체 그대로, L2 에는 model_dump_json 결과를 그대로 감싸 저장
+    (dict 변환 없이 직렬화 1회).
+    """
     path = _cache_path(key)
+    saved_at = time.time()
+    _l1.put(key, saved_at, data)
     try:
-        payload = {
-            "saved_at": time.time(),
-            "data": data
-        }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        with metrics.stage("cache_write"):
+            body = b"".join([
+                b'{"saved_at":', serializer.dumps(saved_at),
+                b',"data":', serializer.dumps(data), b"}",
+            ])
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
     except Exception as e:
         print(f"[CacheManager] 캐시 저장 오류 ({key}): {e}")
+        return
+    ttl = get_ttl(saved_at, market=cache_index.market_of(key), key=key)
+    cache_index.record(key, saved_at, len(body), ttl)
+
+
+def get_saved_at(key: str) -> Optional[float]:
+    """캐시 저장 시각 반환 (만료 여부와 무관, 없으면 None). 다른 워커의 저장도 반영"""
+    try:
+        return cache_index.saved_at(key)
+    except Exception as e:
+        print(f"[CacheManager] 색인 조회 오류 ({key}): {e}")
+    entry = _l1.get(key)
+    if entry is not None:
+        return entry[0]
+    try:
+        cached = _read_file(key)
+        return cached.get("saved_at") if cached else None
+    except Exception:
+        return None
 
 
 def clear_cache(key: Optional[str] = None) -> None:
     """
-    특정 키 또는 전체 캐시 삭제.
+    특정 키 또는 전체 캐시 삭제 (L1 + L2).
     key=None 이면 전체 삭제.
     """
     _ensure_cache_dir()
     if key:
+        _l1.pop(key)
         path = _cache_path(key)
         if os.path.exists(path):
             os.remove(path)
+        cache_index.remove(key)
     else:
+        _l1.clear()
         for filename in os.listdir(CACHE_DIR):
             if filename.endswith(".json"):
                 os.remove(os.path.join(CACHE_DIR, filename))
+        cache_index.remove()
+        cache_index.log_invalidation(None)
         print("[CacheManager] 전체 캐시 삭제 완료")
 
 
+def matching_keys(prefix: str) -> List[str]:
+    """prefix 로 시작하는 캐시 키 (색인 + 이 프로세스의 L1)"""
+    keys = set(_l1.keys(prefix))
+    try:
+        keys.update(cache_index.keys_with_prefix(prefix))
+    except Exception as e:
+        print(f"[CacheManager] 색인 조회 오류 ({prefix}): {e}")
+    return sorted(keys)
+
+
+def invalidate(keys: List[str]) -> List[str]:
+    """
+    키 목록을 L1/L2/색인에서 삭제하고 실제로 있던 키만 반환.
+    다른 워커도 L1 에서 버리도록 삭제 기록을 남긴다 (GC 의 만료/용량 삭제는 L1 사본이 유효하므로 기록하지 않음)
+    """
+    removed = []
+    for key in keys:
+        existed = _l1.get(key) is not None or os.path.exists(_cache_path(key))
+        try:
+            clear_cache(key)
+        except OSError as e:   # 다른 워커가 먼저 지운 경우 등
+            print(f"[CacheManager] 캐시 삭제 오류 ({key}): {e}")
+            continue
+        if existed:
+            removed.append(key)
+    if keys:
+        cache_index.log_invalidation(keys)
+    return removed
+
+
+def _hit_ratio(hits: int, misses: int) -> Optional[float]:
+    total = hits + misses
+    return round(hits / total, 3) if total else None
+
+
+def tier_stats() -> dict:
+    """계층별 캐시 적중 통계"""
+    c = dict(_tier_counters)
+    return {
+        "l1": {
+            "entries": len(_l1),
+            "max_entries": _l1.max_entries,
+            "max_age_seconds": _l1.max_age,
+            "hits": c["l1_hits"],
+            "misses": c["l1_misses"],
+            "hit_ratio": _hit_ratio(c["l1_hits"], c["l1_misses"]),
+            "evictions": _l1.evictions,
+        },
+        "l2": {
+            "hits": c["l2_hits"],
+            "misses": c["l2_misses"],
+            "hit_ratio": _hit_ratio(c["l2_hits"], c["l2_misses"]),
+        },
+        "stale": {
+            "grace_minutes": STALE_GRACE // 60,
+            "stale_hits": c["stale_hits"],
+            "revalidations": c["revalidations"],
+            "revalidating": len(_revalidating),
+        },
+    }
+
+
 def cache_stats() -> dict:
-    """캐시 현황 통계 반환"""
-    _ensure_cache_dir()
-    files = [f for f in os.listdir(CACHE_DIR) if f.endswith(".json")]
+    """
+    캐시 현황 통계 반환 (색인에서 집계, 캐시 파일은 열지 않음).
+    유효/유예/만료는 색인의 키별 만료 시각(저장 당시 TTL: 섹터 유입 속도, KR 호출량 압박 배수 반영)으로 판정.
+    hit_ratio: 이 프로세스의 전체 조회 중 L1 또는 L2 에서 값을 찾은 비율
+    """
     ttl = get_ttl()
-    now = time.time()
-    valid = 0
-    expired = 0
-    for filename in files:
-        path = os.path.join(CACHE_DIR, filename)
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                cached = json.load(f)
-            if now - cached.get("saved_at", 0) <= ttl:
-                valid += 1
-            else:
-                expired += 1
-        except Exception:
-            expired += 1
+    try:
+        summary = cache_index.summarize(time.time(), STALE_GRACE)
+    except Exception as e:
+        print(f"[CacheManager] 색인 집계 오류: {e}")
+        summary = {
+            "total_files": 0, "valid": 0, "stale": 0, "expired": 0, "total_bytes": 0,
+            "oldest_entry_age_seconds": None, "markets": {}, "top_keys": [],
+        }
 
+    c = dict(_tier_counters)
     return {
-        "total_files": len(files),
-        "valid": valid,
-        "expired": expired,
+        **summary,
+        "hit_ratio": _hit_ratio(c["l1_hits"] + c["l2_hits"], c["l2_misses"]),
         "current_ttl_minutes": ttl // 60,
+        "kr_ttl_minutes": get_ttl(market="KR") // 60,
         "is_market_hours": is_market_hours(),
+        "tiers": tier_stats(),
     }
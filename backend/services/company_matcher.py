@@ -0,0 +1,137 @@
+"""
+섹터 기업명 매칭기
+- 기사는 한 섹터 사전으로만 매칭하므로 섹터별로 따로 준비 (다른 섹터 패턴 비용을 내지 않음)
+- 섹터 패턴(기업명+별칭)이 기준 개수 이상이면 Aho–Corasick 오토마톤으로 컴파일해 제목+설명을 한 번만 훑고,
+  그보다 적으면 패턴별 부분 문자열 검사(str 의 C 구현)가 더 빠르므로 그대로 사용
+  기준: COMPANY_MATCHER_AUTOMATON_MIN, 미설정 시 구현별 측정값 (backend/bench/bench_company_matcher.py)
+- 제목 매칭에 더 높은 점수 부여
+- COMPANY_DICT_PATH(JSON)로 상장사 전체 목록·별칭을 추가 로드 가능
+  {"sectors": {"IT_1": ["삼성전자", ...]}, "aliases": {"삼전": "삼성전자"}}
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from .aho_corasick import AhoCorasick
+
+TITLE_WEIGHT       = 3   # 제목 매칭 1회 점수
+DESCRIPTION_WEIGHT = 1   # 설명 매칭 1회 점수
+# 섹터 패턴 수가 이 값 이상이면 오토마톤 사용 (빈 값이면 pyahocorasick 25, 순수 파이썬 200)
+AUTOMATON_MIN_PATTERNS = os.getenv("COMPANY_MATCHER_AUTOMATON_MIN", "")
+NATIVE_AUTOMATON_MIN   = 25
+PYTHON_AUTOMATON_MIN   = 200
+
+
+def load_company_file(path: str) -> dict:
+    """추가 기업 사전 파일 로드 (없거나 잘못된 파일이면 빈 사전)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"[CompanyMatcher] 사전 파일 로드 실패 ({path}): {e}")
+        return {"sectors": {}, "aliases": {}}
+    return {
+        "sectors": data.get("sectors", {}),
+        "aliases": data.get("aliases", {}),
+    }
+
+
+class CompanyMatcher:
+    def __init__(
+        self,
+        sector_companies: Dict[str, List[str]],
+        aliases: Optional[Dict[str, str]] = None,
+        use_native: bool = True,
+        automaton_min: Optional[int] = None,
+    ) -> None:
+        self._native = AhoCorasick(use_native=use_native).backend
+        if automaton_min is None:
+            default_min = NATIVE_AUTOMATON_MIN if self._native == "pyahocorasick" else PYTHON_AUTOMATON_MIN
+            automaton_min = int(AUTOMATON_MIN_PATTERNS or default_min)
+        # 섹터별 사전 순서 (동점일 때 기존 사전 순서 유지)
+        self._rank: Dict[str, Dict[str, int]] = {}
+        names = set()
+        for sector_id, companies in sector_companies.items():
+            rank = self._rank.setdefault(sector_id, {})
+            for name in companies:
+                rank.setdefault(name, len(rank))
+                names.add(name)
+        aliases = {alias: canonical for alias, canonical in (aliases or {}).items() if alias and alias not in names}
+
+        # 섹터별 (패턴, 기업명): 부분 문자열 검사용 목록 또는 오토마톤
+        self._patterns: Dict[str, List[Tuple[str, str]]] = {}
+        self._automata: Dict[str, AhoCorasick] = {}
+        for sector_id, rank in self._rank.items():
+            patterns = [(name, name) for name in rank]
+            patterns += [(alias, canonical) for alias, canonical in aliases.items() if canonical in rank]
+            if len(patterns) < automaton_min:
+                self._patterns[sector_id] = patterns
+                continue
+            automaton = AhoCorasick(use_native=use_native)
+            for pattern, name in patterns:
+                automaton.add(pattern, name)
+            automaton.build()
+            self._automata[sector_id] = automaton
+
+    @property
+    def pattern_count(self) -> int:
+        return sum(len(p) for p in self._patterns.values()) + sum(len(a) for a in self._automata.values())
+
+    @property
+    def backend(self) -> str:
+        return f"오토마톤({self._native}) {len(self._automata)}개 섹터, 부분 문자열 {len(self._patterns)}개 섹터"
+
+    def match(
+        self,
+        title: str,
+        description: str,
+        sector_id: str,
+        max_count: int = 5,
+    ) -> List[str]:
+        """섹터 사전에 있는 기업명을 점수(제목 > 설명, 출현 횟수) 순으로 최대 max_count개 반환"""
+        rank = self._rank.get(sector_id)
+        if not rank:
+            return []
+
+        scores: Dict[str, int] = {}
+        automaton = self._automata.get(sector_id)
+        if automaton is None:
+            text = f"{title}\n{description}"
+            for pattern, name in self._patterns[sector_id]:
+                if pattern not in text:
+                    continue
+                weight = TITLE_WEIGHT * title.count(pattern) + DESCRIPTION_WEIGHT * description.count(pattern)
+                scores[name] = scores.get(name, 0) + weight
+        else:
+            boundary = len(title)
+            # 제목과 설명 사이 구분 문자(\n)는 기업명에 없으므로 경계를 넘는 매칭이 생기지 않음
+            for start, _end, name in automaton.iter_matches(f"{title}\n{description}"):
+                weight = TITLE_WEIGHT if start < boundary else DESCRIPTION_WEIGHT
+                scores[name] = scores.get(name, 0) + weight
+
+        ranked = sorted(scores, key=lambda n: (-scores[n], rank[n]))
+        return ranked[:max_count]
+
+
+def build_company_matcher(
+    *sector_dicts: Dict[str, List[str]],
+    path: Optional[str] = None,
+) -> CompanyMatcher:
+    """기본 사전들 + (선택) 추가 사전 파일을 합쳐 매칭기 생성"""
+    merged: Dict[str, List[str]] = {}
+    for sector_dict in sector_dicts:
+        for sector_id, companies in sector_dict.items():
+            merged.setdefault(sector_id, []).extend(companies)
+
+    aliases: Dict[str, str] = {}
+    path = path if path is not None else os.getenv("COMPANY_DICT_PATH")
+    if path:
+        extra = load_company_file(path)
+        for sector_id, companies in extra["sectors"].items():
+            merged.setdefault(sector_id, []).extend(companies)
+        aliases.update(extra["aliases"])
+
+    matcher = CompanyMatcher(merged, aliases)
+    print(f"[CompanyMatcher] 기업명 패턴 {matcher.pattern_count}개 컴파일 ({matcher.backend})")
+    return matcher
@@ -0,0 +1,132 @@
+"""
+캐시 키별 프로세스 간 잠금 (fcntl.flock 권고 잠금)
+- uvicorn --workers N 에서 같은 키를 한 프로세스만 업스트림 갱신하도록 함
+- 프로세스 안의 동시 호출은 SingleFlight 가 먼저 하나로 합치므로, 잠금은 워커별 leader 끼리만 경쟁
+- 기다리는 쪽은 잠금을 얻은 뒤 방금 저장된 캐시를 재사용 (호출자 책임)
+- 제한 시간 안에 잠금을 못 얻으면 잠금 없이 진행 (응답 지연보다 중복 호출이 낫다)
+- fcntl 이 없는 플랫폼(Windows)에서는 잠금 없이 동작
+"""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:   # Windows
+    fcntl = None
+
+LOCKING_SUPPORTED = fcntl is not None
+
+from . import cache_manager
+
+KEY_LOCK_TIMEOUT = float(os.getenv("CACHE_KEY_LOCK_TIMEOUT", "60"))   # 초 (AI 분석 포함 갱신 시간보다 길게)
+KEY_LOCK_POLL    = 0.05                                               # 잠금 재시도 간격 (초)
+
+_counters = {"acquired": 0, "contended": 0, "timeouts": 0}
+_counters_lock = threading.Lock()
+
+
+def _count(name: str) -> None:
+    with _counters_lock:
+        _counters[name] += 1
+
+
+def _lock_path(key: str) -> str:
+    safe_key = key.replace("/", "_").replace("\\", "_")
+    return os.path.join(cache_manager.cache_subdir("locks"), f"{safe_key}.lock")
+
+
+class KeyLock:
+    """키 하나의 배타 잠금. 같은 프로세스 안에서도 fd 가 다르면 서로 막는다."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self._fd: Optional[int] = None
+
+    def _try(self) -> bool:
+        fd = os.open(_lock_path(self.key), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def acquire(self, timeout: float = KEY_LOCK_TIMEOUT) -> bool:
+        """잠금 획득 (성공 시 True, 제한 시간 초과 시 False)"""
+        if fcntl is None:
+            return False
+        if self._try():
+            _count("acquired")
+            return True
+        _count("contended")
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(KEY_LOCK_POLL)
+            if self._try():
+                _count("acquired")
+                return True
+        _count("timeouts")
+        return False
+
+    async def acquire_async(self, timeout: float = KEY_LOCK_TIMEOUT) -> bool:
+        """acquire() 의 비동기 버전 (대기 중 이벤트 루프를 막지 않음)"""
+        if fcntl is None:
+            return False
+        if self._try():
+            _count("acquired")
+            return True
+        _count("contended")
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(KEY_LOCK_POLL)
+            if self._try():
+                _count("acquired")
+                return True
+        _count("timeouts")
+        return False
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+@contextmanager
+def key_lock(key: str, timeout: float = KEY_LOCK_TIMEOUT) -> Iterator[bool]:
+    """with key_lock(key) as acquired: ... (acquired=False 면 잠금 없이 진행 중)"""
+    lock = KeyLock(key)
+    acquired = lock.acquire(timeout)
+    try:
+        yield acquired
+    finally:
+        lock.release()
+
+
+@asynccontextmanager
+async def key_lock_async(key: str, timeout: float = KEY_LOCK_TIMEOUT) -> AsyncIterator[bool]:
+    lock = KeyLock(key)
+    acquired = await lock.acquire_async(timeout)
+    try:
+        yield acquired
+    finally:
+        lock.release()
+
+
+def key_lock_stats() -> dict:
+    with _counters_lock:
+        counters = dict(_counters)
+    return {
+        "enabled": LOCKING_SUPPORTED,
+        "timeout_seconds": KEY_LOCK_TIMEOUT,
+        **counters,
+    }
@@ -2,88 +2,171 @@
 히트맵 응답 생성 서비스.
 - KR/US 시장별 섹터 병렬 조회
 - 카테고리별 집계 후 HeatmapResponse 반환
+- 집계 결과는 heatmap_snapshot 에 버전 스냅샷으로 보관하여 요청 경로에서 재사용
+- 재시작 직후에는 기사 저장소(article_store) 쿼리로 스냅샷을 복원
 """
 
 import asyncio
+import contextvars
+import time
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timezone, timedelta
-from typing import List
+from typing import List, Optional
 
 from backend.models.news_schema import (
     SectorNewsResult,
-    CategoryHeatmap,
     HeatmapResponse,
 )
 from backend.services.news_collector import (
     fetch_sector_news,
     fetch_us_sector_news,
+    fetch_sector_news_async,
+    fetch_us_sector_news_async,
+    sector_result_from_store,
     SECTOR_META,
     US_SECTOR_META,
 )
+from backend.services.cache_manager import get_ttl
+from backend.services.heatmap_snapshot import (
+    HeatmapSnapshot,
+    get_snapshot,
+    replace_snapshot,
+)
+from backend.services.single_flight import SingleFlight
+from backend.services.metrics import SECTOR_FAILURES, stage
+
+# 시장별 스냅샷 재구성 중복 실행 방지 (동기/비동기 경로 공용)
+_heatmap_flight = SingleFlight("heatmap")
+
+# 스냅샷 재구성 시 동시에 조회하는 섹터 수 (동기: 스레드 풀 크기, 비동기: 세마포어)
+HEATMAP_FETCH_CONCURRENCY = 10
+
 
-KST = timezone(timedelta(hours=9))
+def _normalize_market(market: str) -> str:
+    return "US" if market.upper() == "US" else "KR"
 
 
 def build_heatmap_response(market: str) -> HeatmapResponse:
     """
-    동기 버전: 현재 FastAPI 라우트가 동기이므로
-    asyncio.run으로 비동기 로직 실행.
+    동기 버전: 스레드 풀에서 섹터를 병렬 조회 (백그라운드 작업 등 이벤트 루프 밖에서 사용).
     """
-    return asyncio.run(_fetch_and_aggregate(market.upper()))
+    market = _normalize_market(market)
+    return _heatmap_flight.do(market, lambda: _fetch_and_aggregate(market))
 
 
 async def build_heatmap_response_async(market: str) -> HeatmapResponse:
-    """비동기 버전 (필요 시 라우트를 async로 변경 후 사용)."""
-    return await _fetch_and_aggregate(market.upper())
+    """비동기 버전: 공용 AsyncClient 로 전체 섹터를 동시에 조회 (라우트용)."""
+    market = _normalize_market(market)
+    return await _heatmap_flight.do_async(market, lambda: _fetch_and_aggregate_async(market))
+
+
+def _seed_snapshot_from_store(market: str) -> Optional[HeatmapSnapshot]:
+    """
+    서버 재시작 직후: 기사 저장소에 전체 섹터가 있으면 쿼리만으로 스냅샷 복원.
+    재구성 시각을 0 으로 두어 첫 요청에서 백그라운드 재구성이 시작되게 한다.
+    """
+    sector_meta = US_SECTOR_META if market == "US" else SECTOR_META
+    sectors = []
+    for sector_id in sector_meta:
+        result = sector_result_from_store(sector_id, 10)
+        if result is None:
+            return None
+        sectors.append(result)
+    return replace_snapshot(market, sectors, refreshed_at=0.0)
+
+
+def get_heatmap_snapshot(market: str) -> HeatmapSnapshot:
+    """
+    스냅샷이 있으면 그대로 반환.
+    아직 없을 때(서버 시작 직후)는 기사 저장소에서 복원하고, 그것도 안 되면 전체 섹터를 조회한다.
+    """
+    market = _normalize_market(market)
+    snapshot = get_snapshot(market) or _seed_snapshot_from_store(market)
+    if snapshot is None:
+        build_heatmap_response(market)
+        snapshot = get_snapshot(market)
+    return snapshot
+
+
+async def get_heatmap_snapshot_async(market: str) -> HeatmapSnapshot:
+    """get_heatmap_snapshot 의 비동기 버전 (요청 경로용)"""
+    market = _normalize_market(market)
+    # 저장소에서 스냅샷을 채우는 쿼리는 이벤트 루프 밖에서
+    snapshot = get_snapshot(market) or await asyncio.to_thread(_seed_snapshot_from_store, market)
+    if snapshot is None:
+        await build_heatmap_response_async(market)
+        snapshot = get_snapshot(market)
+    return snapshot
+
+
+def is_snapshot_stale(snapshot: HeatmapSnapshot) -> bool:
+    """마지막 전체 재구성 이후 TTL이 지났는지 여부 (KR 은 네이버 호출량 압박 시 늘어난 TTL)"""
+    return time.time() - snapshot.refreshed_at > get_ttl(market=snapshot.market)
 
 
-async def _fetch_and_aggregate(market: str) -> HeatmapResponse:
+async def refresh_heatmap_snapshot(market: str) -> None:
+    """
+    스냅샷 전체 재구성 (백그라운드용).
+    만료된 섹터만 실제로 재조회되고, 이미 재구성 중이면 건너뛴다.
+    """
+    market = _normalize_market(market)
+    if _heatmap_flight.in_flight(market):
+        return
+    try:
+        await build_heatmap_response_async(market)
+    except Exception as e:
+        print(f"[Heatmap] 스냅샷 갱신 실패 ({market}): {e}")
+
+
+def _collect_sectors(market: str, sector_ids: List[str], results: list) -> List[SectorNewsResult]:
+    """섹터 결과만 모으고, 예외로 빠진 섹터는 로그 + 지표로 남김 (추적 중이면 섹터 span 에 error 태그)"""
+    sectors = []
+    for sector_id, result in zip(sector_ids, results):
+        if isinstance(result, SectorNewsResult):
+            sectors.append(result)
+        elif isinstance(result, BaseException):
+            SECTOR_FAILURES.inc(market, sector_id)
+            print(f"[Heatmap] 섹터 조회 실패 ({market} {sector_id}): {type(result).__name__}: {result}")
+    return sectors
+
+
+def _fetch_and_aggregate(market: str) -> HeatmapResponse:
     is_us = market == "US"
     sector_meta = US_SECTOR_META if is_us else SECTOR_META
     fetch_fn = fetch_us_sector_news if is_us else fetch_sector_news
 
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        tasks = [
-            loop.run_in_executor(executor, fetch_fn, sector_id, 10)
-            for sector_id in sector_meta
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    all_sectors: List[SectorNewsResult] = [
-        r for r in results
-        if isinstance(r, SectorNewsResult)
-    ]
-
-    if not all_sectors:
-        raise ValueError("뉴스 데이터를 가져올 수 없습니다.")
-
-    category_map: dict = {}
-    for sector in all_sectors:
-        cat_id = sector.category_id
-        if cat_id not in category_map:
-            category_map[cat_id] = {
-                "category_id": cat_id,
-                "category_name": sector.category_name,
-                "sub_sectors": [],
-            }
-        category_map[cat_id]["sub_sectors"].append(sector)
-
-    categories: List[CategoryHeatmap] = []
-    for cat_id, cat_data in category_map.items():
-        subs = cat_data["sub_sectors"]
-        total_vol = sum(s.news_volume for s in subs)
-        avg_rate = sum(s.change_rate for s in subs) / len(subs) if subs else 0.0
-        categories.append(CategoryHeatmap(
-            category_id=cat_data["category_id"],
-            category_name=cat_data["category_name"],
-            sub_sectors=subs,
-            total_volume=total_vol,
-            avg_change_rate=round(avg_rate, 2),
-        ))
-
-    return HeatmapResponse(
-        market=market,
-        updated_at=datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S"),
-        categories=categories,
-    )
+    def _safe_fetch(sector_id: str):
+        try:
+            return fetch_fn(sector_id, 10)
+        except Exception as e:
+            return e
+
+    sector_ids = list(sector_meta)
+    # 풀 스레드에도 지표 라벨/추적 span(contextvars)이 이어지도록 섹터마다 컨텍스트 복사
+    contexts = [contextvars.copy_context() for _ in sector_ids]
+    with stage("heatmap_build", market), ThreadPoolExecutor(max_workers=HEATMAP_FETCH_CONCURRENCY) as executor:
+        results = list(executor.map(lambda ctx, sid: ctx.run(_safe_fetch, sid), contexts, sector_ids))
+
+    # 카테고리 집계 + 직렬화는 스냅샷 저장소가 담당 (섹터 없으면 ValueError)
+    return replace_snapshot(market, _collect_sectors(market, sector_ids, results)).response
+
+
+async def _fetch_and_aggregate_async(market: str) -> HeatmapResponse:
+    is_us = market == "US"
+    sector_meta = US_SECTOR_META if is_us else SECTOR_META
+    fetch_fn = fetch_us_sector_news_async if is_us else fetch_sector_news_async
+
+    sector_ids = list(sector_meta)
+    # 콜드 스타트에 섹터 수만큼 업스트림/GPT 호출이 한꺼번에 나가지 않도록 동시 조회 수 제한
+    semaphore = asyncio.Semaphore(HEATMAP_FETCH_CONCURRENCY)
+
+    async def _bounded(sector_id: str) -> Optional[SectorNewsResult]:
+        async with semaphore:
+            return await fetch_fn(sector_id, 10)
+
+    with stage("heatmap_build", market):
+        results = await asyncio.gather(
+            *(_bounded(sector_id) for sector_id in sector_ids),
+            return_exceptions=True,
+        )
+
+    return replace_snapshot(market, _collect_sectors(market, sector_ids, results)).response
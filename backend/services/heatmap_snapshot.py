@@ -0,0 +1,178 @@
+"""
+히트맵 스냅샷 저장소
+- 시장(KR/US)별로 완성된 HeatmapResponse 를 JSON 바이트로 미리 직렬화해 보관 (gzip/br 압축본은 버전별 1회)
+- 섹터 결과가 바뀌면 해당 카테고리만 다시 집계·직렬화하여 스냅샷을 증분 갱신
+- 요청 경로에서는 버전이 붙은 스냅샷을 그대로 반환 (O(1))
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional
+
+from . import serializer
+from ..models.news_schema import (
+    SectorNewsResult,
+    CategoryHeatmap,
+    HeatmapResponse,
+)
+
+KST = timezone(timedelta(hours=9))
+
+
+@dataclass(frozen=True)
+class HeatmapSnapshot:
+    market: str
+    version: int
+    response: HeatmapResponse
+    encoded: serializer.EncodedBody   # 직렬화된 HeatmapResponse (UTF-8 JSON) + 압축본
+    built_at: float           # 마지막 갱신 시각 (증분 포함, epoch 초)
+    refreshed_at: float       # 마지막 전체 재구성 시각 (epoch 초)
+
+    @property
+    def body(self) -> bytes:
+        return self.encoded.body
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.market}-{self.version}"'
+
+
+class _MarketState:
+    """시장 하나의 섹터/카테고리 집계 상태 (스냅샷 재구성용)"""
+
+    def __init__(self) -> None:
+        self.sectors: Dict[str, SectorNewsResult] = {}
+        self.category_order: List[str] = []
+        self.categories: Dict[str, CategoryHeatmap] = {}
+        self.category_bytes: Dict[str, bytes] = {}
+
+
+_lock = threading.Lock()
+_states: Dict[str, _MarketState] = {}
+_snapshots: Dict[str, HeatmapSnapshot] = {}
+_version = 0
+
+
+def _build_category(subs: List[SectorNewsResult]) -> CategoryHeatmap:
+    """카테고리 하나의 섹터 결과를 집계"""
+    total_vol = sum(s.news_volume for s in subs)
+    avg_rate = sum(s.change_rate for s in subs) / len(subs) if subs else 0.0
+    return CategoryHeatmap(
+        category_id=subs[0].category_id,
+        category_name=subs[0].category_name,
+        sub_sectors=subs,
+        total_volume=total_vol,
+        avg_change_rate=round(avg_rate, 2),
+    )
+
+
+def _rebuild_category(state: _MarketState, cat_id: str) -> None:
+    subs = [s for s in state.sectors.values() if s.category_id == cat_id]
+    category = _build_category(subs)
+    state.categories[cat_id] = category
+    state.category_bytes[cat_id] = category.model_dump_json().encode("utf-8")
+
+
+def _commit(market: str, state: _MarketState, refreshed_at: Optional[float]) -> HeatmapSnapshot:
+    """카테고리 조각을 이어 붙여 새 버전의 스냅샷 생성 (_lock 보유 상태에서 호출)"""
+    global _version
+    _version += 1
+    now = time.time()
+    updated_at = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
+
+    response = HeatmapResponse(
+        market=market,
+        updated_at=updated_at,
+        categories=[state.categories[c] for c in state.category_order],
+    )
+    # 카테고리별로 미리 직렬화한 조각을 재사용하므로 변경된 카테고리만 다시 직렬화된다
+    body = b"".join([
+        b'{"market":', serializer.dumps(market),
+        b',"updated_at":', serializer.dumps(updated_at),
+        b',"categories":[',
+        b",".join(state.category_bytes[c] for c in state.category_order),
+        b"]}",
+    ])
+
+    previous = _snapshots.get(market)
+    snapshot = HeatmapSnapshot(
+        market=market,
+        version=_version,
+        response=response,
+        encoded=serializer.EncodedBody(body),
+        built_at=now,
+        refreshed_at=refreshed_at if refreshed_at is not None else (previous.refreshed_at if previous else now),
+    )
+    _snapshots[market] = snapshot
+    return snapshot
+
+
+def replace_snapshot(
+    market: str,
+    sectors: List[SectorNewsResult],
+    refreshed_at: Optional[float] = None,
+) -> HeatmapSnapshot:
+    """
+    섹터 결과 전체로 스냅샷을 새로 구성.
+    sectors 순서가 카테고리/섹터 표시 순서가 된다.
+    refreshed_at: 전체 재구성 시각 (기본 현재, 저장소에서 복원한 스냅샷은 0 → 바로 재구성 대상)
+    """
+    if not sectors:
+        raise ValueError("뉴스 데이터를 가져올 수 없습니다.")
+
+    state = _MarketState()
+    for sector in sectors:
+        state.sectors[sector.sector_id] = sector
+        if sector.category_id not in state.category_order:
+            state.category_order.append(sector.category_id)
+    for cat_id in state.category_order:
+        _rebuild_category(state, cat_id)
+
+    with _lock:
+        _states[market] = state
+        return _commit(market, state, refreshed_at=time.time() if refreshed_at is None else refreshed_at)
+
+
+def publish_sector(market: str, sector: SectorNewsResult) -> Optional[HeatmapSnapshot]:
+    """
+    섹터 결과 하나가 바뀌었음을 알림 → 해당 카테고리만 재집계해 스냅샷 증분 갱신.
+    아직 스냅샷이 없는 시장이면 아무것도 하지 않음 (첫 히트맵 요청 때 전체 구성).
+    """
+    with _lock:
+        state = _states.get(market)
+        if state is None:
+            return None
+
+        old = state.sectors.get(sector.sector_id)
+        state.sectors[sector.sector_id] = sector
+        if sector.category_id not in state.category_order:
+            state.category_order.append(sector.category_id)
+        _rebuild_category(state, sector.category_id)
+        # 섹터의 카테고리가 바뀐 경우 기존 카테고리도 재집계
+        if old is not None and old.category_id != sector.category_id:
+            if any(s.category_id == old.category_id for s in state.sectors.values()):
+                _rebuild_category(state, old.category_id)
+            else:
+                state.category_order.remove(old.category_id)
+                state.categories.pop(old.category_id, None)
+                state.category_bytes.pop(old.category_id, None)
+
+        return _commit(market, state, refreshed_at=None)
+
+
+def get_snapshot(market: str) -> Optional[HeatmapSnapshot]:
+    """현재 스냅샷 반환 (없으면 None)"""
+    return _snapshots.get(market)
+
+
+def clear_snapshots(market: Optional[str] = None) -> None:
+    """스냅샷 삭제. market=None 이면 전체 삭제."""
+    with _lock:
+        if market:
+            _states.pop(market, None)
+            _snapshots.pop(market, None)
+        else:
+            _states.clear()
+            _snapshots.clear()
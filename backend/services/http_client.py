@@ -0,0 +1,65 @@
+"""
+공용 HTTP 클라이언트 (커넥션 풀 + keep-alive)
+- 네이버 검색 API / Google News RSS 호출이 매번 TCP+TLS 핸드셰이크를 하지 않도록 재사용
+- 동기 경로(스레드): httpx.Client 하나를 프로세스 전체에서 공유
+- 비동기 경로(라우트/스케줄러): 실행 중인 이벤트 루프에 묶인 httpx.AsyncClient 공유
+"""
+
+import asyncio
+import os
+import threading
+from typing import Optional
+
+import httpx
+
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY = 30.0   # 초
+
+_limits = httpx.Limits(
+    max_connections=HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=HTTP_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+)
+_default_timeout = httpx.Timeout(10.0, connect=5.0)
+
+_lock = threading.Lock()
+_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.Client:
+    """동기 공용 클라이언트 (스레드 안전)"""
+    global _client
+    if _client is None or _client.is_closed:
+        with _lock:
+            if _client is None or _client.is_closed:
+                _client = httpx.Client(limits=_limits, timeout=_default_timeout)
+    return _client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    비동기 공용 클라이언트.
+    AsyncClient 의 커넥션 풀은 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다.
+    """
+    global _async_client, _async_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_loop is not loop:
+        _async_client = httpx.AsyncClient(limits=_limits, timeout=_default_timeout)
+        _async_loop = loop
+    return _async_client
+
+
+async def close_http_clients() -> None:
+    """서버 종료 시 커넥션 풀 정리 (FastAPI lifespan 에서 호출)"""
+    global _client, _async_client, _async_loop
+    if _async_client is not None and _async_loop is asyncio.get_running_loop():
+        await _async_client.aclose()
+    _async_client = None
+    _async_loop = None
+    with _lock:
+        if _client is not None:
+            _client.close()
+        _client = None
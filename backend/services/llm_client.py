@@ -0,0 +1,235 @@
+"""
+OpenAI 공용 클라이언트 + LLM 호출 동시성/속도 제한
+- OpenAI / AsyncOpenAI 객체를 프로세스 전체에서 재사용 (호출마다 커넥션 풀 생성 방지)
+- 동시 실행 수 제한 + 토큰 버킷(분당 요청 수) → 콜드 히트맵 빌드 때 rate limit 회피
+- 대기 시간(queue wait)과 실제 호출 시간을 용도별로 분리 집계
+"""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Optional
+
+from openai import OpenAI, AsyncOpenAI
+
+LLM_MAX_CONCURRENCY     = int(os.getenv("OPENAI_MAX_CONCURRENCY", "4"))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_RPM", "300"))
+LLM_MAX_RETRIES         = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+_ASYNC_POLL_SECONDS     = 0.05
+
+_client_lock = threading.Lock()
+_client: Optional[OpenAI] = None
+_client_key: Optional[str] = None
+_async_client: Optional[AsyncOpenAI] = None
+_async_client_key: Optional[str] = None
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def llm_enabled() -> bool:
+    return bool(os.getenv("OPENAI_API_KEY"))
+
+
+def get_openai_client() -> Optional[OpenAI]:
+    """동기 공용 클라이언트 (OPENAI_API_KEY 없으면 None)"""
+    global _client, _client_key
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    if _client is None or _client_key != api_key:
+        with _client_lock:
+            if _client is None or _client_key != api_key:
+                _client = OpenAI(api_key=api_key, max_retries=LLM_MAX_RETRIES)
+                _client_key = api_key
+    return _client
+
+
+def get_async_openai_client() -> Optional[AsyncOpenAI]:
+    """비동기 공용 클라이언트. 내부 커넥션 풀이 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다."""
+    global _async_client, _async_client_key, _async_loop
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_key != api_key or _async_loop is not loop:
+        _async_client = AsyncOpenAI(api_key=api_key, max_retries=LLM_MAX_RETRIES)
+        _async_client_key = api_key
+        _async_loop = loop
+    return _async_client
+
+
+async def close_llm_clients() -> None:
+    """서버 종료 시 커넥션 풀 정리 (FastAPI lifespan 에서 호출)"""
+    global _client, _async_client, _async_loop
+    if _async_client is not None and _async_loop is asyncio.get_running_loop():
+        await _async_client.close()
+    _async_client = None
+    _async_loop = None
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+
+
+class LLMLimiter:
+    """
+    동시 실행 수 + 토큰 버킷 제한기.
+    스레드(동기 경로)와 이벤트 루프(비동기 경로)가 같은 한도를 공유한다.
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_minute: int) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate = max(1, requests_per_minute) / 60.0     # 초당 토큰
+        self.capacity = float(self.max_concurrency)        # 순간 최대 버스트
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._active = 0
+        self._cond = threading.Condition()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _try_acquire(self) -> float:
+        """슬롯 획득 시 0, 아니면 다시 시도하기까지 기다릴 시간(초) 반환 (_cond 보유 상태)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._active >= self.max_concurrency:
+            return _ASYNC_POLL_SECONDS
+        if self._tokens < 1.0:
+            return (1.0 - self._tokens) / self.rate
+        self._tokens -= 1.0
+        self._active += 1
+        return 0.0
+
+    def _release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def _stat(self, purpose: str) -> Dict[str, Any]:
+        stat = self._stats.get(purpose)
+        if stat is None:
+            stat = self._stats[purpose] = {
+                "calls": 0, "errors": 0, "waiting": 0,
+                "wait_total": 0.0, "wait_max": 0.0,
+                "call_total": 0.0, "call_max": 0.0,
+            }
+        return stat
+
+    def _record(self, purpose: str, waited: float, elapsed: float, failed: bool) -> None:
+        with self._cond:
+            stat = self._stat(purpose)
+            stat["calls"] += 1
+            stat["errors"] += 1 if failed else 0
+            stat["wait_total"] += waited
+            stat["wait_max"] = max(stat["wait_max"], waited)
+            stat["call_total"] += elapsed
+            stat["call_max"] = max(stat["call_max"], elapsed)
+
+    def _set_waiting(self, purpose: str, delta: int) -> None:
+        with self._cond:
+            self._stat(purpose)["waiting"] += delta
+
+    @contextmanager
+    def slot(self, purpose: str):
+        """동기 경로용 슬롯 (필요 시 스레드를 블록하며 대기)"""
+        queued = time.monotonic()
+        self._set_waiting(purpose, 1)
+        try:
+            with self._cond:
+                while True:
+                    wait = self._try_acquire()
+                    if wait == 0.0:
+                        break
+                    self._cond.wait(timeout=wait)
+        finally:
+            self._set_waiting(purpose, -1)
+
+        started = time.monotonic()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._release()
+            self._record(purpose, started - queued, time.monotonic() - started, failed)
+
+    @asynccontextmanager
+    async def slot_async(self, purpose: str):
+        """비동기 경로용 슬롯 (이벤트 루프를 막지 않고 대기)"""
+        queued = time.monotonic()
+        self._set_waiting(purpose, 1)
+        # 대기 중 취소(클라이언트 연결 종료, 타임아웃)되어도 대기 수는 되돌림
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_acquire()
+                if wait == 0.0:
+                    break
+                await asyncio.sleep(min(wait, 1.0))
+        finally:
+            self._set_waiting(purpose, -1)
+
+        started = time.monotonic()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._release()
+            self._record(purpose, started - queued, time.monotonic() - started, failed)
+
+    def stats(self) -> dict:
+        with self._cond:
+            by_purpose = {}
+            for purpose, s in self._stats.items():
+                calls = s["calls"] or 1
+                by_purpose[purpose] = {
+                    "calls": s["calls"],
+                    "errors": s["errors"],
+                    "waiting": s["waiting"],
+                    "avg_queue_wait_ms": round(s["wait_total"] / calls * 1000, 1),
+                    "max_queue_wait_ms": round(s["wait_max"] * 1000, 1),
+                    "avg_call_ms": round(s["call_total"] / calls * 1000, 1),
+                    "max_call_ms": round(s["call_max"] * 1000, 1),
+                }
+            return {
+                "max_concurrency": self.max_concurrency,
+                "requests_per_minute": int(self.rate * 60),
+                "active": self._active,
+                "by_purpose": by_purpose,
+            }
+
+
+_limiter = LLMLimiter(LLM_MAX_CONCURRENCY, LLM_REQUESTS_PER_MINUTE)
+
+
+def chat_completion(purpose: str, **kwargs) -> Any:
+    """
+    공용 클라이언트 + 제한기를 거친 chat.completions.create.
+    purpose: 통계용 용도 라벨 (예: "analysis", "briefing")
+    API 키가 없으면 RuntimeError.
+    """
+    client = get_openai_client()
+    if client is None:
+        raise RuntimeError("OPENAI_API_KEY 없음")
+    with _limiter.slot(purpose):
+        return client.chat.completions.create(**kwargs)
+
+
+async def chat_completion_async(purpose: str, **kwargs) -> Any:
+    """chat_completion 의 비동기 버전"""
+    client = get_async_openai_client()
+    if client is None:
+        raise RuntimeError("OPENAI_API_KEY 없음")
+    async with _limiter.slot_async(purpose):
+        return await client.chat.completions.create(**kwargs)
+
+
+def llm_stats() -> dict:
+    """LLM 호출 통계 (대기 시간 vs 호출 시간)"""
+    return _limiter.stats()
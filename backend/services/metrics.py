@@ -0,0 +1,273 @@
+"""
+수집 파이프라인 지표 (Prometheus 텍스트 형식, GET /metrics)
+- 단계별 소요 시간 히스토그램: news_stage_seconds{stage, market, sector}
+  stage: naver / google_rss / ai_analysis / briefing / cache_read / cache_write / validate / heatmap_build
+- 캐시 조회 결과 카운터: news_cache_events_total{market, event} (l1_hits, l2_misses, stale_hits ...)
+- 업스트림 오류 카운터: news_upstream_errors_total{upstream, market, sector, reason}
+- 히트맵 재구성 중 예외로 빠진 섹터: news_sector_failures_total{market, sector}
+- 섹터 라벨은 contextvars 로 전달 (sector_scope 데코레이터가 fetch_* 진입 시 설정)
+  → 네이버/RSS/GPT 호출 함수 시그니처를 바꾸지 않고 어느 섹터의 호출인지 기록
+- 추적 중인 요청(tracing)이면 sector_scope / stage 구간이 그대로 span 이 된다
+- 관측 1회 = 잠금 1회 + bisect 1회 수준이라 운영에서도 켜 둔 채 사용 (METRICS_ENABLED=0 이면 기록 생략)
+- 지표는 프로세스별 값이다. uvicorn --workers N 이면 워커마다 따로 집계된다.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from . import tracing
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+
+# 네이버/RSS 는 수십~수백 ms, GPT 는 수 초, 캐시 I/O 는 ms 미만이라 넓게 잡음
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_scope: ContextVar[Tuple[str, str]] = ContextVar("metrics_scope", default=("", ""))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """라벨별 단조 증가 카운터"""
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        if not METRICS_ENABLED:
+            return
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        with self._lock:
+            return self._values.get(labelvalues, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """라벨별 누적 버킷 히스토그램 (관측 시에는 버킷별 개수만 올리고 누적은 출력할 때 계산)"""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = STAGE_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # 라벨값 → [버킷별 개수(+Inf 포함), 합계, 개수]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        if not METRICS_ENABLED:
+            return
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labelvalues: str) -> int:
+        with self._lock:
+            series = self._series.get(labelvalues)
+            return series[2] if series else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, ([*s[0]], s[1], s[2])) for labels, s in self._series.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip((*self.buckets, float("inf")), counts):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+STAGE_SECONDS = Histogram(
+    "news_stage_seconds", "수집 파이프라인 단계별 소요 시간(초)", ("stage", "market", "sector"),
+)
+CACHE_EVENTS = Counter(
+    "news_cache_events_total", "캐시 조회 결과 (l1/l2 적중·미스, 유예 구간 적중, 재검증 예약)", ("market", "event"),
+)
+UPSTREAM_ERRORS = Counter(
+    "news_upstream_errors_total", "업스트림 호출 실패 수", ("upstream", "market", "sector", "reason"),
+)
+
+SECTOR_FAILURES = Counter(
+    "news_sector_failures_total", "히트맵 재구성 중 예외로 빠진 섹터 수", ("market", "sector"),
+)
+
+_METRICS = [STAGE_SECONDS, CACHE_EVENTS, UPSTREAM_ERRORS, SECTOR_FAILURES]
+_gauges: List[Tuple[str, str, Callable[[], Dict[Tuple[Tuple[str, str], ...], float]]]] = []
+
+
+def register_gauge(
+    name: str,
+    help_text: str,
+    collect: Callable[[], Dict[Tuple[Tuple[str, str], ...], float]],
+) -> None:
+    """
+    출력 시점에 값을 읽는 게이지 등록 (기존 *_stats() 값을 이중 집계 없이 노출).
+    collect: {((라벨명, 값), ...): 수치} 반환 (라벨 없으면 키는 ())
+    """
+    _gauges.append((name, help_text, collect))
+
+
+# ─── 섹터 라벨 전달 (contextvars) ───
+
+def current_scope() -> Tuple[str, str]:
+    """현재 (market, sector) 라벨. 섹터 조회 밖이면 ("", "")"""
+    return _scope.get()
+
+
+@contextmanager
+def scope(market: str, sector: str) -> Iterator[None]:
+    token = _scope.set((market, sector))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def sector_scope(market: str) -> Callable:
+    """
+    첫 인자가 sector_id 인 fetch_* 함수용 데코레이터 (동기/비동기 모두 지원).
+    함수 실행 동안 기록되는 단계 지표에 (market, sector_id) 라벨을 붙이고,
+    추적 중이면 섹터 span 을 연다.
+    """
+    def decorator(fn: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(sector_id: str, *args, **kwargs):
+                with scope(market, sector_id), tracing.span(f"sector {sector_id}", market=market, sector_id=sector_id):
+                    return await fn(sector_id, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(sector_id: str, *args, **kwargs):
+            with scope(market, sector_id), tracing.span(f"sector {sector_id}", market=market, sector_id=sector_id):
+                return fn(sector_id, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ─── 기록 도우미 ───
+
+class stage:
+    """
+    with stage("naver"): ... → 현재 섹터 라벨로 소요 시간 기록 (예외가 나도 기록).
+    생성기 기반 contextmanager 보다 진입/종료 비용이 작아 캐시 읽기 같은 짧은 구간에도 사용.
+    추적 중이면 같은 구간을 span 으로도 남긴다.
+    """
+
+    __slots__ = ("name", "market", "started", "_span")
+
+    def __init__(self, name: str, market: Optional[str] = None) -> None:
+        self.name = name
+        self.market = market
+        self._span = tracing.span(name) if tracing.active() else None
+
+    def __enter__(self) -> None:
+        if self._span is not None:
+            self._span.__enter__()
+        self.started = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        scope_market, sector = _scope.get()
+        STAGE_SECONDS.observe(time.perf_counter() - self.started, self.name, self.market or scope_market, sector)
+        if self._span is not None:
+            self._span.__exit__(exc_type, exc, tb)
+
+
+def error_reason(error: BaseException) -> str:
+    """오류 라벨: HTTP 상태 코드가 있으면 코드, 없으면 예외 클래스명"""
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None) or getattr(error, "status_code", None)
+    if status:
+        return str(status)
+    return type(error).__name__
+
+
+def record_upstream_error(upstream: str, error: BaseException, market: Optional[str] = None) -> None:
+    scope_market, sector = _scope.get()
+    UPSTREAM_ERRORS.inc(upstream, market or scope_market, sector, error_reason(error))
+
+
+def record_cache_event(market: str, event: str) -> None:
+    CACHE_EVENTS.inc(market, event)
+
+
+def render() -> str:
+    """Prometheus 텍스트 형식(0.0.4) 출력"""
+    lines: List[str] = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+    for name, help_text, collect in _gauges:
+        try:
+            values = collect()
+        except Exception as e:   # 지표 하나의 실패로 전체 출력이 막히지 않도록
+            print(f"[Metrics] 게이지 수집 오류 ({name}): {e}")
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for labels, value in sorted(values.items()):
+            names = tuple(n for n, _ in labels)
+            label_values = tuple(v for _, v in labels)
+            lines.append(f"{name}{_format_labels(names, label_values)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    """테스트/벤치마크용: 누적 값 초기화 (등록된 게이지는 유지)"""
+    for metric in _METRICS:
+        with metric._lock:
+            if isinstance(metric, Histogram):
+                metric._series.clear()
+            else:
+                metric._values.clear()
@@ -0,0 +1,410 @@
+"""
+네이버 뉴스 API 일일 호출량 집계 + 호출량 압박 시 단계적 절감
+- 실제로 나간 호출을 KST 날짜 기준으로 SQLite 원장(CACHE_DIR/naver_quota.db)에 기록
+  → 재시작해도 유지되고 여러 워커(uvicorn --workers)가 같은 집계를 공유, 날짜가 바뀌면 새 행부터 집계
+- 호출 경로(source)별로 구분: sector(섹터 1페이지) / page(2페이지 이후) / search(/news/search) / debug
+- 지금까지의 호출 속도로 오늘 하루 예상 호출량(projected)을 계산해 한도(기본 2,500회) 대비 압박 단계 결정
+  normal   : 평소대로
+  elevated : 예상 호출량이 한도의 QUOTA_SOFT_RATIO 이상 → KR 캐시 TTL 을 늘리고(최대 QUOTA_MAX_TTL_MULTIPLIER 배)
+             보조 키워드 조회 중단, 깊은 페이지는 저장소로만 응답, 스케줄러는 적게 읽히는 섹터 갱신을 미룸
+  critical : 실제 호출량이 한도의 QUOTA_CRITICAL_RATIO 이상 → 1페이지도 저장소에 있으면 저장소로 응답
+  자정 직후/재시작 직후의 몰린 호출로 과대 추정하지 않도록 실제 사용률이 QUOTA_PROJECTION_MIN_RATIO 미만이면
+  예상치와 무관하게 normal, 호출 속도는 최소 QUOTA_MIN_ELAPSED 구간으로 나눠 계산
+- 요청 경로에서 SQLite 를 쓰지 않도록 호출/거부 기록은 메모리에 모았다가 백그라운드 스레드가
+  QUOTA_FLUSH_SECONDS 마다 일괄 반영 (이 프로세스의 호출은 합계에 즉시 반영),
+  다른 워커의 호출을 포함한 오늘 합계는 QUOTA_SYNC_SECONDS 마다 다시 읽음
+- 원장을 쓸 수 없으면 이 프로세스의 메모리 집계로 계속 동작
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from . import cache_manager
+
+NAVER_DAILY_LIMIT = int(os.getenv("NAVER_DAILY_LIMIT", "2500"))
+
+QUOTA_SOFT_RATIO         = float(os.getenv("QUOTA_SOFT_RATIO", "0.8"))      # 예상 사용률이 이 이상이면 elevated
+QUOTA_CRITICAL_RATIO     = float(os.getenv("QUOTA_CRITICAL_RATIO", "0.95"))  # 실제 사용률이 이 이상이면 critical
+QUOTA_MAX_TTL_MULTIPLIER = float(os.getenv("QUOTA_MAX_TTL_MULTIPLIER", "3"))
+QUOTA_DEEP_PAGE          = int(os.getenv("QUOTA_DEEP_PAGE", "2"))           # elevated 에서 이 페이지부터 저장소로만 응답
+QUOTA_MIN_ELAPSED        = int(os.getenv("QUOTA_MIN_ELAPSED", str(3 * 3600)))       # 호출 속도 계산 구간 하한 (초)
+QUOTA_PROJECTION_MIN_RATIO = float(os.getenv("QUOTA_PROJECTION_MIN_RATIO", "0.2"))  # 실제 사용률이 이 미만이면 normal
+QUOTA_SYNC_SECONDS       = float(os.getenv("QUOTA_SYNC_SECONDS", "5"))
+QUOTA_FLUSH_SECONDS      = float(os.getenv("QUOTA_FLUSH_SECONDS", "2"))
+QUOTA_HISTORY_DAYS       = 14       # 원장에 남길 날짜 수
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS naver_calls (
+    day     TEXT NOT NULL,              -- KST YYYY-MM-DD
+    keyword TEXT NOT NULL,
+    source  TEXT NOT NULL,              -- sector / page / search / debug
+    calls   INTEGER NOT NULL DEFAULT 0,
+    denied  INTEGER NOT NULL DEFAULT 0, -- 예산/압박으로 건너뛴 보조 키워드 조회
+    PRIMARY KEY (day, keyword, source)
+);
+
+CREATE TABLE IF NOT EXISTS naver_days (
+    day        TEXT PRIMARY KEY,
+    calls      INTEGER NOT NULL,
+    first_call REAL NOT NULL,
+    last_call  REAL NOT NULL
+);
+"""
+
+_local = threading.local()
+
+_lock = threading.Lock()
+_day: Optional[str] = None
+_calls = 0                  # 오늘 전체 호출 수 (원장 기준, 마지막 동기화 + 이후 이 프로세스 호출)
+_synced_at = 0.0            # 마지막 원장 동기화 시각 (monotonic)
+_synced_path: Optional[str] = None
+_by_keyword: Counter = Counter()   # 원장을 쓸 수 없을 때의 이 프로세스 집계
+_deferred: Counter = Counter()     # 압박 단계 때문에 업스트림 대신 캐시/저장소로 돌린 횟수 (이 프로세스)
+
+# 아직 원장에 반영하지 않은 기록: (day, keyword, source) → 호출 수 / (day, keyword) → 거부 수 / day → (첫, 마지막 호출 시각)
+_pending_calls: Counter = Counter()
+_pending_denied: Counter = Counter()
+_pending_times: Dict[str, Tuple[float, float]] = {}
+_flush_lock = threading.Lock()     # 일괄 반영은 한 번에 하나씩 (반영 중 합계를 두 번 세지 않도록)
+_flusher_pid: Optional[int] = None
+
+
+def _today() -> str:
+    return datetime.now(cache_manager.KST).strftime("%Y-%m-%d")
+
+
+def _db_path() -> str:
+    cache_manager._ensure_cache_dir()
+    return os.path.join(cache_manager.CACHE_DIR, "naver_quota.db")
+
+
+def _conn() -> sqlite3.Connection:
+    """스레드별 연결 (WAL: 여러 워커가 같은 원장에 기록)"""
+    path = _db_path()
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != path:
+        conn = sqlite3.connect(path, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _local.conn, _local.path = conn, path
+    return conn
+
+
+def _roll_day() -> None:
+    """KST 날짜가 바뀌었거나 동기화 주기가 지났으면 오늘 합계를 원장에서 다시 읽음 (_lock 보유 상태)"""
+    global _day, _calls, _synced_at, _synced_path
+    today = _today()
+    path = os.path.join(cache_manager.CACHE_DIR, "naver_quota.db")
+    if path != _synced_path:
+        # 원장 파일이 바뀜 (CACHE_DIR 교체) → 이전 원장 몫의 미반영 기록은 버림
+        _pending_calls.clear()
+        _pending_denied.clear()
+        _pending_times.clear()
+    if today != _day or path != _synced_path:
+        _day, _calls, _synced_at, _synced_path = today, 0, 0.0, path
+        _by_keyword.clear()
+        _deferred.clear()
+        _prune_history(today)
+    if time.monotonic() - _synced_at < QUOTA_SYNC_SECONDS:
+        return
+    _sync_calls()
+
+
+def _pending_today() -> int:
+    """이 프로세스가 아직 원장에 반영하지 않은 오늘 호출 수 (_lock 보유 상태)"""
+    return sum(n for (day, _, _), n in _pending_calls.items() if day == _day)
+
+
+def _sync_calls() -> None:
+    """원장의 오늘 합계 + 아직 반영하지 않은 이 프로세스 호출로 _calls 갱신 (_lock 보유 상태)"""
+    global _calls, _synced_at
+    try:
+        row = _conn().execute("SELECT calls FROM naver_days WHERE day = ?", (_day,)).fetchone()
+        _calls = max(_calls, (row[0] if row else 0) + _pending_today())
+    except sqlite3.Error as e:
+        print(f"[NaverQuota] 원장 읽기 오류: {e}")
+    _synced_at = time.monotonic()
+
+
+def _prune_history(today: str) -> None:
+    try:
+        conn = _conn()
+        with conn:
+            cutoff = conn.execute("SELECT date(?, ?)", (today, f"-{QUOTA_HISTORY_DAYS} days")).fetchone()[0]
+            conn.execute("DELETE FROM naver_calls WHERE day < ?", (cutoff,))
+            conn.execute("DELETE FROM naver_days WHERE day < ?", (cutoff,))
+    except sqlite3.Error as e:
+        print(f"[NaverQuota] 원장 정리 오류: {e}")
+
+
+def _ensure_flusher() -> None:
+    """일괄 반영 스레드 시작 (프로세스마다 1개, fork 된 워커에서는 새로 시작) (_lock 보유 상태)"""
+    global _flusher_pid
+    if _flusher_pid == os.getpid():
+        return
+    if _flusher_pid is None:
+        atexit.register(flush_calls)
+    _flusher_pid = os.getpid()
+    threading.Thread(target=_flush_loop, name="naver-quota-flush", daemon=True).start()
+
+
+def _flush_loop() -> None:
+    while True:
+        time.sleep(QUOTA_FLUSH_SECONDS)
+        flush_calls()
+
+
+def flush_calls() -> None:
+    """모아 둔 호출/거부 기록을 원장에 일괄 반영 (실패하면 이 프로세스의 메모리 집계로 대체)"""
+    with _flush_lock:
+        with _lock:
+            if _synced_path != os.path.join(cache_manager.CACHE_DIR, "naver_quota.db"):
+                # 모아 둔 기록은 이전 원장 몫 (CACHE_DIR 교체) → 새 원장에 쓰지 않고 버림 (_roll_day 와 같은 처리)
+                _pending_calls.clear()
+                _pending_denied.clear()
+                _pending_times.clear()
+                return
+            calls, denied, times = dict(_pending_calls), dict(_pending_denied), dict(_pending_times)
+        if not calls and not denied:
+            return
+        try:
+            conn = _conn()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO naver_calls (day, keyword, source, calls) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (day, keyword, source) DO UPDATE SET calls = calls + excluded.calls
+                    """,
+                    [(day, keyword, source, n) for (day, keyword, source), n in calls.items()],
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO naver_calls (day, keyword, source, denied) VALUES (?, ?, 'sector', ?)
+                    ON CONFLICT (day, keyword, source) DO UPDATE SET denied = denied + excluded.denied
+                    """,
+                    [(day, keyword, n) for (day, keyword), n in denied.items()],
+                )
+                day_calls: Counter = Counter()
+                for (day, _, _), n in calls.items():
+                    day_calls[day] += n
+                conn.executemany(
+                    """
+                    INSERT INTO naver_days (day, calls, first_call, last_call) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (day) DO UPDATE SET
+                        calls = calls + excluded.calls, last_call = MAX(last_call, excluded.last_call)
+                    """,
+                    [(day, n, *times[day]) for day, n in day_calls.items()],
+                )
+            failed = False
+        except sqlite3.Error as e:
+            print(f"[NaverQuota] 원장 기록 오류: {e}")
+            failed = True
+        with _lock:
+            _pending_calls.subtract(calls)
+            _pending_denied.subtract(denied)
+            for counter in (_pending_calls, _pending_denied):
+                for key in [k for k, n in counter.items() if n <= 0]:
+                    del counter[key]
+            for day in times:
+                if not any(d == day for d, _, _ in _pending_calls):
+                    _pending_times.pop(day, None)
+            if failed:
+                for (day, keyword, _), n in calls.items():
+                    if day == _day:
+                        _by_keyword[keyword] += n
+            elif _day is not None:
+                _sync_calls()   # 다른 워커의 호출까지 포함한 합계로 갱신
+
+
+def record_call(keyword: str, source: str = "sector") -> None:
+    """실제 네이버 호출 1회 기록 (source: sector / page / search / debug). 원장 반영은 flush_calls() 가 일괄로"""
+    global _calls
+    now = time.time()
+    with _lock:
+        _roll_day()
+        _ensure_flusher()
+        _calls += 1
+        _pending_calls[(_day, keyword, source)] += 1
+        first, _ = _pending_times.get(_day, (now, now))
+        _pending_times[_day] = (first, now)
+
+
+def calls_today() -> int:
+    with _lock:
+        _roll_day()
+        return _calls
+
+
+def _keyword_calls(keyword: str) -> int:
+    """오늘 이 키워드 호출 수 (원장 + 아직 반영하지 않은 이 프로세스 호출) (_lock 보유 상태)"""
+    pending = sum(n for (day, kw, _), n in _pending_calls.items() if day == _day and kw == keyword)
+    try:
+        row = _conn().execute(
+            "SELECT COALESCE(SUM(calls), 0) FROM naver_calls WHERE day = ? AND keyword = ?", (_day, keyword)
+        ).fetchone()
+        return row[0] + pending
+    except sqlite3.Error:
+        return _by_keyword[keyword] + pending
+
+
+def _record_denied(keyword: str) -> None:
+    """예산/압박으로 건너뛴 보조 키워드 조회 기록 (_lock 보유 상태, 원장 반영은 flush_calls())"""
+    _ensure_flusher()
+    _pending_denied[(_day, keyword)] += 1
+
+
+# ─── 압박 단계 ───
+
+def _day_progress(now: float) -> Tuple[float, float]:
+    """KST 오늘 자정부터 경과한 초, 남은 초"""
+    current = datetime.fromtimestamp(now, cache_manager.KST)
+    midnight = current.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+    elapsed = now - midnight
+    return elapsed, max(86400 - elapsed, 0.0)
+
+
+def _projected(calls: int, now: float) -> int:
+    """지금까지의 평균 호출 속도가 자정까지 이어진다고 볼 때의 오늘 예상 호출량"""
+    elapsed, remaining = _day_progress(now)
+    rate = calls / max(elapsed, QUOTA_MIN_ELAPSED)
+    return int(calls + rate * remaining)
+
+
+def _pressure(calls: int, now: float) -> Tuple[str, float, int]:
+    """(단계, TTL 배수, 예상 호출량)"""
+    projected = _projected(calls, now)
+    if calls >= NAVER_DAILY_LIMIT * QUOTA_CRITICAL_RATIO:
+        return "critical", QUOTA_MAX_TTL_MULTIPLIER, projected
+    ratio = projected / NAVER_DAILY_LIMIT
+    # 아직 실제 사용량이 적으면 자정/재시작 직후의 몰린 호출로 본 속도를 믿지 않음
+    if ratio < QUOTA_SOFT_RATIO or calls < NAVER_DAILY_LIMIT * QUOTA_PROJECTION_MIN_RATIO:
+        return "normal", 1.0, projected
+    # 예상 사용률이 soft → 100% 로 갈수록 TTL 배수를 1 → 최대까지 선형 증가 (0.25 단위로 끊어 자주 바뀌지 않게)
+    span = max(1.0 - QUOTA_SOFT_RATIO, 1e-6)
+    scale = 1.0 + (QUOTA_MAX_TTL_MULTIPLIER - 1.0) * min((ratio - QUOTA_SOFT_RATIO) / span, 1.0)
+    return "elevated", max(round(scale * 4) / 4, 1.0), projected
+
+
+def pressure_level() -> str:
+    """normal / elevated / critical"""
+    return _pressure(calls_today(), time.time())[0]
+
+
+def projected_calls() -> int:
+    """오늘(KST) 네이버 호출 예상치"""
+    return _pressure(calls_today(), time.time())[2]
+
+
+def ttl_multiplier() -> float:
+    """KR 캐시 TTL 배수 (호출량 압박이 없으면 1.0)"""
+    return _pressure(calls_today(), time.time())[1]
+
+
+def allow_keyword(keyword: str, keyword_budget: Optional[int] = None) -> bool:
+    """
+    오늘 이 보조 키워드로 한 번 더 호출해도 되는지 여부.
+    전체 한도를 넘었거나, 호출량 압박 단계이거나, 키워드 예산(keyword_budget)을 다 쓴 경우 False.
+    """
+    with _lock:
+        _roll_day()
+        level = _pressure(_calls, time.time())[0]
+        if _calls >= NAVER_DAILY_LIMIT or level != "normal":
+            allowed = False
+        elif keyword_budget is not None and _keyword_calls(keyword) >= keyword_budget:
+            allowed = False
+        else:
+            allowed = True
+        if not allowed:
+            _deferred["aux_keyword"] += 1
+            _record_denied(keyword)
+        return allowed
+
+
+def allow_page_fetch(page: int) -> bool:
+    """
+    KR 섹터 page 를 업스트림에서 새로 받아도 되는지 여부.
+    False 면 호출 측은 기사 저장소에 있는 만큼으로 응답한다 (저장소가 비어 있을 때만 업스트림 호출).
+    """
+    level = pressure_level()
+    if level == "normal" or (level == "elevated" and page < QUOTA_DEEP_PAGE):
+        return True
+    with _lock:
+        _deferred["page_1" if page == 1 else "deep_page"] += 1
+    return False
+
+
+def note_deferred(kind: str) -> None:
+    """압박 단계 때문에 업스트림 호출을 미룬 횟수 기록 (예: 스케줄러의 낮은 우선순위 섹터)"""
+    with _lock:
+        _deferred[kind] += 1
+
+
+def _history(days: int) -> Dict[str, int]:
+    try:
+        rows = _conn().execute(
+            "SELECT day, calls FROM naver_days ORDER BY day DESC LIMIT ?", (days,)
+        ).fetchall()
+        return {day: calls for day, calls in rows}
+    except sqlite3.Error:
+        return {}
+
+
+def naver_quota_stats(top: int = 10) -> dict:
+    """
+    오늘 호출량 (전체/경로별/호출 많은 키워드 상위 top 개/예산 초과로 건너뛴 횟수)
+    + 예상 호출량과 압박 단계, 최근 며칠 합계
+    """
+    flush_calls()
+    with _lock:
+        _roll_day()
+        day, calls = _day, _calls
+        deferred = dict(_deferred)
+        fallback_keywords = dict(_by_keyword.most_common(top))
+    level, multiplier, projected = _pressure(calls, time.time())
+    by_source: Dict[str, int] = {}
+    top_keywords, denied = fallback_keywords, {}
+    try:
+        conn = _conn()
+        by_source = {
+            source: n for source, n in conn.execute(
+                "SELECT source, SUM(calls) FROM naver_calls WHERE day = ? GROUP BY source", (day,)
+            ) if n
+        }
+        top_keywords = {
+            keyword: n for keyword, n in conn.execute(
+                """
+                SELECT keyword, SUM(calls) AS n FROM naver_calls WHERE day = ?
+                GROUP BY keyword HAVING n > 0 ORDER BY n DESC LIMIT ?
+                """,
+                (day, top),
+            )
+        }
+        denied = {
+            keyword: n for keyword, n in conn.execute(
+                "SELECT keyword, denied FROM naver_calls WHERE day = ? AND denied > 0", (day,)
+            )
+        }
+    except sqlite3.Error as e:
+        print(f"[NaverQuota] 원장 집계 오류: {e}")
+    return {
+        "date": day,
+        "calls_today": calls,
+        "daily_limit": NAVER_DAILY_LIMIT,
+        "remaining": max(NAVER_DAILY_LIMIT - calls, 0),
+        "projected_calls": projected,
+        "projected_usage_ratio": f"{projected / NAVER_DAILY_LIMIT * 100:.1f}%",
+        "pressure": level,
+        "ttl_multiplier": multiplier,
+        "by_source": by_source,
+        "top_keywords": top_keywords,
+        "denied": denied,
+        "deferred": deferred,
+        "history": _history(7),
+    }
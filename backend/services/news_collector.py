@@ -4,20 +4,103 @@
 - cache_manager를 통한 캐싱으로 API 호출량 절약
 """
 
+import asyncio
+import contextvars
 import os
-import re
 import json
-import requests
+import time
 import feedparser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional, Tuple
 
 from ..models.news_schema import NewsItem, SectorNewsResult
-from openai import OpenAI
-from .cache_manager import load_cache, save_cache
+from .cache_manager import (
+    invalidate,
+    load_cache,
+    load_cache_since,
+    load_cache_swr,
+    matching_keys,
+    save_cache,
+)
+from .file_lock import key_lock, key_lock_async
+from .heatmap_snapshot import publish_sector
+from .http_client import get_http_client, get_async_http_client
+from .llm_client import llm_enabled, chat_completion, chat_completion_async
+from .analysis_cache import analysis_key, get_analyses, put_analyses
+from .sector_window import (
+    INCREMENTAL_REFRESH,
+    SectorWindow,
+    count_refresh,
+    delete_window,
+    get_window,
+    parse_pub_date,
+    save_window,
+)
+from .naver_quota import NAVER_DAILY_LIMIT, allow_keyword, allow_page_fetch, record_call
+from .sector_velocity import record_refresh
+from .company_matcher import CompanyMatcher, build_company_matcher
+from .text_normalizer import filter_fake_companies, normalize_items, normalize_title, strip_html
+from .sentiment import score_titles
+from .article_store import (
+    advance_backfill,
+    decode_cursor,
+    delete_sector,
+    encode_cursor,
+    get_sector_state,
+    query_sector_articles,
+    query_sector_page,
+    save_sector_state,
+    sector_position,
+    upsert_sector_articles,
+)
+from .single_flight import SingleFlight
+from .metrics import record_upstream_error, sector_scope, stage
+from . import tracing
 
 KST = timezone(timedelta(hours=9))
 
+# 벤치마크/테스트용 로컬 스텁으로 바꿀 수 있도록 환경변수 우선 (backend/bench/stubs.py)
+NAVER_NEWS_URL      = os.getenv("NAVER_NEWS_URL", "https://openapi.naver.com/v1/search/news.json")
+GOOGLE_NEWS_RSS_URL = os.getenv("GOOGLE_NEWS_RSS_URL", "https://news.google.com/rss/search")
+
+# 섹터 캐시 키별 업스트림 조회 단일 실행 (KR/US 공용)
+_sector_flight = SingleFlight("sector_news")
+
+
+def _locked_upstream(
+    cache_key: str,
+    force_refresh: bool,
+    fetch: Callable[[], SectorNewsResult],
+) -> SectorNewsResult:
+    """
+    워커(프로세스) 간 키 잠금 안에서 업스트림 조회.
+    잠금을 기다리는 동안 다른 워커가 갱신을 끝냈으면 그 결과를 사용
+    (강제 갱신이 아니면 fetch 안의 캐시 재확인이 같은 역할).
+    """
+    requested_at = time.time()
+    with key_lock(cache_key):
+        if force_refresh:
+            cached = load_cache_since(cache_key, requested_at, SectorNewsResult)
+            if cached:
+                return cached
+        return fetch()
+
+
+async def _locked_upstream_async(
+    cache_key: str,
+    force_refresh: bool,
+    fetch: Callable[[], Awaitable[SectorNewsResult]],
+) -> SectorNewsResult:
+    """_locked_upstream 의 비동기 버전 (잠금 대기 중 이벤트 루프를 막지 않음)"""
+    requested_at = time.time()
+    async with key_lock_async(cache_key):
+        if force_refresh:
+            cached = load_cache_since(cache_key, requested_at, SectorNewsResult)
+            if cached:
+                return cached
+        return await fetch()
+
 # ─────────────────────────────────────────────
 # 섹터 메타데이터: 검색 키워드 매핑
 # (하드코딩 데이터 → 정적 메타데이터로만 유지)
@@ -136,92 +219,37 @@ US_COMPANY_DICT = {
 }
 
 
-def _filter_fake_companies(companies: List[str]) -> List[str]:
-    """
-    'A기업', 'B사', 'OO기업' 같은 익명/가짜 기업명을 필터링.
-    실제 상장 기업명이 아닌 익명 표현을 제거한다.
-    """
-    if not companies:
-        return []
+_company_matcher: Optional[CompanyMatcher] = None
 
-    # 익명/가짜 기업명 패턴 (대소문자 무시)
-    fake_patterns = [
-        # 한글 1자 또는 알파벳 1자 + 기업/사/그룹/회사/업체
-        r'^[A-Za-zㄱ-ㅎ가-힣]기업$',
-        r'^[A-Za-zㄱ-ㅎ가-힣]사$',
-        r'^[A-Za-zㄱ-ㅎ가-힣]그룹$',
-        r'^[A-Za-zㄱ-ㅎ가-힣]회사$',
-        r'^[A-Za-zㄱ-ㅎ가-힣]업체$',
-        r'^[A-Za-zㄱ-ㅎ가-힣]은행$',
-        r'^[A-Za-zㄱ-ㅎ가-힣]증권$',
-        # OO, XX 마스킹 패턴
-        r'^[OoXx○●]{2}.+$',
-        r'^○○.+$',
-        # "모 기업", "해당 기업", "특정 기업", "일부 기업" 등
-        r'^(모|해당|특정|일부|모\s)\s?(기업|회사|업체|그룹|증권|은행)$',
-        # "某企業" 같은 한자 표현
-        r'^某.+$',
-        # 단일 알파벳이나 단일 한글 (기업명으로는 너무 짧음)
-        r'^[A-Za-zㄱ-ㅎ가-힣]$',
-        # "Company A", "Firm B" 같은 영문 익명 패턴
-        r'^(Company|Firm|Corp)\s+[A-Z]$',
-    ]
-
-    filtered = []
-    for company in companies:
-        name = company.strip()
-        if not name:
-            continue
-        is_fake = False
-        for pattern in fake_patterns:
-            if re.match(pattern, name):
-                is_fake = True
-                break
-        if not is_fake:
-            filtered.append(name)
 
-    return filtered
+def _get_company_matcher() -> CompanyMatcher:
+    """KR/US 기업 사전 전체를 한 번만 컴파일 (최초 사용 시)"""
+    global _company_matcher
+    if _company_matcher is None:
+        _company_matcher = build_company_matcher(COMPANY_DICT, US_COMPANY_DICT)
+    return _company_matcher
 
 
-def _extract_companies(text: str, sector_id: str, max_count: int = 5) -> List[str]:
+def _extract_companies(title: str, description: str, sector_id: str, max_count: int = 5) -> List[str]:
     """
-    기사 텍스트(제목+설명)에서 관련 기업명을 매칭하여 최대 max_count개 반환.
+    기사 제목/설명에서 관련 기업명을 매칭하여 최대 max_count개 반환.
     제목 매칭에 더 높은 점수 부여.
     """
-    # 적절한 사전 선택
-    if sector_id.startswith("US_"):
-        companies = US_COMPANY_DICT.get(sector_id, [])
-    else:
-        companies = COMPANY_DICT.get(sector_id, [])
-
-    if not companies:
-        return []
+    return _get_company_matcher().match(title, description, sector_id, max_count)
 
-    matched = []
-    for company in companies:
-        if company in text:
-            matched.append(company)
 
-    return matched[:max_count]
+# 분석 프롬프트/후처리를 바꾸면 올려서 기존 기사 분석 캐시를 무효화
+ANALYSIS_PROMPT_VERSION = "v1"
 
 
-def _analyze_articles_ai_batch(
+def _build_analysis_prompt(
     articles_data: list[dict],
     sector_name: str,
     category_name: str,
-    market: str = "KR",
-    max_companies: int = 5,
-) -> list[dict]:
-    """
-    기사들에 대해 GPT AI로 섹터 적합성 검증 + 기업명 추출 + 분류 사유 + 요약을 배치 처리.
-    articles_data: [{"title": str, "description": str}, ...]
-    반환: [{"is_relevant": bool, "companies": [...], "reason": str, "summary": str}, ...]
-    """
-    api_key = os.getenv("OPENAI_API_KEY")
-    default = [{"is_relevant": True, "companies": [], "reason": "", "summary": ""} for _ in articles_data]
-    if not api_key or not articles_data:
-        return default
-
+    market: str,
+    max_companies: int,
+) -> str:
+    """기사 배치 분석 프롬프트 생성"""
     # 기사 목록을 프롬프트용 텍스트로 변환
     article_texts = []
     for i, ad in enumerate(articles_data):
@@ -289,62 +317,168 @@ Respond ONLY in JSON:
 - Use empty array [] if no companies
 - summary should be 50-150 characters, complete sentence
 """
+    return prompt
+
+
+def _analysis_request(prompt: str) -> dict:
+    return dict(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": "You are a financial news analyst. Always output valid JSON."},
+            {"role": "user", "content": prompt},
+        ],
+        response_format={"type": "json_object"},
+        timeout=30,
+    )
 
-    try:
-        client = OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a financial news analyst. Always output valid JSON."},
-                {"role": "user", "content": prompt},
-            ],
-            response_format={"type": "json_object"},
-            timeout=30,
-        )
-        data = json.loads(response.choices[0].message.content)
-        results = data.get("results", [])
-
-        # 길이 검증
-        if len(results) != len(articles_data):
-            while len(results) < len(articles_data):
-                results.append({"is_relevant": True, "companies": [], "reason": "", "summary": ""})
-            results = results[:len(articles_data)]
-
-        # 각 결과 정규화
-        normalized = []
-        for r in results:
-            if not isinstance(r, dict):
-                normalized.append({"is_relevant": True, "companies": [], "reason": "", "summary": ""})
-            else:
-                companies = r.get("companies", [])
-                if not isinstance(companies, list):
-                    companies = []
-                normalized.append({
-                    "is_relevant": bool(r.get("is_relevant", True)),
-                    "companies": companies[:max_companies],
-                    "reason": str(r.get("reason", ""))[:100],
-                    "summary": str(r.get("summary", ""))[:200],
-                })
-        return normalized
 
-    except Exception as e:
-        return default
+def _parse_analysis_response(content: str, count: int, max_companies: int) -> List[Optional[dict]]:
+    """
+    GPT 응답(JSON) → 기사 수에 맞춘 정규화된 결과 목록.
+    응답에 빠졌거나 형식이 틀린 기사는 None (캐시하지 않고 병합 시 기본값)
+    """
+    data = json.loads(content)
+    results = data.get("results", [])
+
+    # 길이 검증
+    results = results[:count] + [None] * (count - len(results))
+
+    # 각 결과 정규화
+    normalized: List[Optional[dict]] = []
+    for r in results:
+        if not isinstance(r, dict):
+            normalized.append(None)
+        else:
+            companies = r.get("companies", [])
+            if not isinstance(companies, list):
+                companies = []
+            normalized.append({
+                "is_relevant": bool(r.get("is_relevant", True)),
+                "companies": companies[:max_companies],
+                "reason": str(r.get("reason", ""))[:100],
+                "summary": str(r.get("summary", ""))[:200],
+            })
+    return normalized
 
 
-def _generate_sector_briefing(
+def _lookup_cached_analyses(
+    articles_data: list[dict],
+    sector_name: str,
+    category_name: str,
+    market: str,
+    max_companies: int,
+) -> Tuple[List[str], List[Optional[dict]], List[int]]:
+    """
+    기사별 분석 캐시 조회.
+    반환: (기사별 캐시 키, 기사별 결과(미적중 None), 미적중 기사 인덱스)
+    """
+    keys = [
+        analysis_key([
+            ANALYSIS_PROMPT_VERSION, market, sector_name, category_name, str(max_companies),
+            ad.get("link", ""), ad["title"], ad["description"],
+        ])
+        for ad in articles_data
+    ]
+    cached = get_analyses(keys)
+    results = [cached.get(k) for k in keys]
+    missing = [i for i, r in enumerate(results) if r is None]
+    return keys, results, missing
+
+
+def _merge_fresh_analyses(
+    keys: List[str],
+    results: List[Optional[dict]],
+    missing: List[int],
+    fresh: Optional[List[Optional[dict]]],
+) -> list[dict]:
+    """
+    새로 분석한 결과를 원래 기사 순서대로 병합 (실패분은 기본값, "analyzed": False 로 표시).
+    GPT 가 실제로 돌려준 결과만 캐시 → 응답에서 빠진 기사는 다음 갱신 때 다시 분석
+    """
+    if fresh is not None:
+        put_analyses({keys[i]: r for i, r in zip(missing, fresh) if r is not None})
+        for i, r in zip(missing, fresh):
+            results[i] = r
+    return [
+        r if r is not None else {"is_relevant": True, "companies": [], "reason": "", "summary": "", "analyzed": False}
+        for r in results
+    ]
+
+
+def _analyze_articles_ai_batch(
+    articles_data: list[dict],
     sector_name: str,
     category_name: str,
-    articles: List[NewsItem],
     market: str = "KR",
-) -> Optional[str]:
+    max_companies: int = 5,
+) -> list[dict]:
     """
-    해당 섹터 뉴스 목록을 바탕으로 AI 한 줄 브리핑 생성.
-    반환: 한 줄 문자열 (50~80자 내외) 또는 실패 시 None
+    기사들에 대해 GPT AI로 섹터 적합성 검증 + 기업명 추출 + 분류 사유 + 요약을 배치 처리.
+    이미 분석한 기사(analysis_cache 적중)는 제외하고 새 기사만 프롬프트에 넣는다.
+    articles_data: [{"title": str, "description": str, "link": str}, ...]
+    반환: [{"is_relevant": bool, "companies": [...], "reason": str, "summary": str}, ...]
     """
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or not articles:
-        return None
+    if not articles_data:
+        return []
 
+    keys, results, missing = _lookup_cached_analyses(
+        articles_data, sector_name, category_name, market, max_companies
+    )
+    fresh = None
+    if missing and llm_enabled():
+        pending = [articles_data[i] for i in missing]
+        prompt = _build_analysis_prompt(pending, sector_name, category_name, market, max_companies)
+        try:
+            with stage("ai_analysis", market):
+                response = chat_completion("analysis", **_analysis_request(prompt))
+                fresh = _parse_analysis_response(
+                    response.choices[0].message.content, len(pending), max_companies
+                )
+        except Exception as e:
+            record_upstream_error("openai", e, market)
+            print(f"[AIAnalysis] 분석 실패 ({sector_name}, {len(pending)}건): {e}")
+            fresh = None
+    return _merge_fresh_analyses(keys, results, missing, fresh)
+
+
+async def _analyze_articles_ai_batch_async(
+    articles_data: list[dict],
+    sector_name: str,
+    category_name: str,
+    market: str = "KR",
+    max_companies: int = 5,
+) -> list[dict]:
+    """_analyze_articles_ai_batch 의 비동기 버전 (공용 AsyncOpenAI + 동시성 제한)"""
+    if not articles_data:
+        return []
+
+    keys, results, missing = _lookup_cached_analyses(
+        articles_data, sector_name, category_name, market, max_companies
+    )
+    fresh = None
+    if missing and llm_enabled():
+        pending = [articles_data[i] for i in missing]
+        prompt = _build_analysis_prompt(pending, sector_name, category_name, market, max_companies)
+        try:
+            with stage("ai_analysis", market):
+                response = await chat_completion_async("analysis", **_analysis_request(prompt))
+                fresh = _parse_analysis_response(
+                    response.choices[0].message.content, len(pending), max_companies
+                )
+        except Exception as e:
+            record_upstream_error("openai", e, market)
+            print(f"[AIAnalysis] 분석 실패 ({sector_name}, {len(pending)}건): {e}")
+            fresh = None
+    return _merge_fresh_analyses(keys, results, missing, fresh)
+
+
+def _build_briefing_prompt(
+    sector_name: str,
+    category_name: str,
+    articles: List[NewsItem],
+    market: str,
+) -> str:
+    """섹터 한 줄 브리핑 프롬프트 생성"""
     # 최대 5개 기사 제목·요약만 사용
     snippets = []
     for i, a in enumerate(articles[:5]):
@@ -381,48 +515,77 @@ News:
 {block}
 
 Output only the one-line briefing."""
+    return prompt
+
+
+def _briefing_request(prompt: str) -> dict:
+    return dict(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": "You are a concise financial news briefer. Output only the requested one-line text."},
+            {"role": "user", "content": prompt},
+        ],
+        max_tokens=120,
+        timeout=15,
+    )
+
 
+def _generate_sector_briefing(
+    sector_name: str,
+    category_name: str,
+    articles: List[NewsItem],
+    market: str = "KR",
+) -> Optional[str]:
+    """
+    해당 섹터 뉴스 목록을 바탕으로 AI 한 줄 브리핑 생성.
+    반환: 한 줄 문자열 (50~80자 내외) 또는 실패 시 None
+    """
+    if not llm_enabled() or not articles:
+        return None
+
+    prompt = _build_briefing_prompt(sector_name, category_name, articles, market)
     try:
-        client = OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a concise financial news briefer. Output only the requested one-line text."},
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=120,
-            timeout=15,
-        )
+        with stage("briefing", market):
+            response = chat_completion("briefing", **_briefing_request(prompt))
         text = (response.choices[0].message.content or "").strip()
         return text[:120] if text else None
     except Exception as e:
+        record_upstream_error("openai", e, market)
         print(f"[SectorBriefing] 생성 실패 ({sector_name}): {e}")
         return None
 
 
-def _strip_html(text: str) -> str:
-    """HTML 태그 및 엔티티 제거"""
-    import html
-    clean = re.compile('<.*?>')
-    text = re.sub(clean, '', text)
-    return html.unescape(text)
+async def _generate_sector_briefing_async(
+    sector_name: str,
+    category_name: str,
+    articles: List[NewsItem],
+    market: str = "KR",
+) -> Optional[str]:
+    """_generate_sector_briefing 의 비동기 버전"""
+    if not llm_enabled() or not articles:
+        return None
+
+    prompt = _build_briefing_prompt(sector_name, category_name, articles, market)
+    try:
+        with stage("briefing", market):
+            response = await chat_completion_async("briefing", **_briefing_request(prompt))
+        text = (response.choices[0].message.content or "").strip()
+        return text[:120] if text else None
+    except Exception as e:
+        record_upstream_error("openai", e, market)
+        print(f"[SectorBriefing] 생성 실패 ({sector_name}): {e}")
+        return None
 
 
-def _call_naver_news(keyword: str, display: int = 10, start: int = 1) -> dict:
-    """
-    네이버 뉴스 검색 API 호출 (1회).
-    반환: {"items": [...], "total": 전체 검색 결과 수}
-    실패 시: {"items": [], "total": 0}
-    start: 검색 시작 위치 (1부터 시작, 최대 1000)
-    """
+def _naver_request(keyword: str, display: int, start: int) -> Optional[Tuple[dict, dict]]:
+    """네이버 뉴스 검색 요청 헤더/파라미터. 환경변수가 없으면 None."""
     client_id     = os.getenv("NAVER_CLIENT_ID")
     client_secret = os.getenv("NAVER_CLIENT_SECRET")
 
     if not client_id or not client_secret:
         print("[NaverAPI] 환경변수 NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 없음")
-        return {"items": [], "total": 0}
+        return None
 
-    url = "https://openapi.naver.com/v1/search/news.json"
     headers = {
         "X-Naver-Client-Id":     client_id,
         "X-Naver-Client-Secret": client_secret,
@@ -433,16 +596,59 @@ def _call_naver_news(keyword: str, display: int = 10, start: int = 1) -> dict:
         "start":   start,
         "sort":    "date",  # 최신순
     }
+    return headers, params
+
+
+def _call_naver_news(keyword: str, display: int = 10, start: int = 1, source: Optional[str] = None) -> dict:
+    """
+    네이버 뉴스 검색 API 호출 (1회, 공용 커넥션 풀 사용).
+    반환: {"items": [...], "total": 전체 검색 결과 수}
+    실패 시: {"items": [], "total": 0}
+    start: 검색 시작 위치 (1부터 시작, 최대 1000)
+    source: 호출량 원장의 호출 경로 (기본: start 가 1 이면 sector, 아니면 page)
+    """
+    request = _naver_request(keyword, display, start)
+    if request is None:
+        return {"items": [], "total": 0}
+    headers, params = request
+    record_call(keyword, source or ("sector" if start == 1 else "page"))
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=8)
-        response.raise_for_status()
-        data = response.json()
+        with stage("naver", "KR"):
+            response = get_http_client().get(NAVER_NEWS_URL, headers=headers, params=params, timeout=8)
+            response.raise_for_status()
+            data = response.json()
         return {
             "items": data.get("items", []),
             "total": data.get("total", 0),
         }
     except Exception as e:
+        record_upstream_error("naver", e, "KR")
+        print(f"[NaverAPI] 호출 오류 (keyword={keyword}): {e}")
+        return {"items": [], "total": 0}
+
+
+async def _call_naver_news_async(keyword: str, display: int = 10, start: int = 1) -> dict:
+    """_call_naver_news 의 비동기 버전 (이벤트 루프 공용 AsyncClient 사용)"""
+    request = _naver_request(keyword, display, start)
+    if request is None:
+        return {"items": [], "total": 0}
+    headers, params = request
+    await asyncio.to_thread(record_call, keyword, "sector" if start == 1 else "page")
+
+    try:
+        with stage("naver", "KR"):
+            response = await get_async_http_client().get(
+                NAVER_NEWS_URL, headers=headers, params=params, timeout=8
+            )
+            response.raise_for_status()
+            data = response.json()
+        return {
+            "items": data.get("items", []),
+            "total": data.get("total", 0),
+        }
+    except Exception as e:
+        record_upstream_error("naver", e, "KR")
         print(f"[NaverAPI] 호출 오류 (keyword={keyword}): {e}")
         return {"items": [], "total": 0}
 
@@ -452,25 +658,7 @@ def _calc_change_rate(articles: List[NewsItem]) -> float:
     뉴스 제목에서 긍정/부정 단어 빈도로 간단한 감성 점수 계산.
     반환: -5.0 ~ +5.0 범위의 float
     """
-    positive_words = ["상승", "급등", "호재", "수주", "성장", "흑자", "신고가", "확대", "개선", "돌파"]
-    negative_words = ["하락", "급락", "악재", "손실", "적자", "위기", "감소", "부진", "하향", "경고"]
-
-    pos = sum(
-        1 for a in articles
-        for w in positive_words if w in a.title
-    )
-    neg = sum(
-        1 for a in articles
-        for w in negative_words if w in a.title
-    )
-
-    total = pos + neg
-    if total == 0:
-        return 0.0
-
-    # 범위: -5 ~ +5 (히트맵 색상용)
-    score = ((pos - neg) / total) * 5.0
-    return round(score, 2)
+    return score_titles([a.title for a in articles], "KR").aggregate
 
 
 def _extract_rising_keywords(articles: List[NewsItem], max_keywords: int = 8) -> List[str]:
@@ -487,97 +675,769 @@ def _extract_rising_keywords(articles: List[NewsItem], max_keywords: int = 8) ->
     return [w for w, _ in counter.most_common(max_keywords)]
 
 
-def fetch_sector_news(sector_id: str, display: int = 10, page: int = 1) -> Optional[SectorNewsResult]:
+def sector_cache_key(sector_id: str, page: int = 1) -> str:
+    """섹터 뉴스 캐시 키 (KR: sector_*, US: us_sector_*)"""
+    if sector_id.startswith("US_"):
+        return f"us_sector_{sector_id}_{page}"
+    return f"sector_{sector_id}_{page}"
+
+
+# ─────────────────────────────────────────────
+# 다중 키워드 수집 단계 (1페이지: 섹터의 모든 키워드를 동시에 조회 후 병합)
+# ─────────────────────────────────────────────
+
+MULTI_KEYWORD = os.getenv("SECTOR_MULTI_KEYWORD", "1") == "1"
+# 보조 키워드(2번째 이후)의 키워드별 일일 호출 예산. 기본: 한도의 80% 를 전체 키워드 수로 나눈 값
+NAVER_KEYWORD_BUDGET = int(os.getenv(
+    "NAVER_KEYWORD_BUDGET",
+    str(int(NAVER_DAILY_LIMIT * 0.8) // max(sum(len(m["keywords"]) for m in SECTOR_META.values()), 1)),
+))
+# 동기 경로용 공용 풀 (작업이 다시 풀에 제출하지 않으므로 중첩 사용해도 교착 없음)
+_keyword_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="keyword")
+
+
+def _map_keywords(fn: Callable[[str], dict], keywords: List[str]) -> List[dict]:
+    """키워드별 동시 호출. 풀 스레드에도 호출 측 contextvars(지표 섹터 라벨)를 복사해 실행"""
+    contexts = [contextvars.copy_context() for _ in keywords]
+    return list(_keyword_executor.map(lambda ctx, kw: ctx.run(fn, kw), contexts, keywords))
+
+
+def _sector_keywords(meta: dict, page: int) -> List[str]:
+    """조회할 키워드 목록 (2페이지 이후는 기존처럼 첫 번째 키워드만)"""
+    if page != 1 or not MULTI_KEYWORD:
+        return meta["keywords"][:1]
+    return meta["keywords"]
+
+
+def _budgeted_naver_keywords(keywords: List[str]) -> List[str]:
+    """첫 번째 키워드는 항상 조회, 보조 키워드는 일일 예산 안에서만 조회"""
+    return keywords[:1] + [kw for kw in keywords[1:] if allow_keyword(kw, NAVER_KEYWORD_BUDGET)]
+
+
+def _merge_keyword_results(results: List[dict], limit: int, keywords: List[str]) -> dict:
     """
-    단일 섹터의 뉴스를 캐시 우선으로 가져옴.
-    캐시 미스 시 네이버 API 호출 후 캐시 저장.
-    page: 페이지 번호 (1부터 시작)
+    키워드별 결과 병합: 원본 링크/정규화 제목으로 중복 제거 → pubDate 최신순 → 상위 limit 건.
+    전체 건수는 키워드별 total 합에 표본의 고유 기사 비율을 곱해 추정 (키워드 간 겹침 보정).
+    keywords: 기사를 돌려준 키워드 (예산 초과로 건너뛰었거나 오류로 빈 응답인 키워드 제외, 유입 속도 관측용)
     """
-    if sector_id not in SECTOR_META:
-        print(f"[NewsCollector] 알 수 없는 sector_id: {sector_id}")
-        return None
+    seen_links, seen_titles = set(), set()
+    merged, sampled = [], 0
+    for result in results:
+        for item in result["items"]:
+            sampled += 1
+            link  = item.get("originallink") or item.get("link") or ""
+            title = normalize_title(item.get("title", ""))
+            if (link and link in seen_links) or (title and title in seen_titles):
+                continue
+            seen_links.add(link)
+            seen_titles.add(title)
+            merged.append(item)
+
+    merged.sort(key=lambda i: parse_pub_date(i.get("pubDate", "")) or 0.0, reverse=True)
+    unique_ratio = len(merged) / sampled if sampled else 1.0
+    total = int(sum(r["total"] for r in results) * unique_ratio)
+    answered = [kw for kw, result in zip(keywords, results) if result["items"]]
+    return {"items": merged[:limit], "total": total, "keywords": answered}
+
+
+def _collect_naver_items(meta: dict, display: int, page: int) -> dict:
+    """KR 섹터 원본 기사 수집 (키워드 동시 조회 + 병합, 기사를 돌려준 키워드는 "keywords")"""
+    start    = (page - 1) * display + 1   # 네이버 API start 파라미터
+    keywords = _budgeted_naver_keywords(_sector_keywords(meta, page))
+    if len(keywords) == 1:
+        return {**_call_naver_news(keywords[0], display=display, start=start), "keywords": keywords}
+    results = _map_keywords(lambda kw: _call_naver_news(kw, display=display, start=start), keywords)
+    return _merge_keyword_results(results, display, keywords)
+
+
+async def _collect_naver_items_async(meta: dict, display: int, page: int) -> dict:
+    """_collect_naver_items 의 비동기 버전"""
+    start    = (page - 1) * display + 1
+    keywords = await asyncio.to_thread(_budgeted_naver_keywords, _sector_keywords(meta, page))
+    if len(keywords) == 1:
+        return {**await _call_naver_news_async(keywords[0], display=display, start=start), "keywords": keywords}
+    results = await asyncio.gather(
+        *(_call_naver_news_async(kw, display=display, start=start) for kw in keywords)
+    )
+    return _merge_keyword_results(list(results), display, keywords)
 
-    cache_key = f"sector_{sector_id}_{page}"
-    cached = load_cache(cache_key)
-    if cached:
-        return SectorNewsResult(**cached)
 
-    # 캐시 미스 → API 호출
-    meta     = SECTOR_META[sector_id]
-    keyword  = meta["keywords"][0]   # 첫 번째 키워드 사용
-    start    = (page - 1) * display + 1   # 네이버 API start 파라미터
-    api_result = _call_naver_news(keyword, display=display, start=start)
-    raw_items  = api_result["items"]
-    total_count = api_result["total"]   # 해당 키워드의 전체 뉴스 수
+def _collect_google_items(meta: dict, max_items: int, page: int) -> dict:
+    """US 섹터 원본 기사 수집 (Google RSS 는 호출 제한이 없어 예산 없이 전체 키워드 조회)"""
+    keywords = _sector_keywords(meta, page)
+    if len(keywords) == 1:
+        return {**_call_google_news_rss(keywords[0], max_items=max_items), "keywords": keywords}
+    results = _map_keywords(lambda kw: _call_google_news_rss(kw, max_items=max_items), keywords)
+    return _merge_keyword_results(results, max_items, keywords)
+
+
+async def _collect_google_items_async(meta: dict, max_items: int, page: int) -> dict:
+    """_collect_google_items 의 비동기 버전"""
+    keywords = _sector_keywords(meta, page)
+    if len(keywords) == 1:
+        return {**await _call_google_news_rss_async(keywords[0], max_items=max_items), "keywords": keywords}
+    results = await asyncio.gather(
+        *(_call_google_news_rss_async(kw, max_items=max_items) for kw in keywords)
+    )
+    return _merge_keyword_results(list(results), max_items, keywords)
+
+
+# ─────────────────────────────────────────────
+# 섹터 결과 생성 단계 (KR/US, 동기/비동기 공용)
+# ─────────────────────────────────────────────
 
-    # 1단계: 기사 파싱 + 사전 매칭
+def _parse_raw_items(raw_items: list, sector_id: str, market: str) -> List[dict]:
+    """1단계: 기사 파싱 + 사전 매칭"""
     parsed_articles = []
-    for item in raw_items:
-        title = _strip_html(item.get("title", ""))
-        desc  = _strip_html(item.get("description", ""))
-        dict_companies = _extract_companies(title + " " + desc, sector_id)
+    # 페이지 전체 제목/설명을 한 번에 정규화
+    for item, text in zip(raw_items, normalize_items(raw_items)):
+        title = text["title"]
+        desc  = text["description"]
+        dict_companies = _extract_companies(title, desc, sector_id)
         parsed_articles.append({
             "title": title,
             "description": desc,
             "link": item.get("link", ""),
             "pubDate": item.get("pubDate", ""),
-            "original_link": item.get("originallink"),
+            "original_link": item.get("originallink") if market == "KR" else item.get("link"),
             "dict_companies": dict_companies,
         })
+    return parsed_articles
 
-    # 2단계: AI 배치 분석 (섹터 검증 + 기업명 + 분류 사유)
-    ai_input = [{"title": p["title"], "description": p["description"]} for p in parsed_articles]
-    ai_results = _analyze_articles_ai_batch(
-        ai_input, meta["name"], meta["category_name"], market="KR"
-    )
 
-    # 3단계: AI 결과 병합 + 부적합 기사 필터링
+def _merge_ai_results(parsed_articles: List[dict], ai_results: List[dict], market: str) -> List[NewsItem]:
+    """3단계: AI 결과 병합 + 부적합 기사 필터링"""
+    source = "Naver" if market == "KR" else "Google News"
     articles: List[NewsItem] = []
     for parsed, ai in zip(parsed_articles, ai_results):
         if not ai["is_relevant"]:
             continue
 
         # 기업명: 사전 매칭 결과 우선, 없으면 AI 결과 사용 + 가짜 기업명 필터링
-        companies = parsed["dict_companies"] if parsed["dict_companies"] else _filter_fake_companies(ai["companies"])
+        companies = parsed["dict_companies"] if parsed["dict_companies"] else filter_fake_companies(ai["companies"])
         articles.append(NewsItem(
             title       = parsed["title"],
             link        = parsed["link"],
             description = parsed["description"],
             pubDate     = parsed["pubDate"],
-            source      = "Naver",
+            source      = source,
             original_link = parsed["original_link"],
             related_companies = companies,
             ai_classification_reason = ai["reason"] if ai["reason"] else None,
             summary     = ai["summary"] if ai.get("summary") else None,
         ))
+    return articles
+
 
+def _finalize_sector_result(
+    sector_id: str,
+    meta: dict,
+    articles: List[NewsItem],
+    total_count: int,
+    sector_briefing: Optional[str],
+    market: str,
+) -> SectorNewsResult:
+    """4단계: 히트맵 지표 계산 + SectorNewsResult 구성"""
     # 히트맵 크기: API가 반환한 전체 뉴스 수 (실제 기사는 display개만 표시용)
     news_volume  = float(total_count) if total_count > 0 else float(len(articles))
-    change_rate  = _calc_change_rate(articles)
+    change_rate  = _calc_change_rate(articles) if market == "KR" else _calc_us_change_rate(articles)
     cached_at    = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
+    rising_keywords = _extract_rising_keywords(articles)
+
+    with stage("validate", market):
+        return SectorNewsResult(
+            sector_id     = sector_id,
+            sector_name   = meta["name"],
+            category_id   = meta["category_id"],
+            category_name = meta["category_name"],
+            articles      = articles,
+            news_volume   = news_volume,
+            change_rate   = change_rate,
+            cached_at     = cached_at,
+            sector_briefing = sector_briefing,
+            rising_keywords = rising_keywords,
+        )
+
+
+def _ai_input(parsed_articles: List[dict]) -> List[dict]:
+    return [
+        {"title": p["title"], "description": p["description"], "link": p["original_link"] or p["link"]}
+        for p in parsed_articles
+    ]
+
+
+def _analyze_raw_items(sector_id: str, meta: dict, raw_items: list, market: str) -> List[NewsItem]:
+    """원본 기사 → AI 분석(섹터 검증 + 기업명 + 분류 사유) → 적합 기사 (브리핑 없음)"""
+    parsed_articles = _parse_raw_items(raw_items, sector_id, market)
+
+    # 2단계: AI 배치 분석
+    ai_results = _analyze_articles_ai_batch(
+        _ai_input(parsed_articles), meta["name"], meta["category_name"], market=market
+    )
+    return _merge_ai_results(parsed_articles, ai_results, market)
+
+
+async def _analyze_raw_items_async(sector_id: str, meta: dict, raw_items: list, market: str) -> List[NewsItem]:
+    """_analyze_raw_items 의 비동기 버전"""
+    parsed_articles = _parse_raw_items(raw_items, sector_id, market)
+    ai_results = await _analyze_articles_ai_batch_async(
+        _ai_input(parsed_articles), meta["name"], meta["category_name"], market=market
+    )
+    return _merge_ai_results(parsed_articles, ai_results, market)
+
+
+def _split_window_analyses(
+    raw_items: list,
+    parsed_articles: List[dict],
+    ai_results: List[dict],
+    market: str,
+) -> Tuple[List[NewsItem], list, list]:
+    """
+    증분 갱신용 분석 결과 분리. 반환: (윈도우에 넣을 적합 기사, 분석된 원본 기사, 분석 못 한 원본 기사)
+    분석 못 한 기사(GPT 실패/응답 누락)는 윈도우에 넣지 않고 처리 완료로도 보지 않음 → 다음 갱신 때 다시 분석.
+    LLM 이 꺼져 있으면 기본값이 유일한 결과이므로 윈도우에는 넣되 처리 완료로 보지 않음
+    (LLM 이 켜지면 다음 갱신 때 분석해 같은 링크의 기사를 교체)
+    """
+    analyzed = [ai.get("analyzed", True) for ai in ai_results]
+    if llm_enabled():
+        kept = [(p, ai) for p, ai, ok in zip(parsed_articles, ai_results, analyzed) if ok]
+        parsed_articles, ai_results = [p for p, _ in kept], [ai for _, ai in kept]
+    articles = _merge_ai_results(parsed_articles, ai_results, market)
+    done    = [raw for raw, ok in zip(raw_items, analyzed) if ok]
+    pending = [raw for raw, ok in zip(raw_items, analyzed) if not ok]
+    return articles, done, pending
+
+
+def _analyze_window_items(sector_id: str, meta: dict, raw_items: list, market: str) -> Tuple[List[NewsItem], list, list]:
+    """증분 갱신의 새 원본 기사 분석 (_split_window_analyses 참고)"""
+    parsed_articles = _parse_raw_items(raw_items, sector_id, market)
+    ai_results = _analyze_articles_ai_batch(
+        _ai_input(parsed_articles), meta["name"], meta["category_name"], market=market
+    )
+    return _split_window_analyses(raw_items, parsed_articles, ai_results, market)
+
+
+async def _analyze_window_items_async(
+    sector_id: str, meta: dict, raw_items: list, market: str
+) -> Tuple[List[NewsItem], list, list]:
+    """_analyze_window_items 의 비동기 버전"""
+    parsed_articles = _parse_raw_items(raw_items, sector_id, market)
+    ai_results = await _analyze_articles_ai_batch_async(
+        _ai_input(parsed_articles), meta["name"], meta["category_name"], market=market
+    )
+    return _split_window_analyses(raw_items, parsed_articles, ai_results, market)
+
+
+def _build_sector_result(
+    sector_id: str,
+    meta: dict,
+    raw_items: list,
+    total_count: int,
+    market: str,
+) -> SectorNewsResult:
+    """수집된 원본 기사 → AI 분석(섹터 검증 + 기업명 + 분류 사유) → SectorNewsResult"""
+    articles = _analyze_raw_items(sector_id, meta, raw_items, market)
     sector_briefing = _generate_sector_briefing(
-        meta["name"], meta["category_name"], articles, market="KR"
+        meta["name"], meta["category_name"], articles, market=market
     ) if articles else None
-    rising_keywords = _extract_rising_keywords(articles)
+    return _finalize_sector_result(sector_id, meta, articles, total_count, sector_briefing, market)
+
+
+async def _build_sector_result_async(
+    sector_id: str,
+    meta: dict,
+    raw_items: list,
+    total_count: int,
+    market: str,
+) -> SectorNewsResult:
+    """_build_sector_result 의 비동기 버전"""
+    articles = await _analyze_raw_items_async(sector_id, meta, raw_items, market)
+    sector_briefing = await _generate_sector_briefing_async(
+        meta["name"], meta["category_name"], articles, market=market
+    ) if articles else None
+    return _finalize_sector_result(sector_id, meta, articles, total_count, sector_briefing, market)
+
+
+# ─── 증분 갱신 (1페이지 전용): 커서 이후 새 기사만 분석해 롤링 윈도우에 병합 ───
+
+def _window_result(
+    window: SectorWindow,
+    sector_id: str,
+    meta: dict,
+    total_count: int,
+    display: int,
+    market: str,
+) -> SectorNewsResult:
+    """윈도우 상위 display 건으로 결과 구성 (API 실패로 total 이 0 이면 직전 값 유지)"""
+    articles = [NewsItem(**a) for a in window.articles[:display]]
+    return _finalize_sector_result(
+        sector_id, meta, articles, total_count or window.total, window.briefing, market
+    )
+
+
+def _plan_incremental(sector_id: str, raw_items: list) -> Tuple[Optional[SectorWindow], list]:
+    """기존 윈도우와 그 커서 이후의 새 원본 기사 반환 (윈도우 없으면 전체가 새 기사)"""
+    window = get_window(sector_id)
+    if window is None:
+        return None, raw_items
+    return window, window.new_items(raw_items)
+
+
+def _apply_to_window(
+    window: Optional[SectorWindow],
+    sector_id: str,
+    done_raw: list,
+    pending_raw: list,
+    fresh: List[NewsItem],
+    total_count: int,
+) -> Tuple[SectorWindow, bool]:
+    """새 기사 병합 (분석 못 한 pending_raw 는 다음 갱신 때 다시 받도록). 반환: (윈도우, 브리핑 재생성 필요 여부)"""
+    count_refresh("full" if window is None else "incremental")
+    if window is None:
+        window = SectorWindow(sector_id=sector_id)
+    window.merge(done_raw, [a.model_dump() for a in fresh], total_count, pending_raw)
+    needs_briefing = bool(fresh) or (window.briefing is None and bool(window.articles))
+    return window, needs_briefing
+
+
+def _build_sector_result_incremental(
+    sector_id: str,
+    meta: dict,
+    raw_items: list,
+    total_count: int,
+    display: int,
+    market: str,
+) -> SectorNewsResult:
+    """
+    _build_sector_result 의 증분 버전.
+    새 기사가 없으면 AI 분석·브리핑 없이 직전 윈도우로 결과를 다시 구성한다.
+    """
+    window, new_raw = _plan_incremental(sector_id, raw_items)
+    if window is not None and not new_raw:
+        count_refresh("unchanged")
+        return _window_result(window, sector_id, meta, total_count, display, market)
+
+    fresh, done_raw, pending_raw = _analyze_window_items(sector_id, meta, new_raw, market)
+
+    window, needs_briefing = _apply_to_window(window, sector_id, done_raw, pending_raw, fresh, total_count)
+    if needs_briefing:
+        shown = [NewsItem(**a) for a in window.articles[:display]]
+        window.briefing = _generate_sector_briefing(
+            meta["name"], meta["category_name"], shown, market=market
+        ) if shown else None
+    save_window(window)
+    return _window_result(window, sector_id, meta, total_count, display, market)
+
+
+async def _build_sector_result_incremental_async(
+    sector_id: str,
+    meta: dict,
+    raw_items: list,
+    total_count: int,
+    display: int,
+    market: str,
+) -> SectorNewsResult:
+    """_build_sector_result_incremental 의 비동기 버전"""
+    # 윈도우 파일 읽기/쓰기는 이벤트 루프 밖에서
+    window, new_raw = await asyncio.to_thread(_plan_incremental, sector_id, raw_items)
+    if window is not None and not new_raw:
+        count_refresh("unchanged")
+        return _window_result(window, sector_id, meta, total_count, display, market)
+
+    fresh, done_raw, pending_raw = await _analyze_window_items_async(sector_id, meta, new_raw, market)
+
+    window, needs_briefing = _apply_to_window(window, sector_id, done_raw, pending_raw, fresh, total_count)
+    if needs_briefing:
+        shown = [NewsItem(**a) for a in window.articles[:display]]
+        window.briefing = await _generate_sector_briefing_async(
+            meta["name"], meta["category_name"], shown, market=market
+        ) if shown else None
+    await asyncio.to_thread(save_window, window)
+    return _window_result(window, sector_id, meta, total_count, display, market)
+
+
+def _store_sector_result(cache_key: str, page: int, market: str, result: SectorNewsResult) -> None:
+    """기사 저장소 반영 + 다음 페이지 커서 + 캐시 저장 (L1: 객체 그대로, L2: dict 직렬화) + 히트맵 스냅샷 갱신"""
+    upsert_sector_articles(result.sector_id, result.articles)
+    result.next_cursor = (
+        encode_cursor(result.sector_id, sector_position(result.articles[-1])) if result.articles else None
+    )
+    save_cache(cache_key, result)
+    # 히트맵은 1페이지 결과만 사용 → 섹터 상태 저장 + 스냅샷 증분 갱신
+    if page == 1:
+        save_sector_state(result.sector_id, market, int(result.news_volume), result.sector_briefing)
+        publish_sector(market, result)
+
+
+def _store_upstream_result(
+    cache_key: str,
+    page: int,
+    market: str,
+    result: SectorNewsResult,
+    raw_items: list,
+    keywords: List[str],
+) -> None:
+    """업스트림 조회 결과 저장 + 1페이지면 유입 속도 관측 (비동기 경로는 이 함수를 스레드에서 실행)"""
+    _store_sector_result(cache_key, page, market, result)
+    if page == 1:
+        record_refresh(result.sector_id, raw_items, keywords)
+
+
+def sector_result_from_store(
+    sector_id: str,
+    display: int = 10,
+    page: int = 1,
+    full_page_only: bool = False,
+) -> Optional[SectorNewsResult]:
+    """
+    기사 저장소 쿼리만으로 섹터 결과 구성 (업스트림/AI 호출 없음).
+    섹터가 한 번도 갱신된 적 없거나, full_page_only 인데 한 페이지가 다 차지 않으면 None.
+    """
+    is_us = sector_id.startswith("US_")
+    meta = (US_SECTOR_META if is_us else SECTOR_META).get(sector_id)
+    state = get_sector_state(sector_id) if meta else None
+    if state is None:
+        return None
+    articles = query_sector_articles(sector_id, display, (page - 1) * display)
+    if full_page_only and len(articles) < display:
+        return None
+    return _finalize_sector_result(
+        sector_id, meta, articles, state["total"], state["briefing"], "US" if is_us else "KR"
+    )
+
+
+def _stored_kr_result(sector_id: str, display: int, page: int) -> Optional[SectorNewsResult]:
+    """
+    KR 섹터를 네이버 호출 없이 저장소로 응답할 수 있으면 그 결과.
+    - 2페이지 이후: 저장소에 한 페이지가 다 차 있을 때
+    - 호출량 압박으로 이 페이지의 업스트림 조회를 미루는 중: 저장소에 있는 만큼 (섹터가 갱신된 적 없으면 None)
+    """
+    if allow_page_fetch(page):
+        return sector_result_from_store(sector_id, display, page, full_page_only=True) if page > 1 else None
+    return sector_result_from_store(sector_id, display, page)
+
+
+# ─── 커서 페이지: 저장소의 섹터 기사 목록에서 (발행시각, 링크) 위치 다음부터 조회 ───
+
+# 네이버 start 최대 1,000
+MAX_BACKFILL_START  = 1000
+# 커서 한 번에 업스트림에서 보충하는 최대 횟수 (AI 가 많이 걸러내는 섹터도 응답 지연에 상한)
+MAX_BACKFILL_ROUNDS = int(os.getenv("MAX_BACKFILL_ROUNDS", "5"))
+
+
+def _sector_context(sector_id: str) -> Optional[Tuple[dict, str]]:
+    if sector_id in US_SECTOR_META:
+        return US_SECTOR_META[sector_id], "US"
+    if sector_id in SECTOR_META:
+        return SECTOR_META[sector_id], "KR"
+    return None
+
+
+def _next_backfill_start(sector_id: str, display: int) -> Optional[int]:
+    """
+    저장소가 바닥났을 때 업스트림에서 받아 올 다음 시작 위치 (1부터, 섹터별로 기록한 진행 위치).
+    AI 가 걸러낸 기사는 저장소에 남지 않으므로 저장된 기사 수가 아니라 실제로 받은 위치를 따라간다.
+    섹터가 갱신된 적 없거나, 업스트림 결과를 다 받았거나, KR 섹터인데 네이버 호출량 압박으로
+    깊은 페이지를 미루는 중이면 None.
+    """
+    state = get_sector_state(sector_id)
+    if state is None:
+        return None
+    start = state["backfill_start"] or display + 1
+    if start > min(state["total"], MAX_BACKFILL_START):
+        return None
+    if sector_id in SECTOR_META and not allow_page_fetch((start - 1) // display + 1):
+        return None
+    return start
+
+
+def _backfill_raw_items(meta: dict, market: str, start: int, display: int) -> list:
+    """업스트림 start 위치부터 display 건 (2페이지 이후처럼 첫 번째 키워드만)"""
+    keyword = meta["keywords"][0]
+    if market == "US":
+        # Google RSS는 start 파라미터 미지원 → offset으로 슬라이싱
+        return _call_google_news_rss(keyword, max_items=start - 1 + display)["items"][start - 1:]
+    return _call_naver_news(keyword, display=display, start=start, source="page")["items"]
+
+
+async def _backfill_raw_items_async(meta: dict, market: str, start: int, display: int) -> list:
+    """_backfill_raw_items 의 비동기 버전"""
+    keyword = meta["keywords"][0]
+    if market == "US":
+        result = await _call_google_news_rss_async(keyword, max_items=start - 1 + display)
+        return result["items"][start - 1:]
+    return (await _call_naver_news_async(keyword, display=display, start=start))["items"]
+
+
+def _save_backfill(sector_id: str, articles: List[NewsItem], next_start: int) -> None:
+    upsert_sector_articles(sector_id, articles)
+    advance_backfill(sector_id, next_start)
+
+
+def _backfill_sector(
+    sector_id: str,
+    meta: dict,
+    market: str,
+    display: int,
+    after: Tuple[float, str],
+) -> Tuple[list, bool]:
+    """
+    커서 다음 기사가 한 페이지가 될 때까지 업스트림 다음 위치를 받아 저장소 보충 (최대 MAX_BACKFILL_ROUNDS 회).
+    반환: (커서 다음 기사 행, 더 받아 올 기사가 남았는지)
+    """
+    rows = query_sector_page(sector_id, display, after)
+    rounds = 0
+    while len(rows) < display:
+        start = _next_backfill_start(sector_id, display)
+        if start is None:
+            return rows, False
+        if rounds == MAX_BACKFILL_ROUNDS:
+            return rows, True
+        raw_items = _backfill_raw_items(meta, market, start, display)
+        if not raw_items:
+            return rows, False
+        _save_backfill(sector_id, _analyze_raw_items(sector_id, meta, raw_items, market), start + len(raw_items))
+        rows = query_sector_page(sector_id, display, after)
+        rounds += 1
+    return rows, True
+
+
+async def _backfill_sector_async(
+    sector_id: str,
+    meta: dict,
+    market: str,
+    display: int,
+    after: Tuple[float, str],
+) -> Tuple[list, bool]:
+    """_backfill_sector 의 비동기 버전 (기사 저장소 접근은 이벤트 루프 밖에서)"""
+    rows = await asyncio.to_thread(query_sector_page, sector_id, display, after)
+    rounds = 0
+    while len(rows) < display:
+        start = await asyncio.to_thread(_next_backfill_start, sector_id, display)
+        if start is None:
+            return rows, False
+        if rounds == MAX_BACKFILL_ROUNDS:
+            return rows, True
+        raw_items = await _backfill_raw_items_async(meta, market, start, display)
+        if not raw_items:
+            return rows, False
+        articles = await _analyze_raw_items_async(sector_id, meta, raw_items, market)
+        await asyncio.to_thread(_save_backfill, sector_id, articles, start + len(raw_items))
+        rows = await asyncio.to_thread(query_sector_page, sector_id, display, after)
+        rounds += 1
+    return rows, True
+
+
+def _cursor_result(
+    sector_id: str,
+    meta: dict,
+    market: str,
+    rows: list,
+    cursor: str,
+    more: bool,
+) -> SectorNewsResult:
+    """
+    커서 페이지 결과. 다음 커서는 마지막 기사 위치 (보충 횟수 한도로 한 페이지를 못 채웠지만
+    업스트림에 더 남았으면 기사가 없어도 같은 커서를 돌려줘 이어서 받게 함)
+    """
+    state = get_sector_state(sector_id) or {"total": 0, "briefing": None}
+    result = _finalize_sector_result(
+        sector_id, meta, [item for item, _ in rows], state["total"], state["briefing"], market
+    )
+    if more:
+        result.next_cursor = encode_cursor(sector_id, rows[-1][1]) if rows else cursor
+    return result
+
+
+def fetch_sector_news_by_cursor(
+    sector_id: str,
+    cursor: str,
+    display: int = 10,
+) -> Optional[SectorNewsResult]:
+    """
+    커서 다음 페이지 (KR/US 공용). 저장소에 남은 기사로 응답하고,
+    한 페이지가 안 되면 업스트림 다음 위치를 받아 채워질 때까지 보충한다.
+    잘못된 커서면 ValueError.
+    """
+    context = _sector_context(sector_id)
+    if context is None:
+        print(f"[NewsCollector] 알 수 없는 sector_id: {sector_id}")
+        return None
+    meta, market = context
+    after = decode_cursor(cursor, sector_id)
+
+    rows, more = _backfill_sector(sector_id, meta, market, display, after)
+    return _cursor_result(sector_id, meta, market, rows, cursor, more)
+
+
+async def fetch_sector_news_by_cursor_async(
+    sector_id: str,
+    cursor: str,
+    display: int = 10,
+) -> Optional[SectorNewsResult]:
+    """fetch_sector_news_by_cursor 의 비동기 버전"""
+    context = _sector_context(sector_id)
+    if context is None:
+        print(f"[NewsCollector] 알 수 없는 sector_id: {sector_id}")
+        return None
+    meta, market = context
+    after = decode_cursor(cursor, sector_id)
+
+    rows, more = await _backfill_sector_async(sector_id, meta, market, display, after)
+    return await asyncio.to_thread(_cursor_result, sector_id, meta, market, rows, cursor, more)
+
+
+# ─────────────────────────────────────────────
+# KR 섹터 조회 (네이버 뉴스 API)
+# ─────────────────────────────────────────────
+
+@sector_scope("KR")
+def fetch_sector_news(
+    sector_id: str,
+    display: int = 10,
+    page: int = 1,
+    force_refresh: bool = False,
+) -> Optional[SectorNewsResult]:
+    """
+    단일 섹터의 뉴스를 캐시 우선으로 가져옴.
+    캐시 미스 시 네이버 API 호출 후 캐시 저장.
+    page: 페이지 번호 (1부터 시작)
+    force_refresh: True 면 캐시를 무시하고 재조회 (백그라운드 사전 갱신용)
+    """
+    if sector_id not in SECTOR_META:
+        print(f"[NewsCollector] 알 수 없는 sector_id: {sector_id}")
+        return None
 
-    result = SectorNewsResult(
-        sector_id     = sector_id,
-        sector_name   = meta["name"],
-        category_id   = meta["category_id"],
-        category_name = meta["category_name"],
-        articles      = articles,
-        news_volume   = news_volume,
-        change_rate   = change_rate,
-        cached_at     = cached_at,
-        sector_briefing = sector_briefing,
-        rising_keywords = rising_keywords,
+    cache_key = sector_cache_key(sector_id, page)
+    if not force_refresh:
+        # 유예 구간이면 만료된 결과를 바로 반환하고 백그라운드에서 재조회
+        cached = load_cache_swr(
+            cache_key, SectorNewsResult,
+            lambda: fetch_sector_news(sector_id, display, page, force_refresh=True),
+        )
+        if cached:
+            tracing.tag("cache", "hit")
+            return cached
+
+    # 캐시 미스 → 같은 키의 동시 미스는 한 번만 업스트림 호출
+    tracing.tag("cache", "refresh" if force_refresh else "miss")
+    return _sector_flight.do(
+        cache_key,
+        lambda: _locked_upstream(
+            cache_key, force_refresh,
+            lambda: _fetch_sector_news_upstream(sector_id, display, page, cache_key, force_refresh),
+        ),
     )
 
-    # 캐시 저장 (Pydantic → dict)
-    save_cache(cache_key, result.model_dump())
+
+@sector_scope("KR")
+async def fetch_sector_news_async(
+    sector_id: str,
+    display: int = 10,
+    page: int = 1,
+    force_refresh: bool = False,
+) -> Optional[SectorNewsResult]:
+    """fetch_sector_news 의 비동기 버전 (라우트/스케줄러용, 워커 스레드를 점유하지 않음)"""
+    if sector_id not in SECTOR_META:
+        print(f"[NewsCollector] 알 수 없는 sector_id: {sector_id}")
+        return None
+
+    cache_key = sector_cache_key(sector_id, page)
+    if not force_refresh:
+        # 캐시 파일/색인 조회는 이벤트 루프 밖에서
+        cached = await asyncio.to_thread(
+            load_cache_swr, cache_key, SectorNewsResult,
+            lambda: fetch_sector_news(sector_id, display, page, force_refresh=True),
+        )
+        if cached:
+            tracing.tag("cache", "hit")
+            return cached
+
+    tracing.tag("cache", "refresh" if force_refresh else "miss")
+    return await _sector_flight.do_async(
+        cache_key,
+        lambda: _locked_upstream_async(
+            cache_key, force_refresh,
+            lambda: _fetch_sector_news_upstream_async(sector_id, display, page, cache_key, force_refresh),
+        ),
+    )
+
+
+def _fetch_sector_news_upstream(
+    sector_id: str,
+    display: int,
+    page: int,
+    cache_key: str,
+    force_refresh: bool,
+) -> SectorNewsResult:
+    """네이버 API 호출 → AI 분석 → 캐시 저장 (single-flight leader 만 실행)"""
+    if not force_refresh:
+        # 앞선 leader 가 방금 저장했을 수 있음
+        cached = load_cache(cache_key, SectorNewsResult)
+        if cached:
+            return cached
+
+    # 2페이지 이후(또는 호출량 압박 중)는 저장소로 응답할 수 있으면 쿼리로 응답 (업스트림/AI 호출 없음)
+    stored = _stored_kr_result(sector_id, display, page)
+    if stored is not None:
+        _store_sector_result(cache_key, page, "KR", stored)
+        return stored
+
+    meta       = SECTOR_META[sector_id]
+    api_result = _collect_naver_items(meta, display, page)
+
+    if page == 1 and INCREMENTAL_REFRESH:
+        result = _build_sector_result_incremental(
+            sector_id, meta, api_result["items"], api_result["total"], display, "KR"
+        )
+    else:
+        result = _build_sector_result(sector_id, meta, api_result["items"], api_result["total"], "KR")
+    _store_upstream_result(cache_key, page, "KR", result, api_result["items"], api_result["keywords"])
+    return result
+
+
+async def _fetch_sector_news_upstream_async(
+    sector_id: str,
+    display: int,
+    page: int,
+    cache_key: str,
+    force_refresh: bool,
+) -> SectorNewsResult:
+    """_fetch_sector_news_upstream 의 비동기 버전"""
+    # 캐시 파일/기사 저장소/호출량 원장 접근은 이벤트 루프 밖에서
+    if not force_refresh:
+        cached = await asyncio.to_thread(load_cache, cache_key, SectorNewsResult)
+        if cached:
+            return cached
+
+    # 2페이지 이후(또는 호출량 압박 중)는 저장소로 응답할 수 있으면 쿼리로 응답 (업스트림/AI 호출 없음)
+    stored = await asyncio.to_thread(_stored_kr_result, sector_id, display, page)
+    if stored is not None:
+        await asyncio.to_thread(_store_sector_result, cache_key, page, "KR", stored)
+        return stored
+
+    meta       = SECTOR_META[sector_id]
+    api_result = await _collect_naver_items_async(meta, display, page)
+
+    if page == 1 and INCREMENTAL_REFRESH:
+        result = await _build_sector_result_incremental_async(
+            sector_id, meta, api_result["items"], api_result["total"], display, "KR"
+        )
+    else:
+        result = await _build_sector_result_async(
+            sector_id, meta, api_result["items"], api_result["total"], "KR"
+        )
+    await asyncio.to_thread(
+        _store_upstream_result, cache_key, page, "KR", result, api_result["items"], api_result["keywords"]
+    )
     return result
 
 
+def sector_flight_stats() -> dict:
+    """섹터 조회 single-flight 통계 (leader: 실제 조회, follower: 결과 공유)"""
+    return _sector_flight.stats()
+
+
 def fetch_all_sectors(display: int = 10) -> List[SectorNewsResult]:
     """
     전체 섹터 뉴스 수집 (캐시 활용).
@@ -595,14 +1455,14 @@ def fetch_all_sectors(display: int = 10) -> List[SectorNewsResult]:
 def fetch_naver_news(query: str, display: int = 10):
     """기존 호환용 래퍼"""
     from ..models.news_schema import NewsItem as _NewsItem
-    api_result = _call_naver_news(query, display=display)
+    api_result = _call_naver_news(query, display=display, source="search")
     raw = api_result["items"]
     result = []
     for item in raw:
         result.append(_NewsItem(
-            title       = _strip_html(item.get("title", "")),
+            title       = strip_html(item.get("title", "")),
             link        = item.get("link", ""),
-            description = _strip_html(item.get("description", "")),
+            description = strip_html(item.get("description", "")),
             pubDate     = item.get("pubDate", ""),
             source      = "Naver",
             original_link = item.get("originallink"),
@@ -657,131 +1517,209 @@ US_SECTOR_META = {
 }
 
 
+def _google_rss_params(keyword: str) -> dict:
+    return {"q": keyword, "hl": "en-US", "gl": "US", "ceid": "US:en"}
+
+
+def _parse_google_feed(content: bytes, max_items: int) -> dict:
+    """RSS 본문 파싱 → {"items": [...], "total": RSS 피드 전체 항목 수}"""
+    feed = feedparser.parse(content)
+    total_entries = len(feed.entries)  # RSS 피드 전체 항목 수
+    items = []
+    for entry in feed.entries[:max_items]:
+        items.append({
+            "title":       entry.get("title", ""),
+            "link":        entry.get("link", ""),
+            "description": entry.get("summary", entry.get("title", "")),
+            "pubDate":     entry.get("published", ""),
+            "source":      "Google News",
+        })
+    return {"items": items, "total": total_entries}
+
+
 def _call_google_news_rss(keyword: str, max_items: int = 10) -> dict:
     """
     Google News RSS로 영문 뉴스 검색. 무료, API 키 불필요, 호출 제한 없음.
+    공용 커넥션 풀로 받아온 본문을 feedparser 로 파싱.
     반환: {"items": [...], "total": RSS 피드 전체 항목 수}
     """
-    base_url = "https://news.google.com/rss/search"
-    rss_url = f"{base_url}?q={keyword}&hl=en-US&gl=US&ceid=US:en"
+    try:
+        with stage("google_rss", "US"):
+            response = get_http_client().get(
+                GOOGLE_NEWS_RSS_URL,
+                params=_google_rss_params(keyword),
+                headers={"User-Agent": feedparser.USER_AGENT},
+                follow_redirects=True,
+            )
+            response.raise_for_status()
+            return _parse_google_feed(response.content, max_items)
+    except Exception as e:
+        record_upstream_error("google_rss", e, "US")
+        print(f"[GoogleRSS] 호출 오류 (keyword={keyword}): {e}")
+        return {"items": [], "total": 0}
 
+
+async def _call_google_news_rss_async(keyword: str, max_items: int = 10) -> dict:
+    """_call_google_news_rss 의 비동기 버전"""
     try:
-        feed = feedparser.parse(rss_url)
-        total_entries = len(feed.entries)  # RSS 피드 전체 항목 수
-        items = []
-        for entry in feed.entries[:max_items]:
-            items.append({
-                "title":       entry.get("title", ""),
-                "link":        entry.get("link", ""),
-                "description": entry.get("summary", entry.get("title", "")),
-                "pubDate":     entry.get("published", ""),
-                "source":      "Google News",
-            })
-        return {"items": items, "total": total_entries}
+        with stage("google_rss", "US"):
+            response = await get_async_http_client().get(
+                GOOGLE_NEWS_RSS_URL,
+                params=_google_rss_params(keyword),
+                headers={"User-Agent": feedparser.USER_AGENT},
+                follow_redirects=True,
+            )
+            response.raise_for_status()
+            # feedparser 파싱은 CPU 작업 → 이벤트 루프 밖에서
+            return await asyncio.to_thread(_parse_google_feed, response.content, max_items)
     except Exception as e:
+        record_upstream_error("google_rss", e, "US")
         print(f"[GoogleRSS] 호출 오류 (keyword={keyword}): {e}")
         return {"items": [], "total": 0}
 
 
 def _calc_us_change_rate(articles: List[NewsItem]) -> float:
     """영문 뉴스 제목 기반 감성 점수 계산"""
-    positive_words = ["surge", "soar", "rally", "gain", "rise", "jump", "boom", "record", "growth", "bullish"]
-    negative_words = ["drop", "fall", "plunge", "crash", "decline", "loss", "bear", "slump", "tumble", "warning"]
-
-    pos = sum(1 for a in articles for w in positive_words if w.lower() in a.title.lower())
-    neg = sum(1 for a in articles for w in negative_words if w.lower() in a.title.lower())
+    return score_titles([a.title for a in articles], "US").aggregate
 
-    total = pos + neg
-    if total == 0:
-        return 0.0
-    return round(((pos - neg) / total) * 5.0, 2)
 
-
-def fetch_us_sector_news(sector_id: str, display: int = 10, page: int = 1) -> Optional[SectorNewsResult]:
+@sector_scope("US")
+def fetch_us_sector_news(
+    sector_id: str,
+    display: int = 10,
+    page: int = 1,
+    force_refresh: bool = False,
+) -> Optional[SectorNewsResult]:
     """
     미국 단일 섹터 뉴스 (Google News RSS + 캐시).
     page: 페이지 번호 (1부터 시작)
+    force_refresh: True 면 캐시를 무시하고 재조회 (백그라운드 사전 갱신용)
     """
     if sector_id not in US_SECTOR_META:
         print(f"[NewsCollector] 알 수 없는 US sector_id: {sector_id}")
         return None
 
-    cache_key = f"us_sector_{sector_id}_{page}"
-    cached = load_cache(cache_key)
-    if cached:
-        return SectorNewsResult(**cached)
+    cache_key = sector_cache_key(sector_id, page)
+    if not force_refresh:
+        cached = load_cache_swr(
+            cache_key, SectorNewsResult,
+            lambda: fetch_us_sector_news(sector_id, display, page, force_refresh=True),
+        )
+        if cached:
+            tracing.tag("cache", "hit")
+            return cached
+
+    tracing.tag("cache", "refresh" if force_refresh else "miss")
+    return _sector_flight.do(
+        cache_key,
+        lambda: _locked_upstream(
+            cache_key, force_refresh,
+            lambda: _fetch_us_sector_news_upstream(sector_id, display, page, cache_key, force_refresh),
+        ),
+    )
+
+
+@sector_scope("US")
+async def fetch_us_sector_news_async(
+    sector_id: str,
+    display: int = 10,
+    page: int = 1,
+    force_refresh: bool = False,
+) -> Optional[SectorNewsResult]:
+    """fetch_us_sector_news 의 비동기 버전"""
+    if sector_id not in US_SECTOR_META:
+        print(f"[NewsCollector] 알 수 없는 US sector_id: {sector_id}")
+        return None
+
+    cache_key = sector_cache_key(sector_id, page)
+    if not force_refresh:
+        cached = await asyncio.to_thread(
+            load_cache_swr, cache_key, SectorNewsResult,
+            lambda: fetch_us_sector_news(sector_id, display, page, force_refresh=True),
+        )
+        if cached:
+            tracing.tag("cache", "hit")
+            return cached
+
+    tracing.tag("cache", "refresh" if force_refresh else "miss")
+    return await _sector_flight.do_async(
+        cache_key,
+        lambda: _locked_upstream_async(
+            cache_key, force_refresh,
+            lambda: _fetch_us_sector_news_upstream_async(sector_id, display, page, cache_key, force_refresh),
+        ),
+    )
+
+
+def _fetch_us_sector_news_upstream(
+    sector_id: str,
+    display: int,
+    page: int,
+    cache_key: str,
+    force_refresh: bool,
+) -> SectorNewsResult:
+    """Google News RSS 호출 → AI 분석 → 캐시 저장 (single-flight leader 만 실행)"""
+    if not force_refresh:
+        cached = load_cache(cache_key, SectorNewsResult)
+        if cached:
+            return cached
+
+    # 2페이지 이후는 저장소에 한 페이지가 채워져 있으면 쿼리로 응답 (업스트림/AI 호출 없음)
+    stored = sector_result_from_store(sector_id, display, page, full_page_only=True) if page > 1 else None
+    if stored is not None:
+        _store_sector_result(cache_key, page, "US", stored)
+        return stored
 
     meta = US_SECTOR_META[sector_id]
-    keyword = meta["keywords"][0]
     # Google RSS는 start 파라미터 미지원 → offset으로 슬라이싱
     offset = (page - 1) * display
-    api_result = _call_google_news_rss(keyword, max_items=offset + display)
-    all_items   = api_result["items"]
-    total_count = api_result["total"]   # RSS 피드 전체 항목 수
-    raw_items   = all_items[offset:]    # 현재 페이지에 해당하는 항목만
+    api_result = _collect_google_items(meta, offset + display, page)
+    raw_items  = api_result["items"][offset:]    # 현재 페이지에 해당하는 항목만
 
-    # 1단계: 기사 파싱 + 사전 매칭
-    parsed_articles = []
-    for item in raw_items:
-        title = _strip_html(item.get("title", ""))
-        desc  = _strip_html(item.get("description", ""))
-        dict_companies = _extract_companies(title + " " + desc, sector_id)
-        parsed_articles.append({
-            "title": title,
-            "description": desc,
-            "link": item.get("link", ""),
-            "pubDate": item.get("pubDate", ""),
-            "original_link": item.get("link"),
-            "dict_companies": dict_companies,
-        })
-
-    # 2단계: AI 배치 분석
-    ai_input = [{"title": p["title"], "description": p["description"]} for p in parsed_articles]
-    ai_results = _analyze_articles_ai_batch(
-        ai_input, meta["name"], meta["category_name"], market="US"
-    )
+    if page == 1 and INCREMENTAL_REFRESH:
+        result = _build_sector_result_incremental(
+            sector_id, meta, raw_items, api_result["total"], display, "US"
+        )
+    else:
+        result = _build_sector_result(sector_id, meta, raw_items, api_result["total"], "US")
+    _store_upstream_result(cache_key, page, "US", result, raw_items, api_result["keywords"])
+    return result
 
-    # 3단계: AI 결과 병합 + 부적합 기사 필터링
-    articles: List[NewsItem] = []
-    for parsed, ai in zip(parsed_articles, ai_results):
-        if not ai["is_relevant"]:
-            continue
 
-        companies = parsed["dict_companies"] if parsed["dict_companies"] else _filter_fake_companies(ai["companies"])
-        articles.append(NewsItem(
-            title       = parsed["title"],
-            link        = parsed["link"],
-            description = parsed["description"],
-            pubDate     = parsed["pubDate"],
-            source      = "Google News",
-            original_link = parsed["original_link"],
-            related_companies = companies,
-            ai_classification_reason = ai["reason"] if ai["reason"] else None,
-            summary     = ai["summary"] if ai.get("summary") else None,
-        ))
+async def _fetch_us_sector_news_upstream_async(
+    sector_id: str,
+    display: int,
+    page: int,
+    cache_key: str,
+    force_refresh: bool,
+) -> SectorNewsResult:
+    """_fetch_us_sector_news_upstream 의 비동기 버전"""
+    if not force_refresh:
+        cached = await asyncio.to_thread(load_cache, cache_key, SectorNewsResult)
+        if cached:
+            return cached
+
+    # 2페이지 이후는 저장소에 한 페이지가 채워져 있으면 쿼리로 응답 (업스트림/AI 호출 없음)
+    if page > 1:
+        stored = await asyncio.to_thread(sector_result_from_store, sector_id, display, page, True)
+        if stored is not None:
+            await asyncio.to_thread(_store_sector_result, cache_key, page, "US", stored)
+            return stored
 
-    news_volume = float(total_count) if total_count > 0 else float(len(articles))
-    change_rate = _calc_us_change_rate(articles)
-    cached_at   = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
-    sector_briefing = _generate_sector_briefing(
-        meta["name"], meta["category_name"], articles, market="US"
-    ) if articles else None
-    rising_keywords = _extract_rising_keywords(articles)
+    meta = US_SECTOR_META[sector_id]
+    offset = (page - 1) * display
+    api_result = await _collect_google_items_async(meta, offset + display, page)
+    raw_items  = api_result["items"][offset:]
 
-    result = SectorNewsResult(
-        sector_id     = sector_id,
-        sector_name   = meta["name"],
-        category_id   = meta["category_id"],
-        category_name = meta["category_name"],
-        articles      = articles,
-        news_volume   = news_volume,
-        change_rate   = change_rate,
-        cached_at     = cached_at,
-        sector_briefing = sector_briefing,
-        rising_keywords = rising_keywords,
+    if page == 1 and INCREMENTAL_REFRESH:
+        result = await _build_sector_result_incremental_async(
+            sector_id, meta, raw_items, api_result["total"], display, "US"
+        )
+    else:
+        result = await _build_sector_result_async(sector_id, meta, raw_items, api_result["total"], "US")
+    await asyncio.to_thread(
+        _store_upstream_result, cache_key, page, "US", result, raw_items, api_result["keywords"]
     )
-
-    save_cache(cache_key, result.model_dump())
     return result
 
 
@@ -794,3 +1732,127 @@ def fetch_all_us_sectors(display: int = 10) -> List[SectorNewsResult]:
             results.append(result)
     return results
 
+
+
+# ─────────────────────────────────────────────
+# 캐시 무효화 / 재적재 (관리자용)
+# ─────────────────────────────────────────────
+
+REWARM_CONCURRENCY = 4   # 재적재 동시 조회 수 (네이버/OpenAI 순간 부하 제한)
+
+
+def parse_sector_cache_key(key: str) -> Optional[Tuple[str, int]]:
+    """sector_cache_key 의 역변환: 캐시 키 → (sector_id, page). 섹터 캐시 키가 아니면 None"""
+    if key.startswith("us_sector_"):
+        rest, meta = key[len("us_sector_"):], US_SECTOR_META
+    elif key.startswith("sector_"):
+        rest, meta = key[len("sector_"):], SECTOR_META
+    else:
+        return None
+    sector_id, _, page = rest.rpartition("_")
+    if sector_id not in meta or not page.isdigit():
+        return None
+    return sector_id, int(page)
+
+
+def sector_cache_prefix(sector_id: Optional[str] = None, market: Optional[str] = None) -> str:
+    """섹터(모든 페이지) 또는 시장 전체 캐시 키의 공통 접두사"""
+    if sector_id:
+        return sector_cache_key(sector_id, 0)[:-1]   # "..._0" → "..._"
+    return "us_sector_" if (market or "").upper() == "US" else "sector_"
+
+
+def invalidate_sector_cache(
+    sector_id: Optional[str] = None,
+    market: Optional[str] = None,
+    page: Optional[int] = None,
+    prefix: Optional[str] = None,
+) -> List[str]:
+    """
+    섹터 캐시 무효화 → 삭제된 키 목록.
+    범위: prefix(원시 키 접두사) > sector_id(모든 페이지) > market(시장 전체) > KR+US 전체,
+    page 를 주면 해당 페이지만.
+    캐시 파일만 지우면 증분 윈도우/기사 저장소에서 이전 분석 결과가 그대로 다시 나오므로
+    1페이지가 범위에 들면 섹터 윈도우를, 모든 페이지가 범위면 저장소의 섹터 기사/상태도 함께 지운다.
+    히트맵 스냅샷은 그대로 두고 재적재(rewarm_sector_keys) 또는 다음 갱신 때 반영된다.
+    """
+    if prefix is not None:
+        prefixes = [prefix]
+    elif sector_id or market:
+        prefixes = [sector_cache_prefix(sector_id, market)]
+    else:
+        prefixes = [sector_cache_prefix(market="KR"), sector_cache_prefix(market="US")]
+    keys = [key for p in prefixes for key in matching_keys(p)]
+    if page is not None:
+        keys = [k for k in keys if (parse_sector_cache_key(k) or (None, None))[1] == page]
+    removed = invalidate(keys)
+
+    if prefix is not None:
+        # 원시 접두사는 페이지 범위를 알 수 없으므로 1페이지 키가 지워진 섹터의 윈도우만
+        windows = {parsed[0] for parsed in map(parse_sector_cache_key, keys) if parsed and parsed[1] == 1}
+        sectors: set = set()
+    else:
+        if sector_id:
+            scope = {sector_id}
+        elif market:
+            scope = set(US_SECTOR_META if market == "US" else SECTOR_META)
+        else:
+            scope = set(SECTOR_META) | set(US_SECTOR_META)
+        windows = scope if page in (None, 1) else set()
+        sectors = scope if page is None else set()
+    for sid in sorted(windows):
+        delete_window(sid)
+    for sid in sorted(sectors):
+        delete_sector(sid)
+    print(f"[NewsCollector] 캐시 무효화 {len(removed)}개, 윈도우 {len(windows)}개, 저장소 섹터 {len(sectors)}개 "
+          f"({prefix or sector_id or market or 'KR+US'}, page={page})")
+    return removed
+
+
+async def _force_refresh(sector_id: str, page: int) -> Optional[SectorNewsResult]:
+    fetch_fn = fetch_us_sector_news_async if sector_id.startswith("US_") else fetch_sector_news_async
+    return await fetch_fn(sector_id, 10, page, force_refresh=True)
+
+
+async def rewarm_sector_keys(keys: List[str]) -> dict:
+    """
+    무효화한 섹터 캐시 키만 다시 조회해 채움 (동시 REWARM_CONCURRENCY 개).
+    반환: {"ok": [...], "failed": {key: 사유}, "skipped": [섹터 캐시 키가 아닌 키]}
+    """
+    semaphore = asyncio.Semaphore(REWARM_CONCURRENCY)
+    report: dict = {"ok": [], "failed": {}, "skipped": []}
+
+    async def _one(key: str) -> None:
+        parsed = parse_sector_cache_key(key)
+        if parsed is None:
+            report["skipped"].append(key)
+            return
+        async with semaphore:
+            try:
+                result = await _force_refresh(*parsed)
+            except Exception as e:
+                report["failed"][key] = str(e)
+                return
+        if result is None:
+            report["failed"][key] = "조회 결과 없음"
+        else:
+            report["ok"].append(key)
+
+    await asyncio.gather(*(_one(k) for k in keys))
+    print(f"[NewsCollector] 캐시 재적재 {len(report['ok'])}개 성공, {len(report['failed'])}개 실패")
+    return report
+
+
+async def refresh_sectors(market: Optional[str] = None, sector_id: Optional[str] = None) -> dict:
+    """
+    캐시를 지우지 않고 섹터 1페이지를 강제 재조회 (기존 값은 교체될 때까지 계속 제공).
+    market=None 이면 KR + US 전체, sector_id 를 주면 해당 섹터만.
+    """
+    if sector_id:
+        sector_ids = [sector_id]
+    else:
+        markets = [market.upper()] if market else ["KR", "US"]
+        sector_ids = [
+            sid for m in markets for sid in (US_SECTOR_META if m == "US" else SECTOR_META)
+        ]
+    return await rewarm_sector_keys([sector_cache_key(sid, 1) for sid in sector_ids])
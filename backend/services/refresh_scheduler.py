@@ -0,0 +1,275 @@
+"""
+섹터 캐시 백그라운드 사전 갱신 스케줄러
+- FastAPI lifespan 에서 시작/종료 (프로세스 내 asyncio 태스크)
+- TTL 이 끝나기 전에 섹터별로 미리 재조회 → 첫 사용자가 네이버 + GPT 지연을 떠안지 않음
+- 섹터마다 고유 위상(slot)을 배정해 갱신 시각을 분산 (같은 분에 일제히 만료되지 않음)
+- 네이버 일일 호출 예산(기본 2,000회 < 한도 2,500회) 안에서만 KR 섹터 갱신 (naver_quota 집계 기준)
+- 섹터마다 자기 TTL(기사 유입 속도 기반, sector_velocity) 주기로 갱신 → 기사가 몰리는 섹터를 더 자주 갱신
+- 네이버 호출량 압박(naver_quota.pressure_level) 시 KR 갱신 주기가 늘어난 TTL 을 따르고,
+  elevated 면 적게 읽히는 KR 섹터(적중 수 하위 REFRESH_LOW_PRIORITY_SHARE) 갱신을 미루며 critical 이면 KR 갱신 중단
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Set
+
+from . import cache_index
+from .cache_manager import KST, MARKET_HOURS_TTL, OFF_HOURS_TTL, get_ttl, expires_at, get_saved_at
+from .news_collector import (
+    SECTOR_META,
+    US_SECTOR_META,
+    fetch_sector_news_async,
+    fetch_us_sector_news_async,
+    sector_cache_key,
+)
+from .naver_quota import NAVER_DAILY_LIMIT, calls_today, note_deferred, pressure_level, ttl_multiplier
+from .sector_velocity import sector_ttl
+
+SCHEDULER_ENABLED       = os.getenv("REFRESH_SCHEDULER_ENABLED", "1") == "1"
+SCHEDULER_TICK_SECONDS  = int(os.getenv("REFRESH_TICK_SECONDS", "15"))
+REFRESH_LEAD_SECONDS    = int(os.getenv("REFRESH_LEAD_SECONDS", str(5 * 60)))   # 만료 5분 전 갱신
+WARMUP_SPACING_SECONDS  = 2      # 캐시가 없는 섹터를 처음 채울 때의 간격
+# 사용자 요청(캐시 미스, page>1 등)용 여유분을 남겨둔 스케줄러 전용 예산
+SCHEDULER_NAVER_BUDGET  = int(os.getenv("REFRESH_NAVER_BUDGET", "2000"))
+# 호출량 압박(elevated) 시 갱신을 미룰 KR 섹터 비율 (1페이지 캐시 적중 수가 적은 순)
+LOW_PRIORITY_SHARE      = float(os.getenv("REFRESH_LOW_PRIORITY_SHARE", "0.5"))
+
+
+@dataclass
+class _Job:
+    market: str
+    sector_id: str
+    cache_key: str
+    phase: float                        # 갱신 주기 내 고유 위상 (0 ~ 1)
+    saved_at: Optional[float] = None    # 마지막으로 확인한 캐시 저장 시각
+    next_run: float = 0.0
+    period: float = 0.0                 # 마지막으로 일정을 계산한 갱신 주기
+    last_run: Optional[float] = None
+    last_status: Optional[str] = None
+    last_duration_ms: Optional[int] = None
+    runs: int = 0
+
+
+_jobs: List[_Job] = []
+_task: Optional[asyncio.Task] = None
+_low_priority: Set[str] = set()
+
+
+def _refresh_period(market: Optional[str] = None, key: Optional[str] = None) -> float:
+    """
+    현재 TTL 기준 갱신 주기 (TTL - 선행 시간).
+    key 를 주면 섹터 유입 속도 TTL, KR 은 호출량 압박에 따라 늘어난 TTL 기준.
+    """
+    return max(get_ttl(market=market, key=key) - REFRESH_LEAD_SECONDS, 60)
+
+
+def _plan_next_run(job: _Job, now: float, warmup_index: int = 0) -> float:
+    """
+    다음 실행 시각 계산.
+    만료(선행 시간 포함) 직전의 고유 slot 에 맞춰 실행 → 섹터별로 갱신 시각이 분산되고,
+    한 번 분산된 뒤에는 매 주기 같은 위상을 유지한다.
+    """
+    if job.saved_at is None:
+        return now + warmup_index * WARMUP_SPACING_SECONDS
+
+    period = _refresh_period(job.market, job.cache_key)
+    due = expires_at(job.saved_at, job.market, job.cache_key) - REFRESH_LEAD_SECONDS
+    offset = job.phase * period
+    slot = ((due - offset) // period) * period + offset
+    if slot <= job.saved_at:
+        # 저장 직후 바로 다시 갱신하는 낭비 방지
+        slot = due
+    return slot
+
+
+def _build_jobs() -> List[_Job]:
+    jobs: List[_Job] = []
+    for market, meta in (("KR", SECTOR_META), ("US", US_SECTOR_META)):
+        count = len(meta)
+        for i, sector_id in enumerate(meta):
+            jobs.append(_Job(
+                market=market,
+                sector_id=sector_id,
+                cache_key=sector_cache_key(sector_id),
+                phase=i / count,
+            ))
+    return jobs
+
+
+def _low_priority_sectors() -> Set[str]:
+    """1페이지 캐시 적중 수가 가장 적은 KR 섹터들 (동률이면 SECTOR_META 뒤쪽 섹터부터)"""
+    kr_jobs = [j for j in _jobs if j.market == "KR"]
+    hits = cache_index.hits_for([j.cache_key for j in kr_jobs])
+    ranked = sorted(reversed(kr_jobs), key=lambda j: hits[j.cache_key])
+    return {j.sector_id for j in ranked[:int(len(ranked) * LOW_PRIORITY_SHARE)]}
+
+
+def _has_naver_credentials() -> bool:
+    return bool(os.getenv("NAVER_CLIENT_ID") and os.getenv("NAVER_CLIENT_SECRET"))
+
+
+async def _run_job(job: _Job) -> None:
+    now = time.time()
+
+    # 사용자 요청 등으로 이미 갱신된 경우 → 재조회 없이 일정만 다시 계산
+    saved_at = await asyncio.to_thread(get_saved_at, job.cache_key)
+    if saved_at and (job.saved_at is None or saved_at > job.saved_at):
+        job.saved_at = saved_at
+        next_run = _plan_next_run(job, now)
+        if next_run > now:
+            job.next_run = next_run
+            return
+
+    if job.market == "KR":
+        skip = None
+        level = pressure_level()
+        if not _has_naver_credentials():
+            skip = "no-credentials"
+        elif level == "critical":
+            skip = "quota-critical"
+        # 사용자 요청 경로까지 포함한 실제 호출량 기준
+        elif calls_today() >= SCHEDULER_NAVER_BUDGET:
+            skip = "budget"
+        elif level == "elevated" and job.sector_id in _low_priority:
+            skip = "low-priority"
+        if skip is not None:
+            if skip != "no-credentials":
+                note_deferred("scheduler")
+            job.last_status = f"skipped:{skip}"
+            job.next_run = now + _refresh_period(job.market, job.cache_key)
+            return
+        fetch_fn = fetch_sector_news_async
+    else:
+        fetch_fn = fetch_us_sector_news_async
+
+    started = time.time()
+    try:
+        result = await fetch_fn(job.sector_id, 10, 1, True)
+        job.last_status = "ok" if result else "empty"
+    except Exception as e:
+        job.last_status = f"error:{e}"
+        print(f"[Scheduler] 갱신 실패 ({job.sector_id}): {e}")
+
+    finished = time.time()
+    job.runs += 1
+    job.last_run = finished
+    job.last_duration_ms = int((finished - started) * 1000)
+    job.saved_at = await asyncio.to_thread(get_saved_at, job.cache_key) or finished
+    job.next_run = _plan_next_run(job, finished)
+
+
+async def _loop() -> None:
+    global _low_priority
+    now = time.time()
+    warmup_index = 0
+    for job in _jobs:
+        job.saved_at = await asyncio.to_thread(get_saved_at, job.cache_key)
+        job.period = _refresh_period(job.market, job.cache_key)
+        job.next_run = _plan_next_run(job, now, warmup_index)
+        if job.saved_at is None:
+            warmup_index += 1
+
+    while True:
+        now = time.time()
+        # 장 시작/마감, 섹터 유입 속도, 호출량 압박으로 TTL 이 바뀐 섹터는 일정 재계산
+        for job in _jobs:
+            period = _refresh_period(job.market, job.cache_key)
+            if period != job.period:
+                job.period = period
+                job.next_run = _plan_next_run(job, now)
+
+        due_jobs = sorted((j for j in _jobs if j.next_run <= now), key=lambda j: j.next_run)
+        if any(j.market == "KR" for j in due_jobs) and pressure_level() == "elevated":
+            try:
+                _low_priority = await asyncio.to_thread(_low_priority_sectors)
+            except Exception as e:
+                print(f"[Scheduler] 섹터 우선순위 계산 오류: {e}")
+        elif pressure_level() == "normal":
+            _low_priority = set()
+        for job in due_jobs:
+            await _run_job(job)
+
+        await asyncio.sleep(SCHEDULER_TICK_SECONDS)
+
+
+def start_scheduler() -> None:
+    """스케줄러 시작 (실행 중인 이벤트 루프 필요)"""
+    global _task, _jobs
+    if not SCHEDULER_ENABLED or _task is not None:
+        return
+    _jobs = _build_jobs()
+    _task = asyncio.get_running_loop().create_task(_loop())
+    print(f"[Scheduler] 백그라운드 갱신 시작 (섹터 {len(_jobs)}개)")
+
+
+async def stop_scheduler() -> None:
+    """스케줄러 종료"""
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
+
+
+def _fmt(ts: Optional[float]) -> Optional[str]:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, KST).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def estimated_daily_naver_calls() -> int:
+    """
+    스케줄러 기준 KR 하루 예상 호출 수 (갱신 1회 = 섹터 키워드 수만큼 호출, 장중 6.5시간 + 장외 17.5시간).
+    섹터별 유입 속도 TTL 반영 (호출량 압박 배수는 제외한 평소 기준).
+    """
+    total = 0.0
+    for sector_id, meta in SECTOR_META.items():
+        market_period = max(sector_ttl(sector_id, MARKET_HOURS_TTL) - REFRESH_LEAD_SECONDS, 60)
+        off_period    = max(sector_ttl(sector_id, OFF_HOURS_TTL) - REFRESH_LEAD_SECONDS, 60)
+        refreshes = (6.5 * 3600) / market_period + (17.5 * 3600) / off_period
+        total += len(meta["keywords"]) * refreshes
+    return int(total)
+
+
+def scheduler_state() -> dict:
+    """스케줄러 상태 (다음/마지막 실행 시각, 예산 사용량)"""
+    now = time.time()
+    jobs = sorted(_jobs, key=lambda j: j.next_run)
+    return {
+        "enabled": SCHEDULER_ENABLED,
+        "running": _task is not None and not _task.done(),
+        "refresh_period_minutes": round(_refresh_period() / 60, 1),
+        "kr_refresh_period_minutes": round(_refresh_period("KR") / 60, 1),
+        "lead_minutes": REFRESH_LEAD_SECONDS / 60,
+        "budget": {
+            "date": datetime.now(KST).strftime("%Y-%m-%d"),
+            "naver_calls_today": calls_today(),
+            "scheduler_budget": SCHEDULER_NAVER_BUDGET,
+            "naver_daily_limit": NAVER_DAILY_LIMIT,
+            "estimated_daily_calls": estimated_daily_naver_calls(),
+            "pressure": pressure_level(),
+            "ttl_multiplier": ttl_multiplier(),
+            "low_priority_sectors": sorted(_low_priority),
+        },
+        "due_next_10min": sum(1 for j in jobs if j.next_run <= now + 600),
+        "jobs": [
+            {
+                "market": j.market,
+                "sector_id": j.sector_id,
+                "next_run": _fmt(j.next_run),
+                "last_run": _fmt(j.last_run),
+                "last_status": j.last_status,
+                "last_duration_ms": j.last_duration_ms,
+                "runs": j.runs,
+                "period_minutes": round(j.period / 60, 1),
+            }
+            for j in jobs
+        ],
+    }
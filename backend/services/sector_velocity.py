@@ -0,0 +1,138 @@
+"""
+섹터별 기사 유입 속도 기반 TTL
+- 1페이지를 업스트림에서 갱신할 때마다 받은 원본 기사 중 직전 관측에 없던 링크 수 ÷ 경과 시간으로 유입 속도(건/시간) 관측
+  한 페이지가 전부 새 링크면(포화) 실제 유입은 더 많을 수 있으므로 페이지 발행시각 범위로 본 속도와 비교해 큰 값 사용
+- 기사를 돌려준 키워드 집합이 직전 관측과 다르면(보조 키워드 예산 초과/복구, 업스트림 오류) 링크 비교가 무의미하므로
+  관측하지 않고 이번 응답을 새 기준으로 삼음
+- 관측값은 EWMA(SECTOR_VELOCITY_ALPHA)로 누적해 기사 저장소(sector_velocity 테이블)에 보관 → 재시작/워커 간 공유
+- 섹터 TTL = 새 기사가 SECTOR_TTL_TARGET_ARTICLES 건 쌓일 것으로 예상되는 시간,
+  시장 기본 TTL(장중 30분/장외 60분)의 [SECTOR_TTL_MIN_FACTOR, SECTOR_TTL_MAX_FACTOR] 배 안으로 제한
+  → 기사가 몰리는 섹터는 더 자주, 거의 변하지 않는 섹터는 덜 자주 갱신 (네이버 호출/GPT 비용을 기사가 있는 곳에)
+- 관측이 SECTOR_VELOCITY_MIN_SAMPLES 회 미만인 섹터는 시장 기본 TTL 그대로
+- TTL 조회(요청 경로)는 메모리 사본만 읽고, 다른 워커의 관측은 VELOCITY_SYNC_SECONDS 마다 한 번에 다시 읽음
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from . import article_store, cache_manager
+from .sector_window import article_link, parse_pub_date
+
+ADAPTIVE_TTL_ENABLED        = os.getenv("SECTOR_ADAPTIVE_TTL", "1") == "1"
+SECTOR_VELOCITY_ALPHA       = float(os.getenv("SECTOR_VELOCITY_ALPHA", "0.3"))
+SECTOR_VELOCITY_MIN_SAMPLES = int(os.getenv("SECTOR_VELOCITY_MIN_SAMPLES", "2"))
+SECTOR_TTL_TARGET_ARTICLES  = float(os.getenv("SECTOR_TTL_TARGET_ARTICLES", "5"))
+SECTOR_TTL_MIN_FACTOR       = float(os.getenv("SECTOR_TTL_MIN_FACTOR", "0.5"))
+SECTOR_TTL_MAX_FACTOR       = float(os.getenv("SECTOR_TTL_MAX_FACTOR", "3"))
+MIN_OBSERVE_INTERVAL        = 60        # 이보다 짧은 간격의 재조회는 관측하지 않음 (초)
+VELOCITY_SYNC_SECONDS       = 30
+
+_lock = threading.Lock()
+_velocities: Dict[str, Tuple[float, int]] = {}   # sector_id → (건/시간, 관측 횟수)
+_synced_at = 0.0
+_synced_dir: Optional[str] = None
+
+
+def sector_of_key(key: str) -> Optional[str]:
+    """캐시 키 → 섹터 ID (sector_IT_1_2 → IT_1, us_sector_US_IT_1_1 → US_IT_1, 섹터 키가 아니면 None)"""
+    for prefix in ("us_sector_", "sector_"):
+        if key.startswith(prefix):
+            sector_id, _, page = key[len(prefix):].rpartition("_")
+            return sector_id if sector_id and page.isdigit() else None
+    return None
+
+
+def _sync() -> None:
+    """다른 워커의 관측 반영 (_lock 보유 상태)"""
+    global _synced_at, _synced_dir
+    if cache_manager.CACHE_DIR == _synced_dir and time.monotonic() - _synced_at < VELOCITY_SYNC_SECONDS:
+        return
+    _velocities.clear()
+    _velocities.update(article_store.load_sector_velocities())
+    _synced_at, _synced_dir = time.monotonic(), cache_manager.CACHE_DIR
+
+
+def _observed_rate(raw_items: List[dict], links: List[str], previous: dict, now: float) -> float:
+    """직전 관측 이후 새 링크 수 ÷ 경과 시간 (포화 시 발행시각 범위 기준 속도와 비교)"""
+    seen = set(previous["links"])
+    new_count = sum(1 for link in links if link not in seen)
+    rate = new_count / ((now - previous["observed_at"]) / 3600)
+    if links and new_count == len(links):
+        stamps = sorted(ts for ts in (parse_pub_date(i.get("pubDate", "")) for i in raw_items) if ts is not None)
+        if len(stamps) >= 2 and stamps[-1] > stamps[0]:
+            rate = max(rate, (len(stamps) - 1) / ((stamps[-1] - stamps[0]) / 3600))
+    return rate
+
+
+def record_refresh(
+    sector_id: str,
+    raw_items: List[dict],
+    keywords: List[str],
+    now: Optional[float] = None,
+) -> Optional[float]:
+    """
+    1페이지 업스트림 갱신 결과로 유입 속도 관측 (저장소/캐시로만 응답한 갱신은 호출하지 않음).
+    keywords: 이번 응답에 기사를 돌려준 키워드.
+    반환: 갱신된 EWMA 속도 (첫 관측, 빈 응답(업스트림 오류 등), 키워드 집합 변경, 너무 짧은 간격이면 None)
+    """
+    now = time.time() if now is None else now
+    links = [link for link in (article_link(i) for i in raw_items) if link]
+    if not links:
+        return None
+    previous = article_store.get_sector_velocity(sector_id)
+    if previous is None:
+        article_store.save_sector_velocity(sector_id, 0.0, 0, now, links, keywords)
+        return None
+    if set(previous["keywords"]) != set(keywords):
+        # 다른 키워드의 기사를 새 유입으로 세지 않도록 기준만 바꾸고 누적 속도는 유지
+        article_store.save_sector_velocity(
+            sector_id, previous["velocity"], previous["samples"], now, links, keywords
+        )
+        return None
+    if now - previous["observed_at"] < MIN_OBSERVE_INTERVAL:
+        return None
+
+    rate = _observed_rate(raw_items, links, previous, now)
+    samples = previous["samples"]
+    velocity = rate if samples == 0 else SECTOR_VELOCITY_ALPHA * rate + (1 - SECTOR_VELOCITY_ALPHA) * previous["velocity"]
+    article_store.save_sector_velocity(sector_id, velocity, samples + 1, now, links, keywords)
+    with _lock:
+        _velocities[sector_id] = (velocity, samples + 1)
+    return velocity
+
+
+def sector_ttl(sector_id: Optional[str], base_ttl: int) -> int:
+    """섹터 TTL (초). 적응형 TTL 이 꺼져 있거나 관측이 부족하면 base_ttl"""
+    if not ADAPTIVE_TTL_ENABLED or sector_id is None:
+        return base_ttl
+    with _lock:
+        _sync()
+        velocity, samples = _velocities.get(sector_id, (0.0, 0))
+    if samples < SECTOR_VELOCITY_MIN_SAMPLES:
+        return base_ttl
+    if velocity <= 0:
+        return int(base_ttl * SECTOR_TTL_MAX_FACTOR)
+    target = SECTOR_TTL_TARGET_ARTICLES / velocity * 3600
+    return int(min(max(target, base_ttl * SECTOR_TTL_MIN_FACTOR), base_ttl * SECTOR_TTL_MAX_FACTOR))
+
+
+def velocity_stats(base_ttl: int) -> dict:
+    """섹터별 유입 속도(건/시간)·관측 횟수·현재 TTL(분), 빠른 섹터부터"""
+    with _lock:
+        _sync()
+        items = sorted(_velocities.items(), key=lambda kv: kv[1][0], reverse=True)
+    return {
+        "enabled": ADAPTIVE_TTL_ENABLED,
+        "target_articles": SECTOR_TTL_TARGET_ARTICLES,
+        "ttl_factor_bounds": [SECTOR_TTL_MIN_FACTOR, SECTOR_TTL_MAX_FACTOR],
+        "sectors": {
+            sector_id: {
+                "articles_per_hour": round(velocity, 2),
+                "samples": samples,
+                "ttl_minutes": round(sector_ttl(sector_id, base_ttl) / 60, 1),
+            }
+            for sector_id, (velocity, samples) in items
+        },
+    }
@@ -0,0 +1,205 @@
+"""
+섹터별 롤링 기사 윈도우 (증분 갱신용)
+- 섹터마다 마지막으로 본 최신 기사(pubDate/링크) 커서와 처리한 링크 집합을 기억
+- 갱신 시 커서 이후의 새 기사만 AI 분석 → 기존 윈도우 앞에 병합
+- 새 기사가 없으면 AI 분석·브리핑 재생성을 모두 건너뜀 (장외 조용한 섹터는 API 1회로 끝)
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Sequence
+
+from . import cache_manager, serializer
+
+INCREMENTAL_REFRESH = os.getenv("INCREMENTAL_REFRESH", "1") == "1"        # 1페이지 증분 갱신 사용 여부
+SECTOR_WINDOW_SIZE = int(os.getenv("SECTOR_WINDOW_SIZE", "50"))   # 윈도우에 유지할 적합 기사 수
+SEEN_LINKS_LIMIT   = 500                                          # 처리 완료 링크 기억 개수
+
+
+def parse_pub_date(pub_date: str) -> Optional[float]:
+    """RFC 822 pubDate (네이버/RSS 공통) → epoch 초. 파싱 실패 시 None."""
+    if not pub_date:
+        return None
+    try:
+        return parsedate_to_datetime(pub_date).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def article_link(item: dict) -> str:
+    """원본 기사 기준 식별 링크 (네이버 originallink 우선)"""
+    return item.get("originallink") or item.get("original_link") or item.get("link") or ""
+
+
+@dataclass
+class SectorWindow:
+    sector_id: str
+    articles: List[dict] = field(default_factory=list)    # NewsItem dict (최신순)
+    seen_links: List[str] = field(default_factory=list)   # 처리 완료 링크 (부적합 기사 포함)
+    cursor_link: Optional[str] = None                     # 마지막으로 본 가장 최신 기사
+    cursor_ts: Optional[float] = None
+    total: int = 0
+    briefing: Optional[str] = None
+    updated_at: float = 0.0
+
+    def new_items(self, raw_items: List[dict]) -> List[dict]:
+        """아직 처리하지 않았고 커서보다 오래되지 않은 기사만 반환"""
+        seen = set(self.seen_links)
+        fresh = []
+        for item in raw_items:
+            if article_link(item) in seen:
+                continue
+            ts = parse_pub_date(item.get("pubDate", ""))
+            if ts is not None and self.cursor_ts is not None and ts < self.cursor_ts:
+                continue
+            fresh.append(item)
+        return fresh
+
+    def merge(
+        self,
+        raw_items: List[dict],
+        articles: List[dict],
+        total: int,
+        pending: Sequence[dict] = (),
+    ) -> None:
+        """
+        새로 처리한 원본 기사(raw_items)와 그중 적합 판정된 기사(articles)를 윈도우에 반영.
+        pending: 아직 처리하지 못한 원본 기사 → 처리 완료로 기록하지 않고, 커서도 이보다 앞서지 않게 해 다음 갱신 때 다시 받음
+        """
+        links = {article_link(a) for a in articles}
+        kept = [a for a in self.articles if article_link(a) not in links]
+        merged = articles + kept
+        # 기사 저장소 커서와 같은 순서 (발행시각, 링크 내림차순)
+        merged.sort(key=lambda a: (parse_pub_date(a.get("pubDate", "")) or 0.0, article_link(a)), reverse=True)
+        self.articles = merged[:SECTOR_WINDOW_SIZE]
+
+        self.seen_links = ([article_link(i) for i in raw_items] + self.seen_links)[:SEEN_LINKS_LIMIT]
+        pending_ts = [ts for ts in (parse_pub_date(i.get("pubDate", "")) for i in pending) if ts is not None]
+        limit = min(pending_ts) if pending_ts else None
+        for item in raw_items:
+            ts = parse_pub_date(item.get("pubDate", ""))
+            if ts is None or (limit is not None and ts > limit):
+                continue
+            if self.cursor_ts is None or ts > self.cursor_ts:
+                self.cursor_ts = ts
+                self.cursor_link = article_link(item)
+        self.total = total
+        self.updated_at = time.time()
+
+
+_lock = threading.Lock()
+_windows: Dict[str, SectorWindow] = {}
+_mtimes: Dict[str, float] = {}   # 메모리 사본을 읽거나 쓴 시점의 파일 수정 시각
+_counters = {"full": 0, "incremental": 0, "unchanged": 0}
+
+
+def _window_path(sector_id: str) -> str:
+    return os.path.join(cache_manager.cache_subdir("windows"), f"{sector_id}.json")
+
+
+def get_window(sector_id: str) -> Optional[SectorWindow]:
+    """
+    메모리 → 파일 순서로 섹터 윈도우 조회.
+    파일이 지워졌거나(무효화) 다른 워커가 더 최근에 저장했으면 메모리 사본 대신 파일 기준
+    """
+    path = _window_path(sector_id)
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        with _lock:
+            _windows.pop(sector_id, None)
+            _mtimes.pop(sector_id, None)
+        return None
+    with _lock:
+        window = _windows.get(sector_id)
+        if window is not None and _mtimes.get(sector_id) == mtime:
+            return window
+
+    try:
+        with open(path, "rb") as f:
+            window = SectorWindow(**serializer.loads(f.read()))
+    except Exception as e:
+        print(f"[SectorWindow] 읽기 오류 ({sector_id}): {e}")
+        return None
+    with _lock:
+        _windows[sector_id], _mtimes[sector_id] = window, mtime
+        return window
+
+
+def save_window(window: SectorWindow) -> None:
+    """메모리 + 파일 저장 (임시 파일 → rename 으로 원자적 교체)"""
+    with _lock:
+        _windows[window.sector_id] = window
+    path = _window_path(window.sector_id)
+    try:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(serializer.dumps(window.__dict__))
+        os.replace(tmp_path, path)
+        mtime = os.stat(path).st_mtime
+    except Exception as e:
+        print(f"[SectorWindow] 저장 오류 ({window.sector_id}): {e}")
+        return
+    with _lock:
+        _mtimes[window.sector_id] = mtime
+
+
+def delete_window(sector_id: str) -> None:
+    """섹터 윈도우 삭제 (메모리 + 파일) → 다음 갱신은 전체 분석"""
+    with _lock:
+        _windows.pop(sector_id, None)
+        _mtimes.pop(sector_id, None)
+    try:
+        os.remove(_window_path(sector_id))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"[SectorWindow] 삭제 오류 ({sector_id}): {e}")
+
+
+def prune_windows(before: float) -> int:
+    """before 이전에 마지막으로 저장된 윈도우 파일 삭제 (오래 갱신되지 않은/없어진 섹터). 반환: 삭제 수"""
+    directory = cache_manager.cache_subdir("windows")
+    pruned = 0
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.is_file() or not entry.name.endswith((".json", ".tmp")):
+                continue
+            try:
+                if entry.stat().st_mtime >= before:
+                    continue
+                os.remove(entry.path)
+            except OSError:
+                continue
+            if entry.name.endswith(".json"):
+                sector_id = entry.name[:-len(".json")]
+                with _lock:
+                    _windows.pop(sector_id, None)
+                    _mtimes.pop(sector_id, None)
+                pruned += 1
+    return pruned
+
+
+def clear_windows() -> None:
+    """메모리 윈도우 초기화 (파일은 유지)"""
+    with _lock:
+        _windows.clear()
+        _mtimes.clear()
+
+
+def count_refresh(kind: str) -> None:
+    """갱신 종류 집계: full(윈도우 없음), incremental(새 기사 병합), unchanged(변화 없음)"""
+    _counters[kind] += 1
+
+
+def window_stats() -> dict:
+    with _lock:
+        windows = len(_windows)
+    return {
+        "window_size": SECTOR_WINDOW_SIZE,
+        "windows_in_memory": windows,
+        "refreshes": dict(_counters),
+    }
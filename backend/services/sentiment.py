@@ -0,0 +1,115 @@
+"""
+뉴스 제목 감성 점수 엔진
+- 시장별 가중치 사전(용어 → 가중치, 긍정 +, 부정 -)을 Aho–Corasick 오토마톤으로 컴파일
+- 제목 1건당 소문자 변환 1회 + 1회 스캔 → 사전 크기와 무관한 비용
+- 기사별 점수와 섹터 집계 점수를 같은 -5 ~ +5 범위로 반환 (히트맵 색상용)
+- SENTIMENT_LEXICON_PATH(JSON)로 사전 확장/가중치 변경: {"KR": {"상승": 1.0}, "US": {"surge": 1.5}}
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .aho_corasick import AhoCorasick
+
+SCORE_SCALE = 5.0
+
+# 기본 사전: 용어별 가중치 1 (기존 단어 목록과 동일한 결과)
+DEFAULT_LEXICONS: Dict[str, Dict[str, float]] = {
+    "KR": {
+        **{w: 1.0 for w in ["상승", "급등", "호재", "수주", "성장", "흑자", "신고가", "확대", "개선", "돌파"]},
+        **{w: -1.0 for w in ["하락", "급락", "악재", "손실", "적자", "위기", "감소", "부진", "하향", "경고"]},
+    },
+    "US": {
+        **{w: 1.0 for w in ["surge", "soar", "rally", "gain", "rise", "jump", "boom", "record", "growth", "bullish"]},
+        **{w: -1.0 for w in ["drop", "fall", "plunge", "crash", "decline", "loss", "bear", "slump", "tumble", "warning"]},
+    },
+}
+
+
+@dataclass
+class SentimentBatch:
+    scores: List[float]   # 기사별 점수 (-5 ~ +5, 감성 용어 없으면 0)
+    aggregate: float      # 섹터 집계 점수 (-5 ~ +5)
+
+
+def _scaled(signed: float, magnitude: float) -> float:
+    if magnitude == 0:
+        return 0.0
+    return round(signed / magnitude * SCORE_SCALE, 2)
+
+
+class SentimentEngine:
+    """
+    제목에 등장한 용어(제목당 1회만 집계)의 가중치 합으로 점수 계산.
+    점수 = Σ가중치 / Σ|가중치| × 5  → 가중치가 모두 ±1 이면 (긍정 - 부정) / (긍정 + 부정) × 5
+    """
+
+    def __init__(self, lexicon: Dict[str, float]) -> None:
+        self._automaton = AhoCorasick()
+        for term, weight in lexicon.items():
+            term = term.strip().lower()
+            if term and weight:
+                self._automaton.add(term, (term, float(weight)))
+        self._automaton.build()
+
+    @property
+    def term_count(self) -> int:
+        return len(self._automaton)
+
+    def _title_terms(self, title: str) -> Dict[str, float]:
+        """제목에 등장한 용어 → 가중치 (같은 용어는 한 번만)"""
+        return {term: weight for _, _, (term, weight) in self._automaton.iter_matches(title.lower())}
+
+    def score_batch(self, titles: List[str]) -> SentimentBatch:
+        scores: List[float] = []
+        total_signed = total_magnitude = 0.0
+        for title in titles:
+            weights = self._title_terms(title or "").values()
+            signed = sum(weights)
+            magnitude = sum(abs(w) for w in weights)
+            scores.append(_scaled(signed, magnitude))
+            total_signed += signed
+            total_magnitude += magnitude
+        return SentimentBatch(scores=scores, aggregate=_scaled(total_signed, total_magnitude))
+
+
+def load_lexicons(path: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """기본 사전 + (선택) 사전 파일 병합. 파일 항목이 같은 용어의 기본 가중치를 덮어씀"""
+    lexicons = {market: dict(terms) for market, terms in DEFAULT_LEXICONS.items()}
+    path = path if path is not None else os.getenv("SENTIMENT_LEXICON_PATH")
+    if not path:
+        return lexicons
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            extra = json.load(f)
+        for market, terms in extra.items():
+            lexicons.setdefault(market.upper(), {}).update(
+                {term: float(weight) for term, weight in terms.items()}
+            )
+    except Exception as e:
+        print(f"[Sentiment] 사전 파일 로드 실패 ({path}): {e}")
+    return lexicons
+
+
+_lock = threading.Lock()
+_engines: Dict[str, SentimentEngine] = {}
+
+
+def get_engine(market: str) -> SentimentEngine:
+    """시장별 엔진 (최초 사용 시 1회 컴파일)"""
+    market = "US" if market.upper() == "US" else "KR"
+    engine = _engines.get(market)
+    if engine is None:
+        with _lock:
+            engine = _engines.get(market)
+            if engine is None:
+                engine = _engines[market] = SentimentEngine(load_lexicons()[market])
+    return engine
+
+
+def score_titles(titles: List[str], market: str) -> SentimentBatch:
+    """제목 목록 일괄 채점 (기사별 점수 + 집계 점수)"""
+    return get_engine(market).score_batch(titles)
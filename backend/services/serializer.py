@@ -0,0 +1,184 @@
+"""
+캐시/응답 직렬화 계층
+- 백엔드 교체 가능: orjson(C 확장, 설치 시 기본) 또는 표준 json (들여쓰기 없는 compact 출력)
+  CACHE_SERIALIZER=orjson|json 으로 강제 가능
+- Pydantic 모델은 model_dump_json (Rust 구현) 으로 dict 변환 없이 바로 바이트 직렬화
+- EncodedBody: 미리 직렬화한 응답 본문 + gzip/br 압축본을 처음 요청될 때 한 번만 만들어 재사용
+"""
+
+import gzip
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import orjson as _orjson
+except ImportError:   # 선택 의존성
+    _orjson = None
+
+try:
+    import brotli as _brotli
+except ImportError:   # 선택 의존성 (없으면 gzip 만 제공)
+    _brotli = None
+
+# 이보다 작은 본문은 압축하지 않음 (헤더 비용이 더 큼)
+COMPRESS_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESS_MIN_BYTES", "1024"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+BODY_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_BODY_CACHE_MAX_ENTRIES", "256"))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    return json.loads(raw)
+
+
+_BACKENDS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "json": (_json_dumps, _json_loads),
+}
+if _orjson is not None:
+    _BACKENDS["orjson"] = (_orjson.dumps, _orjson.loads)
+
+
+def _select_backend() -> str:
+    name = os.getenv("CACHE_SERIALIZER", "").lower()
+    if name in _BACKENDS:
+        return name
+    if name:
+        print(f"[Serializer] 사용할 수 없는 직렬화 백엔드: {name} → 기본값 사용")
+    return "orjson" if "orjson" in _BACKENDS else "json"
+
+
+BACKEND = _select_backend()
+_dumps, _loads = _BACKENDS[BACKEND]
+
+
+def dumps(obj: Any) -> bytes:
+    """dict/list 등 → compact UTF-8 JSON 바이트 (Pydantic 모델은 model_dump_json 사용)"""
+    if hasattr(obj, "model_dump_json"):
+        return obj.model_dump_json().encode("utf-8")
+    return _dumps(obj)
+
+
+def loads(raw: bytes) -> Any:
+    """JSON 바이트/문자열 → 객체 (기존 들여쓰기 형식 파일도 그대로 읽음)"""
+    return _loads(raw)
+
+
+def available_encodings() -> Tuple[str, ...]:
+    return ("br", "gzip") if _brotli is not None else ("gzip",)
+
+
+def _accepted(accept_encoding: Optional[str]) -> Tuple[str, ...]:
+    """Accept-Encoding 헤더에서 지원하는 인코딩만 선호 순서(br > gzip)로 반환 (q=0 제외)"""
+    if not accept_encoding:
+        return ()
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, *params = part.split(";")
+        q = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            accepted.add(name.strip())
+    return tuple(e for e in available_encodings() if e in accepted or "*" in accepted)
+
+
+class EncodedBody:
+    """
+    직렬화된 응답 본문. 압축본은 인코딩별로 첫 요청 때 한 번만 만들고 이후 재사용한다.
+    본문이 COMPRESS_MIN_BYTES 보다 작으면 항상 원본을 반환.
+    """
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self._compressed: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def _compress(self, encoding: str) -> bytes:
+        data = self._compressed.get(encoding)
+        if data is None:
+            with self._lock:
+                data = self._compressed.get(encoding)
+                if data is None:
+                    if encoding == "br":
+                        data = _brotli.compress(self.body, quality=BROTLI_QUALITY)
+                    else:
+                        data = gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+                    self._compressed[encoding] = data
+        return data
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """(전송할 바이트, Content-Encoding 또는 None)"""
+        if len(self.body) < COMPRESS_MIN_BYTES:
+            return self.body, None
+        for encoding in _accepted(accept_encoding):
+            return self._compress(encoding), encoding
+        return self.body, None
+
+
+class _BodyCache:
+    """
+    모델 객체 → EncodedBody LRU.
+    캐시(L1)에서 같은 결과 객체가 반복 반환되므로 객체 동일성(is)으로 재사용 여부를 판정한다.
+    항목이 객체를 참조하고 있는 동안은 id 가 재사용되지 않는다. (캐시된 결과 객체는 수정하지 않는다는 전제)
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, Tuple[Any, EncodedBody]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, obj: Any) -> EncodedBody:
+        key = id(obj)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is obj:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        encoded = EncodedBody(dumps(obj))
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (obj, encoded)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return encoded
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_body_cache = _BodyCache(BODY_CACHE_MAX_ENTRIES)
+
+
+def encoded_body(obj: Any) -> EncodedBody:
+    """응답 객체의 미리 직렬화된 본문 (같은 객체면 직렬화/압축 결과 재사용)"""
+    return _body_cache.get(obj)
+
+
+def serializer_stats() -> dict:
+    return {
+        "backend": BACKEND,
+        "available_backends": sorted(_BACKENDS),
+        "encodings": list(available_encodings()),
+        "body_cache": {
+            "entries": len(_body_cache),
+            "max_entries": _body_cache.max_entries,
+            "hits": _body_cache.hits,
+            "misses": _body_cache.misses,
+        },
+    }
@@ -0,0 +1,88 @@
+"""
+키별 단일 실행 (single-flight)
+- 같은 키로 동시에 들어온 호출 중 첫 번째(leader)만 실제 작업을 실행
+- 나머지(follower)는 leader 의 결과(또는 예외)를 기다렸다가 그대로 받음
+→ 인기 섹터 캐시가 만료되는 순간 네이버/OpenAI 중복 호출 방지
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self.leaders = 0      # 실제 실행 횟수
+        self.followers = 0    # 다른 호출 결과를 공유받은 횟수
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        """진행 중인 호출의 Future 와 leader 여부 반환"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = Future()
+                # RUNNING 상태로 두어 follower 쪽 취소가 leader 결과를 취소하지 못하게 함
+                future.set_running_or_notify_cancel()
+                self._calls[key] = future
+                self.leaders += 1
+                return future, True
+            self.followers += 1
+            return future, False
+
+    def _leave(self, key: str) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """key 에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn 실행"""
+        future, is_leader = self._join(key)
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._leave(key)
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        do() 의 비동기 버전. 동기 호출자(스레드)와 같은 키를 공유하므로
+        스레드 경로와 이벤트 루프 경로가 섞여도 업스트림 호출은 한 번만 일어난다.
+        """
+        future, is_leader = self._join(key)
+        if not is_leader:
+            return await asyncio.wrap_future(future)
+
+        try:
+            result = await fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._leave(key)
+
+    def in_flight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def stats(self) -> dict:
+        with self._lock:
+            in_flight = len(self._calls)
+        return {
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "in_flight": in_flight,
+        }
@@ -0,0 +1,92 @@
+"""
+기사 텍스트 정규화 (모듈 로드 시 정규식 1회 컴파일)
+- HTML 태그 제거 + 엔티티 복원 (필요 없는 단계는 건너뜀, 둘 다 C 구현 1회 호출)
+- 익명/가짜 기업명 패턴을 하나의 alternation 으로 합쳐 이름당 정규식 1회 검사
+- 한 페이지 분량 기사를 한 번에 처리하는 배치 API 제공
+"""
+
+import html
+import re
+from typing import Dict, List
+
+# 기존 '<.*?>' 와 같은 범위 (줄바꿈을 넘지 않음) + 배치 구분자(\x00)를 넘지 않음
+_TAG_RE = re.compile(r"<[^>\n\x00]*>")
+_BATCH_SEP = "\x00"
+
+# 익명/가짜 기업명 패턴 (하나라도 전체 일치하면 제외)
+_FAKE_COMPANY_PATTERNS = [
+    # 한글 1자 또는 알파벳 1자 + 기업/사/그룹/회사/업체/은행/증권
+    r"[A-Za-zㄱ-ㅎ가-힣](?:기업|사|그룹|회사|업체|은행|증권)",
+    # OO, XX 마스킹 패턴
+    r"[OoXx○●]{2}.+",
+    r"○○.+",
+    # "모 기업", "해당 기업", "특정 기업", "일부 기업" 등
+    r"(?:모|해당|특정|일부|모\s)\s?(?:기업|회사|업체|그룹|증권|은행)",
+    # "某企業" 같은 한자 표현
+    r"某.+",
+    # 단일 알파벳이나 단일 한글 (기업명으로는 너무 짧음)
+    r"[A-Za-zㄱ-ㅎ가-힣]",
+    # "Company A", "Firm B" 같은 영문 익명 패턴
+    r"(?:Company|Firm|Corp)\s+[A-Z]",
+]
+_FAKE_COMPANY_RE = re.compile("|".join(f"(?:{p})" for p in _FAKE_COMPANY_PATTERNS))
+
+# 중복 판정용 제목 정규화 (영문 소문자/숫자/한글만 남김)
+_TITLE_NOISE_RE = re.compile(r"[^0-9a-z가-힣]")
+
+
+def strip_html(text: str) -> str:
+    """HTML 태그 제거 후 엔티티 복원 (태그 사이에 끊긴 엔티티도 기존과 동일하게 복원)"""
+    if not text:
+        return ""
+    if "<" in text:
+        text = _TAG_RE.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return text
+
+
+def strip_html_batch(texts: List[str]) -> List[str]:
+    """strip_html 의 배치 버전: 구분자로 이어 붙여 페이지 전체를 치환 1회 + 복원 1회로 처리"""
+    if not texts:
+        return []
+    joined = _BATCH_SEP.join(t.replace(_BATCH_SEP, "") if t else "" for t in texts)
+    return strip_html(joined).split(_BATCH_SEP)
+
+
+def normalize_items(items: List[dict], fields: tuple = ("title", "description")) -> List[Dict[str, str]]:
+    """
+    원본 기사(네이버/RSS item) 한 페이지의 텍스트 필드를 한 번에 정규화.
+    반환: 기사별 {field: 정규화된 텍스트}
+    """
+    flat = [item.get(field, "") or "" for item in items for field in fields]
+    cleaned = strip_html_batch(flat)
+    width = len(fields)
+    return [
+        dict(zip(fields, cleaned[i * width:(i + 1) * width]))
+        for i in range(len(items))
+    ]
+
+
+def is_fake_company(name: str) -> bool:
+    return _FAKE_COMPANY_RE.fullmatch(name) is not None
+
+
+def filter_fake_companies(companies: List[str]) -> List[str]:
+    """
+    'A기업', 'B사', 'OO기업' 같은 익명/가짜 기업명을 필터링.
+    실제 상장 기업명이 아닌 익명 표현을 제거한다.
+    """
+    if not companies:
+        return []
+    filtered = []
+    for company in companies:
+        name = company.strip()
+        if name and not _FAKE_COMPANY_RE.fullmatch(name):
+            filtered.append(name)
+    return filtered
+
+
+def normalize_title(title: str) -> str:
+    """중복 판정용 제목 (태그/공백/문장부호 제거 + 소문자)"""
+    return _TITLE_NOISE_RE.sub("", strip_html(title).lower())
@@ -0,0 +1,322 @@
+"""
+요청 단위 추적 (opt-in span 트리)
+- X-Trace: 1 헤더를 보낸 요청(또는 TRACE_SAMPLE_RATE 비율로 표본 추출한 요청)만 추적
+- 요청 → 히트맵 재구성 → 섹터별 조회 → 단계(naver/ai_analysis/cache_read ...)를 span 트리로 기록
+  - 섹터 span: metrics.sector_scope 가 fetch_* 진입 시 생성 (cache=hit|miss 태그, 예외는 error 태그)
+  - 단계 span: metrics.stage 가 생성 (지표와 같은 구간)
+  - 캐시 조회 결과(l1_hits, l2_misses, stale_hits ...)는 현재 span 의 annotation 으로 남김
+- 현재 span 은 contextvars 로 전달 → asyncio.gather 하위 태스크 / asyncio.to_thread 로 자동 전파
+  (ThreadPoolExecutor 는 호출 측에서 contextvars.copy_context() 로 넘겨야 함)
+- 완료된 추적은 최근 TRACE_BUFFER_SIZE 개를 메모리에 보관: 응답 헤더 X-Trace-Id → GET /debug/traces/{id}
+- Zipkin v2 JSON 형식으로 조회 가능, ZIPKIN_ENDPOINT 를 지정하면 완료 시 수집기로 전송
+- 추적 중이 아니면 span 진입 비용은 ContextVar 조회 1회
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from starlette.datastructures import MutableHeaders
+
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))     # 0~1, 헤더 없이 추적할 요청 비율
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "100"))     # 보관할 완료 추적 수
+ZIPKIN_ENDPOINT   = os.getenv("ZIPKIN_ENDPOINT", "")                # 예: http://zipkin:9411/api/v2/spans
+SERVICE_NAME      = os.getenv("TRACE_SERVICE_NAME", "news-moa-api")
+TRACE_HEADER      = b"x-trace"                                    # ASGI 헤더 이름은 소문자 bytes
+TRACE_ID_HEADER   = "X-Trace-Id"
+# 표본 추출에서 제외할 경로 (지표 수집/추적 조회 자체는 추적하지 않음)
+UNSAMPLED_PATHS   = ("/metrics", "/debug/traces")
+ERROR_MESSAGE_LIMIT = 200
+
+_current: ContextVar[Optional["Span"]] = ContextVar("trace_span", default=None)
+
+_buffer_lock = threading.Lock()
+_buffer: "OrderedDict[str, Trace]" = OrderedDict()
+_export_tasks: set = set()
+_counters = {"traces": 0, "spans": 0, "exported": 0, "export_errors": 0}
+
+
+def _now_us() -> int:
+    return int(time.time() * 1_000_000)
+
+
+def _new_id(bits: int = 64) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Trace:
+    """요청 하나의 span 모음 (여러 스레드/태스크에서 동시에 추가)"""
+
+    def __init__(self, trace_id: str) -> None:
+        self.trace_id = trace_id
+        self.spans: List[Span] = []
+        self.root: Optional[Span] = None
+        self._lock = threading.Lock()
+
+    def add(self, span: "Span") -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def snapshot(self) -> List["Span"]:
+        with self._lock:
+            return list(self.spans)
+
+
+class Span:
+    __slots__ = ("trace", "span_id", "parent_id", "name", "kind", "start_us", "duration_us",
+                 "started", "tags", "annotations")
+
+    def __init__(self, trace: Trace, name: str, parent_id: Optional[str], tags: Dict[str, Any],
+                 kind: Optional[str] = None) -> None:
+        self.trace = trace
+        self.span_id = _new_id()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_us = _now_us()
+        self.started = time.perf_counter()
+        self.duration_us: Optional[int] = None
+        self.tags = {k: str(v) for k, v in tags.items() if v is not None}
+        self.annotations: List[tuple] = []
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.duration_us = max(1, int((time.perf_counter() - self.started) * 1_000_000))
+        if error is not None:
+            message = str(error).splitlines()[0] if str(error) else ""
+            self.tags["error"] = f"{type(error).__name__}: {message}"[:ERROR_MESSAGE_LIMIT]
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return round(self.duration_us / 1000, 3) if self.duration_us is not None else None
+
+    def to_zipkin(self) -> dict:
+        data = {
+            "traceId": self.trace.trace_id,
+            "id": self.span_id,
+            "name": self.name,
+            "timestamp": self.start_us,
+            "duration": self.duration_us if self.duration_us is not None else max(1, _now_us() - self.start_us),
+            "localEndpoint": {"serviceName": SERVICE_NAME},
+            "tags": dict(self.tags),
+        }
+        if self.parent_id:
+            data["parentId"] = self.parent_id
+        if self.kind:
+            data["kind"] = self.kind
+        if self.annotations:
+            data["annotations"] = [{"timestamp": ts, "value": value} for ts, value in self.annotations]
+        return data
+
+
+class span:
+    """
+    with span("name", key=value) as s: ... → 현재 span 의 자식 span 기록.
+    추적 중이 아니면 아무것도 하지 않고 s 는 None.
+    예외는 error 태그로 남기고 그대로 전파한다.
+    """
+
+    __slots__ = ("name", "tags", "_span", "_token")
+
+    def __init__(self, name: str, **tags: Any) -> None:
+        self.name = name
+        self.tags = tags
+        self._span: Optional[Span] = None
+
+    def __enter__(self) -> Optional[Span]:
+        parent = _current.get()
+        if parent is None:
+            return None
+        child = Span(parent.trace, self.name, parent.span_id, self.tags)
+        parent.trace.add(child)
+        self._span = child
+        self._token = _current.set(child)
+        return child
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._span is None:
+            return
+        self._span.finish(exc)
+        _current.reset(self._token)
+
+
+def active() -> bool:
+    return _current.get() is not None
+
+
+def tag(key: str, value: Any) -> None:
+    """현재 span 에 태그 추가 (추적 중이 아니면 무시)"""
+    current = _current.get()
+    if current is not None and value is not None:
+        current.tags[key] = str(value)
+
+
+def annotate(value: str) -> None:
+    """현재 span 에 시각이 찍힌 이벤트 추가 (추적 중이 아니면 무시)"""
+    current = _current.get()
+    if current is not None:
+        current.annotations.append((_now_us(), value))
+
+
+# ─── 추적 시작/종료 ───
+
+def _store(trace: Trace) -> None:
+    with _buffer_lock:
+        _buffer[trace.trace_id] = trace
+        while len(_buffer) > TRACE_BUFFER_SIZE:
+            _buffer.popitem(last=False)
+        _counters["traces"] += 1
+        _counters["spans"] += len(trace.spans)
+
+
+def get_trace(trace_id: str) -> Optional[Trace]:
+    with _buffer_lock:
+        return _buffer.get(trace_id)
+
+
+def to_zipkin(trace: Trace) -> List[dict]:
+    """Zipkin v2 JSON (POST /api/v2/spans 본문 형식)"""
+    return [s.to_zipkin() for s in trace.snapshot()]
+
+
+def to_tree(trace: Trace) -> Optional[dict]:
+    """부모-자식 중첩 구조 (자식은 시작 순)"""
+    spans = trace.snapshot()
+    children: Dict[Optional[str], List[Span]] = {}
+    for s in spans:
+        children.setdefault(s.parent_id, []).append(s)
+
+    def build(s: Span) -> dict:
+        node = {"name": s.name, "duration_ms": s.duration_ms, "tags": dict(s.tags)}
+        if s.annotations:
+            node["events"] = [value for _, value in s.annotations]
+        kids = sorted(children.get(s.span_id, []), key=lambda c: c.start_us)
+        if kids:
+            node["children"] = [build(c) for c in kids]
+        return node
+
+    return build(trace.root) if trace.root is not None else None
+
+
+def summarize(trace: Trace, slowest: int = 5) -> dict:
+    """추적 요약: 전체 시간, span 수, 오류 span, 가장 느린 섹터"""
+    spans = trace.snapshot()
+    sectors = [s for s in spans if "sector_id" in s.tags and s.duration_us is not None]
+    sectors.sort(key=lambda s: s.duration_us, reverse=True)
+    root = trace.root
+    return {
+        "trace_id": trace.trace_id,
+        "name": root.name if root else None,
+        "started_at": root.start_us // 1000 if root else None,   # epoch ms
+        "duration_ms": root.duration_ms if root else None,
+        "status": root.tags.get("http.status_code") if root else None,
+        "span_count": len(spans),
+        "errors": [{"name": s.name, "error": s.tags["error"]} for s in spans if "error" in s.tags],
+        "slowest_sectors": [
+            {
+                "sector_id": s.tags["sector_id"],
+                "duration_ms": s.duration_ms,
+                "cache": s.tags.get("cache"),
+                **({"error": s.tags["error"]} if "error" in s.tags else {}),
+            }
+            for s in sectors[:slowest]
+        ],
+    }
+
+
+def recent_traces(limit: int = 20) -> List[dict]:
+    with _buffer_lock:
+        traces = list(_buffer.values())[-limit:]
+    return [summarize(t) for t in reversed(traces)]
+
+
+def tracing_stats() -> dict:
+    with _buffer_lock:
+        buffered = len(_buffer)
+    return {
+        "sample_rate": TRACE_SAMPLE_RATE,
+        "buffer_size": TRACE_BUFFER_SIZE,
+        "buffered": buffered,
+        "zipkin_endpoint": ZIPKIN_ENDPOINT or None,
+        **_counters,
+    }
+
+
+async def _export(trace: Trace) -> None:
+    from .http_client import get_async_http_client   # 순환 import 방지
+    try:
+        response = await get_async_http_client().post(ZIPKIN_ENDPOINT, json=to_zipkin(trace), timeout=5)
+        response.raise_for_status()
+        _counters["exported"] += 1
+    except Exception as e:
+        _counters["export_errors"] += 1
+        print(f"[Tracing] Zipkin 전송 실패 ({trace.trace_id}): {e}")
+
+
+def _schedule_export(trace: Trace) -> None:
+    task = asyncio.get_running_loop().create_task(_export(trace))
+    _export_tasks.add(task)
+    task.add_done_callback(_export_tasks.discard)
+
+
+def _wants_trace(scope: dict) -> bool:
+    for name, value in scope.get("headers", ()):
+        if name == TRACE_HEADER:
+            return value.strip() in (b"1", b"true", b"on")
+    if TRACE_SAMPLE_RATE <= 0 or scope.get("path", "").startswith(UNSAMPLED_PATHS):
+        return False
+    return random.random() < TRACE_SAMPLE_RATE
+
+
+class TraceMiddleware:
+    """
+    ASGI 미들웨어: 추적 대상 요청에 루트 span 을 열고 응답 헤더에 X-Trace-Id 를 붙인다.
+    BaseHTTPMiddleware 를 쓰지 않아 추적하지 않는 요청에는 헤더 검사 외 비용이 없다.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not _wants_trace(scope):
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace(_new_id(128))
+        root = Span(trace, f"{scope['method']} {scope['path']}", None, {
+            "http.method": scope["method"],
+            "http.path": scope["path"],
+            "http.query": scope.get("query_string", b"").decode("latin-1") or None,
+        }, kind="SERVER")
+        trace.root = root
+        trace.add(root)
+
+        async def send_with_trace_id(message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(TRACE_ID_HEADER, trace.trace_id)
+                root.tags["http.status_code"] = str(message["status"])
+            await send(message)
+            # 루트 span 은 응답 완료 시각에 닫는다 (이후 BackgroundTasks 의 span 은 같은 추적에 계속 추가됨)
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                root.finish()
+                _store(trace)
+
+        token = _current.set(root)
+        try:
+            await self.app(scope, receive, send_with_trace_id)
+        except BaseException as e:
+            if root.duration_us is None:
+                root.finish(e)
+            raise
+        finally:
+            _current.reset(token)
+            if root.duration_us is None:
+                root.finish()
+            if get_trace(trace.trace_id) is None:
+                _store(trace)
+            if ZIPKIN_ENDPOINT:
+                _schedule_export(trace)
@@ -0,0 +1,74 @@
+"""
+커서 페이지 백필 회귀 테스트: AI 가 기사를 걸러내 저장소가 업스트림 위치보다 적게 차 있어도
+다음 업스트림 위치를 이어 받아 한 페이지를 채우고, 같은 구간을 다시 받지 않는지 확인.
+업스트림은 bench/stubs.py 의 로컬 스텁 (네트워크/자격 증명 불필요).
+
+    python -m pytest backend/tests
+"""
+
+import importlib
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from backend.bench.stubs import StubServer
+
+SECTOR_ID = "IT_1"
+
+
+@pytest.fixture(scope="module")
+def collector():
+    stubs = StubServer().start()
+    # 업스트림 주소/키는 import 시점에 읽히므로 백엔드 모듈보다 먼저 설정
+    os.environ.update(stubs.env())
+    os.environ.update({
+        "NAVER_CLIENT_ID": "test",
+        "NAVER_CLIENT_SECRET": "test",
+        "REFRESH_SCHEDULER_ENABLED": "0",
+        "CACHE_GC_ENABLED": "0",
+        "NO_PROXY": "127.0.0.1,localhost",
+    })
+    os.environ.pop("OPENAI_API_KEY", None)
+    cache_manager = importlib.import_module("backend.services.cache_manager")
+    news_collector = importlib.import_module("backend.services.news_collector")
+
+    cache_dir = tempfile.mkdtemp(prefix="news_moa_test_")
+    previous_dir, cache_manager.CACHE_DIR = cache_manager.CACHE_DIR, cache_dir
+    yield news_collector, stubs
+    cache_manager.CACHE_DIR = previous_dir
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    stubs.stop()
+
+
+@pytest.fixture
+def filtered(collector, monkeypatch):
+    """AI 가 받은 기사의 절반을 섹터 부적합으로 거르는 상황"""
+    news_collector, stubs = collector
+    merge = news_collector._merge_ai_results
+    monkeypatch.setattr(news_collector, "_merge_ai_results", lambda *args: merge(*args)[::2])
+    return news_collector, stubs
+
+
+def _links(result):
+    return [a.link for a in result.articles]
+
+
+def test_cursor_page_fills_despite_filtered_articles(filtered):
+    news_collector, stubs = filtered
+    first = news_collector.fetch_sector_news(SECTOR_ID, 10, force_refresh=True)
+    assert 0 < len(first.articles) < 10
+    assert first.next_cursor
+
+    calls = stubs.counts()["naver"]["calls"]
+    second = news_collector.fetch_sector_news_by_cursor(SECTOR_ID, first.next_cursor, 10)
+    assert len(second.articles) == 10
+    assert second.next_cursor
+    assert stubs.counts()["naver"]["calls"] > calls
+    assert not set(_links(first)) & set(_links(second))
+
+    # 다음 커서는 이미 받은 위치를 건너뛰고 새 구간을 받아야 함
+    third = news_collector.fetch_sector_news_by_cursor(SECTOR_ID, second.next_cursor, 10)
+    assert len(third.articles) == 10
+    assert not set(_links(second)) & set(_links(third))
@@ -0,0 +1,31 @@
+"""
+LLM 제한기 회귀 테스트: 슬롯을 기다리다 취소된 요청이 대기 수(waiting)에 남지 않는지 확인.
+
+    python -m pytest backend/tests
+"""
+
+import asyncio
+
+from backend.services.llm_client import LLMLimiter
+
+
+def test_cancelled_waiter_is_not_counted():
+    limiter = LLMLimiter(max_concurrency=1, requests_per_minute=600)
+
+    async def scenario():
+        async with limiter.slot_async("analysis"):
+            waiter = asyncio.create_task(asyncio.wait_for(_hold(limiter), timeout=0.1))
+            await asyncio.sleep(0.05)
+            assert limiter.stats()["by_purpose"]["analysis"]["waiting"] == 1
+            try:
+                await waiter
+            except asyncio.TimeoutError:
+                pass
+
+    asyncio.run(scenario())
+    assert limiter.stats()["by_purpose"]["analysis"]["waiting"] == 0
+
+
+async def _hold(limiter: LLMLimiter) -> None:
+    async with limiter.slot_async("analysis"):
+        pass
@@ -0,0 +1,79 @@
+"""
+증분 갱신 재시도 회귀 테스트: GPT 분석이 실패한 기사는 윈도우에 기본값으로 남지 않고,
+처리 완료/커서에도 반영되지 않아 다음 갱신 때 다시 분석되는지 확인 (네트워크/자격 증명 불필요).
+
+    python -m pytest backend/tests
+"""
+
+import importlib
+import json
+import shutil
+import tempfile
+from email.utils import formatdate
+from types import SimpleNamespace
+
+import pytest
+
+SECTOR_ID = "IT_1"
+
+
+def _raw(n: int, ts: float) -> dict:
+    return {
+        "title": f"반도체 기사 {n}",
+        "description": f"설명 {n}",
+        "link": f"https://n.news.naver.com/{n}",
+        "originallink": f"https://example.com/{n}",
+        "pubDate": formatdate(ts),
+    }
+
+
+def _response(count: int) -> SimpleNamespace:
+    results = [{"is_relevant": True, "companies": [], "reason": "적합", "summary": "요약"}] * count
+    message = SimpleNamespace(content=json.dumps({"results": results}))
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    cache_manager = importlib.import_module("backend.services.cache_manager")
+    news_collector = importlib.import_module("backend.services.news_collector")
+    sector_window = importlib.import_module("backend.services.sector_window")
+
+    cache_dir = tempfile.mkdtemp(prefix="news_moa_test_")
+    monkeypatch.setattr(cache_manager, "CACHE_DIR", cache_dir)
+    sector_window.clear_windows()
+    monkeypatch.setattr(news_collector, "llm_enabled", lambda: True)
+    monkeypatch.setattr(news_collector, "_generate_sector_briefing", lambda *args, **kwargs: None)
+    yield news_collector
+    sector_window.clear_windows()
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def test_failed_analyses_are_retried_next_refresh(collector, monkeypatch):
+    news_collector = collector
+    meta = news_collector.SECTOR_META[SECTOR_ID]
+    analyzed = [_raw(1, 1_700_000_000)]
+    failed = [_raw(2, 1_700_000_100), _raw(3, 1_700_000_200)]
+
+    # 첫 갱신: 기사 1 만 분석 성공 (GPT 응답에서 2, 3 누락)
+    monkeypatch.setattr(news_collector, "chat_completion", lambda *args, **kwargs: _response(1))
+    first = news_collector._build_sector_result_incremental(
+        SECTOR_ID, meta, analyzed + failed, 3, 10, "KR"
+    )
+    assert [a.original_link for a in first.articles] == ["https://example.com/1"]
+
+    # 다음 갱신: 실패했던 기사만 다시 분석 대상이 됨
+    prompts = []
+
+    def answer(purpose, **request):
+        prompts.append(request["messages"][-1]["content"])
+        return _response(2)
+
+    monkeypatch.setattr(news_collector, "chat_completion", answer)
+    second = news_collector._build_sector_result_incremental(
+        SECTOR_ID, meta, analyzed + failed, 3, 10, "KR"
+    )
+    assert len(prompts) == 1
+    assert "반도체 기사 2" in prompts[0] and "반도체 기사 3" in prompts[0]
+    assert "반도체 기사 1" not in prompts[0]
+    assert {a.original_link for a in second.articles} == {f"https://example.com/{n}" for n in (1, 2, 3)}